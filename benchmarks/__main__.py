@@ -0,0 +1,100 @@
+"""
+Run the benchmark suite.
+
+Examples::
+
+    # run everything
+    python -m benchmarks
+
+    # run only some groups and store the results of a release
+    python -m benchmarks execution collection --save benchmarks/results/0.6.0.json
+
+    # fail if anything got more than 15% slower than the stored results
+    python -m benchmarks --compare benchmarks/results/0.6.0.json --threshold 0.15
+"""
+
+import argparse
+import datetime
+import importlib
+import json
+import pkgutil
+import platform
+import sys
+from typing import Optional
+
+import gloe
+import benchmarks
+from benchmarks._utils import format_time, registered_benchmarks, run_benchmark
+
+
+def _load_benchmarks():
+    for module in pkgutil.iter_modules(benchmarks.__path__):
+        if module.name.startswith("bench_"):
+            importlib.import_module(f"benchmarks.{module.name}")
+
+
+def _load_baseline(path: Optional[str]) -> dict[str, float]:
+    if path is None:
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["results"]
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "groups", nargs="*", help="only run benchmarks starting with these prefixes"
+    )
+    parser.add_argument("--save", help="store the results in this JSON file")
+    parser.add_argument("--compare", help="JSON file with the results to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="relative slowdown considered a regression (default: 0.15)",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    _load_benchmarks()
+    baseline = _load_baseline(args.compare)
+
+    results: dict[str, float] = {}
+    regressions: list[str] = []
+    for bench in registered_benchmarks():
+        if args.groups and not any(bench.name.startswith(g) for g in args.groups):
+            continue
+
+        seconds = run_benchmark(bench, args.repeat)
+        results[bench.name] = seconds
+
+        line = f"{bench.name:<40} {format_time(seconds):>12}"
+        if bench.name in baseline:
+            change = seconds / baseline[bench.name] - 1
+            line += f" {format_time(baseline[bench.name]):>12} {change:+8.1%}"
+            if change > args.threshold:
+                regressions.append(bench.name)
+                line += "  REGRESSION"
+        print(line, flush=True)
+
+    if args.save is not None:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "gloe_version": gloe.__version__,
+                    "python_version": platform.python_version(),
+                    "created_at": datetime.datetime.now().isoformat(),
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+
+    if len(regressions) > 0:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+import time
+from typing import Any
+
+from gloe import async_transformer, transformer, Transformer, AsyncTransformer
+
+
+@transformer
+def increment(num: int) -> int:
+    return num + 1
+
+
+@transformer
+def is_even(num: int) -> bool:
+    return num % 2 == 0
+
+
+@transformer
+def identity(data: Any) -> Any:
+    return data
+
+
+@async_transformer
+async def async_increment(num: int) -> int:
+    return num + 1
+
+
+def blocking(milliseconds: int) -> Transformer[int, int]:
+    """Transformer blocking the thread for some milliseconds, like a sync I/O call"""
+
+    @transformer
+    def wait(data: int) -> int:
+        time.sleep(milliseconds / 1000)
+        return data
+
+    return wait
+
+
+def chain(size: int) -> Transformer[int, int]:
+    pipeline = increment
+    for _ in range(size - 1):
+        pipeline = pipeline >> increment
+    return pipeline
+
+
+def async_chain(size: int) -> AsyncTransformer[int, int]:
+    pipeline = async_increment
+    for _ in range(size - 1):
+        pipeline = pipeline >> async_increment
+    return pipeline
@@ -0,0 +1,84 @@
+import asyncio
+import time
+import timeit
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Union
+
+Setup = Callable[[], Union[Callable[[], Any], Callable[[], Awaitable[Any]]]]
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Setup
+    number: int
+    per: int
+    is_async: bool
+
+
+_registry: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, number: int = 1_000, per: int = 1, is_async: bool = False):
+    """
+    Register a benchmark. The decorated function prepares the scenario and returns
+    the callable to be measured (an async callable when ``is_async`` is true).
+
+    Args:
+        name: unique name, prefixed by the benchmark group, like ``execution.sync``.
+        number: how many times the callable is called per repetition.
+        per: the measured time is divided by it, to report the time per node or
+            per item instead of the time per call.
+        is_async: if the returned callable is a coroutine function.
+    """
+
+    def register(setup: Setup) -> Setup:
+        _registry[name] = Benchmark(name, setup, number, per, is_async)
+        return setup
+
+    return register
+
+
+def registered_benchmarks() -> list[Benchmark]:
+    return list(_registry.values())
+
+
+def measure(func: Callable[[], Any], number: int = 10_000, repeat: int = 5) -> float:
+    """Best time, in seconds, of a single call of ``func``"""
+    timings = timeit.repeat(func, number=number, repeat=repeat)
+    return min(timings) / number
+
+
+def measure_async(
+    func: Callable[[], Awaitable[Any]], number: int = 1_000, repeat: int = 5
+) -> float:
+    """Best time, in seconds, of a single await of ``func()`` in a running loop"""
+
+    async def run_repetitions() -> list[float]:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                await func()
+            timings.append(time.perf_counter() - start)
+        return timings
+
+    return min(asyncio.run(run_repetitions())) / number
+
+
+def run_benchmark(bench: Benchmark, repeat: int = 5) -> float:
+    """Best time, in seconds, per call of the benchmark divided by ``bench.per``"""
+    func = bench.setup()
+    if bench.is_async:
+        best = measure_async(func, bench.number, repeat)  # type: ignore[arg-type]
+    else:
+        best = measure(func, bench.number, repeat)
+    return best / bench.per
+
+
+def format_time(seconds: float) -> str:
+    if seconds < 1e-6:
+        return f"{seconds * 1e9:.1f} ns"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.2f} us"
+    return f"{seconds * 1e3:.2f} ms"
@@ -0,0 +1,55 @@
+from gloe import If, transformer
+from gloe.collection import Filter, Map, MapAsync, Partition
+from benchmarks._pipelines import async_increment, increment, is_even
+from benchmarks._utils import benchmark
+
+ITEMS = 10_000
+
+
+@benchmark("collection.map_per_item", number=10, per=ITEMS)
+def map_items():
+    pipeline = Map(increment)
+    data = list(range(ITEMS))
+    return lambda: pipeline(data)
+
+
+@benchmark("collection.filter_per_item", number=10, per=ITEMS)
+def filter_items():
+    pipeline = Filter(is_even)
+    data = list(range(ITEMS))
+    return lambda: pipeline(data)
+
+
+@benchmark("collection.map_chain_per_item", number=10, per=ITEMS)
+def map_chain_items():
+    pipeline = Map(increment) >> Map(increment) >> Filter(is_even) >> Map(increment)
+    data = list(range(ITEMS))
+    return lambda: pipeline(data)
+
+
+@benchmark("collection.map_async_per_item", number=5, per=ITEMS, is_async=True)
+def map_async_items():
+    pipeline = MapAsync(async_increment)
+    data = list(range(ITEMS))
+    return lambda: pipeline(data)
+
+
+@transformer
+def increment_all(nums: list[int]) -> list[int]:
+    return [num + 1 for num in nums]
+
+
+@benchmark("collection.map_conditional_per_item", number=10, per=ITEMS)
+def map_conditional_items():
+    pipeline = Map(If(lambda num: num % 3 == 0).Then(increment).Else(increment))
+    data = list(range(ITEMS))
+    return lambda: pipeline(data)
+
+
+@benchmark("collection.partition_per_item", number=10, per=ITEMS)
+def partition_items():
+    pipeline = (
+        Partition(lambda num: num % 3 == 0).Then(increment_all).Else(increment_all)
+    )
+    data = list(range(ITEMS))
+    return lambda: pipeline(data)
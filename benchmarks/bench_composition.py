@@ -0,0 +1,28 @@
+from gloe.base_transformer import BaseTransformer
+from benchmarks._pipelines import chain, increment
+from benchmarks._utils import benchmark
+
+CHAIN_SIZE = 50
+
+
+@benchmark("composition.rshift_chain", number=20, per=CHAIN_SIZE)
+def rshift_chain():
+    return lambda: chain(CHAIN_SIZE)
+
+
+@benchmark("composition.rshift_pair", number=1_000)
+def rshift_pair():
+    return lambda: increment >> increment
+
+
+@benchmark("composition.copy_chain", number=200)
+def copy_chain():
+    pipeline = chain(CHAIN_SIZE)
+    return lambda: pipeline.copy(regenerate_instance_id=True)
+
+
+@benchmark("composition.graph_chain", number=50)
+def graph_chain():
+    pipeline = chain(CHAIN_SIZE)
+    build_graph = BaseTransformer.graph.__wrapped__  # type: ignore[attr-defined]
+    return lambda: build_graph(pipeline)
@@ -0,0 +1,59 @@
+from gloe import If, Switch
+from benchmarks._pipelines import async_increment, increment
+from benchmarks._utils import benchmark
+
+BRANCHES = 20
+
+
+def _equals(value: int):
+    return lambda num: num == value
+
+
+def _routing(then_transformer, else_transformer, mutually_exclusive=False):
+    if_then = If(_equals(0)).Then(then_transformer)
+    for value in range(1, BRANCHES):
+        if_then = if_then.ElseIf(_equals(value)).Then(then_transformer)
+    return if_then.Else(else_transformer, mutually_exclusive=mutually_exclusive)
+
+
+def _switch(then_transformer, else_transformer):
+    switch = Switch(lambda num: num).Case(0, then_transformer)
+    for value in range(1, BRANCHES):
+        switch = switch.Case(value, then_transformer)
+    return switch.Default(else_transformer)
+
+
+@benchmark("conditional.first_branch", number=5_000)
+def first_branch():
+    pipeline = _routing(increment, increment)
+    return lambda: pipeline(0)
+
+
+@benchmark("conditional.last_branch", number=5_000)
+def last_branch():
+    pipeline = _routing(increment, increment)
+    return lambda: pipeline(BRANCHES - 1)
+
+
+@benchmark("conditional.adaptive_last_branch", number=5_000)
+def adaptive_last_branch():
+    pipeline = _routing(increment, increment, mutually_exclusive=True)
+    return lambda: pipeline(BRANCHES - 1)
+
+
+@benchmark("conditional.else_branch", number=5_000)
+def else_branch():
+    pipeline = _routing(increment, increment)
+    return lambda: pipeline(BRANCHES)
+
+
+@benchmark("conditional.async_last_branch", number=2_000, is_async=True)
+def async_last_branch():
+    pipeline = _routing(async_increment, async_increment)
+    return lambda: pipeline(BRANCHES - 1)
+
+
+@benchmark("conditional.switch_last_case", number=5_000)
+def switch_last_case():
+    pipeline = _switch(increment, increment)
+    return lambda: pipeline(BRANCHES - 1)
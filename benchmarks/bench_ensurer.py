@@ -0,0 +1,58 @@
+from gloe import ensure, transformer
+from benchmarks._utils import benchmark
+
+
+def is_int(num: int):
+    if not isinstance(num, int):
+        raise TypeError()
+
+
+def increased(before: int, after: int):
+    if after <= before:
+        raise ValueError()
+
+
+def _plain(num: int) -> int:
+    return num + 1
+
+
+@benchmark("ensurer.plain", number=20_000)
+def plain():
+    pipeline = transformer(_plain)
+    return lambda: pipeline(0)
+
+
+@benchmark("ensurer.incoming", number=20_000)
+def incoming():
+    pipeline = ensure(incoming=[is_int])(transformer(_plain))
+    return lambda: pipeline(0)
+
+
+@benchmark("ensurer.outcome_and_changes", number=20_000)
+def outcome_and_changes():
+    pipeline = ensure(outcome=[is_int], changes=[increased])(transformer(_plain))
+    return lambda: pipeline(0)
+
+
+@benchmark("ensurer.multi_stage", number=10_000)
+def multi_stage():
+    pipeline = ensure(incoming=[is_int], changes=[increased])(
+        transformer(_plain) >> transformer(_plain)
+    )
+    return lambda: pipeline(0)
+
+
+@benchmark("ensurer.multi_stage_sampled", number=10_000)
+def multi_stage_sampled():
+    pipeline = ensure(incoming=[is_int], changes=[increased], sample_every=100)(
+        transformer(_plain) >> transformer(_plain)
+    )
+    return lambda: pipeline(0)
+
+
+@benchmark("ensurer.multi_stage_disabled", number=10_000)
+def multi_stage_disabled():
+    pipeline = ensure(incoming=[is_int], changes=[increased], enabled=False)(
+        transformer(_plain) >> transformer(_plain)
+    )
+    return lambda: pipeline(0)
@@ -0,0 +1,107 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from gloe.async_transformer import _execute_async_flow
+from gloe.executors import with_executor
+from gloe.transformers import _execute_flow
+from benchmarks._pipelines import async_chain, async_increment, blocking, chain
+from benchmarks._utils import benchmark
+
+CHAIN_SIZE = 20
+CONCURRENT_CALLS = 8
+
+
+@benchmark("execution.sync_flow_per_node", number=5_000, per=CHAIN_SIZE)
+def sync_flow():
+    flow = chain(CHAIN_SIZE)._flow
+    return lambda: _execute_flow(flow, 0)
+
+
+@benchmark("execution.sync_call_per_node", number=5_000, per=CHAIN_SIZE)
+def sync_call():
+    pipeline = chain(CHAIN_SIZE)
+    return lambda: pipeline(0)
+
+
+@benchmark("execution.async_flow_per_node", number=2_000, per=CHAIN_SIZE, is_async=True)
+def async_flow():
+    flow = async_chain(CHAIN_SIZE)._flow
+    return lambda: _execute_async_flow(flow, 0)
+
+
+@benchmark("execution.async_call_per_node", number=2_000, per=CHAIN_SIZE, is_async=True)
+def async_call():
+    pipeline = async_chain(CHAIN_SIZE)
+    return lambda: pipeline(0)
+
+
+@benchmark("execution.mixed_call_per_node", number=2_000, per=CHAIN_SIZE, is_async=True)
+def mixed_call():
+    pipeline = async_chain(1) >> chain(CHAIN_SIZE - 1)
+    return lambda: pipeline(0)
+
+
+@benchmark("execution.mixed_flow_per_node", number=2_000, per=CHAIN_SIZE, is_async=True)
+def mixed_flow():
+    flow = (async_chain(1) >> chain(CHAIN_SIZE - 1))._flow
+    return lambda: _execute_async_flow(flow, 0)
+
+
+@benchmark("execution.blocking_stage_concurrent", number=10, is_async=True)
+def blocking_stage_concurrent():
+    pipeline = async_increment >> blocking(2) >> async_increment
+
+    async def run():
+        await asyncio.gather(*[pipeline(n) for n in range(CONCURRENT_CALLS)])
+
+    return run
+
+
+@benchmark("execution.blocking_stage_offloaded", number=10, is_async=True)
+def blocking_stage_offloaded():
+    pipeline = with_executor(
+        async_increment >> blocking(2) >> async_increment,
+        ThreadPoolExecutor(max_workers=4),
+        offload="thread",
+    )
+
+    async def run():
+        await asyncio.gather(*[pipeline(n) for n in range(CONCURRENT_CALLS)])
+
+    return run
+
+
+@benchmark("execution.offloaded_sync_run", number=500, is_async=True)
+def offloaded_sync_run():
+    pipeline = with_executor(
+        async_increment >> chain(3) >> async_increment,
+        ThreadPoolExecutor(max_workers=4),
+        offload="thread",
+    )
+    return lambda: pipeline(0)
+
+
+@benchmark("execution.asyncio_run_call", number=500)
+def asyncio_run_call():
+    pipeline = async_chain(3)
+    return lambda: asyncio.run(pipeline(0))
+
+
+@benchmark("execution.run_sync_call", number=2_000)
+def run_sync_call():
+    pipeline = async_chain(3)
+    return lambda: pipeline.run_sync(0)
+
+
+@benchmark("execution.run_sync_many_per_item", number=50, per=100)
+def run_sync_many():
+    pipeline = async_chain(3)
+    data = list(range(100))
+    return lambda: pipeline.run_sync_many(data)
+
+
+@benchmark("execution.run_sync_many_eager_per_item", number=50, per=100)
+def run_sync_many_eager():
+    pipeline = async_chain(3)
+    data = list(range(100))
+    return lambda: pipeline.run_sync_many(data, eager=True)
@@ -0,0 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from gloe.executors import with_executor
+from gloe.gateways import parallel, sequential
+from gloe.utils import attach
+from benchmarks._pipelines import async_increment, blocking, increment
+from benchmarks._utils import benchmark
+
+BRANCHES = 7
+# milliseconds waited by each branch of the blocking fan-outs
+BLOCKING_BRANCHES = (1, 4, 1, 2, 1, 3, 2)
+
+
+@benchmark("gateways.parallel", number=5_000)
+def parallel_gateway():
+    pipeline = parallel(*[increment for _ in range(BRANCHES)])
+    return lambda: pipeline(0)
+
+
+@benchmark("gateways.sequential", number=5_000)
+def sequential_gateway():
+    pipeline = sequential(*[increment for _ in range(BRANCHES)])
+    return lambda: pipeline(0)
+
+
+@benchmark("gateways.diverging", number=5_000)
+def diverging():
+    pipeline = increment >> (
+        increment,
+        increment,
+        increment,
+        increment,
+        increment,
+        increment,
+        increment,
+    )
+    return lambda: pipeline(0)
+
+
+@benchmark("gateways.parallel_async", number=2_000, is_async=True)
+def parallel_async_gateway():
+    pipeline = parallel(*[async_increment for _ in range(BRANCHES)])
+    return lambda: pipeline(0)
+
+
+@benchmark("gateways.parallel_async_executor", number=2_000, is_async=True)
+def parallel_async_executor():
+    pipeline = with_executor(
+        parallel(*[async_increment for _ in range(BRANCHES)]),
+        ThreadPoolExecutor(max_workers=4),
+    )
+    return lambda: pipeline(0)
+
+
+@benchmark("gateways.parallel_async_eager", number=2_000, is_async=True)
+def parallel_async_eager():
+    pipeline = with_executor(
+        parallel(*[async_increment for _ in range(BRANCHES)]),
+        ThreadPoolExecutor(max_workers=4),
+        eager=True,
+    )
+    return lambda: pipeline(0)
+
+
+@benchmark("gateways.attach", number=5_000)
+def attach_gateway():
+    pipeline = increment >> attach(increment)
+    return lambda: pipeline(0)
+
+
+@benchmark("gateways.blocking_fan_out", number=20)
+def blocking_fan_out():
+    pipeline = parallel(*[blocking(ms) for ms in BLOCKING_BRANCHES])
+    return lambda: pipeline(0)
+
+
+@benchmark("gateways.blocking_fan_out_executor", number=20)
+def blocking_fan_out_executor():
+    pipeline = with_executor(
+        parallel(*[blocking(ms) for ms in BLOCKING_BRANCHES]),
+        ThreadPoolExecutor(max_workers=4),
+    )
+    return lambda: pipeline(0)
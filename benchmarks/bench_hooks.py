@@ -0,0 +1,43 @@
+"""
+Overhead of the hooks dispatching on the execution flow. ``hooks.disabled`` must
+be indistinguishable from ``hooks.reference``, which is the execution loop without
+any hooks support.
+"""
+
+from typing import Any
+
+from gloe.base_transformer import Flow
+from gloe.hooks import TransformerHook, with_hooks
+from gloe.transformers import Transformer, _execute_flow
+from benchmarks._pipelines import chain
+from benchmarks._utils import benchmark
+
+CHAIN_SIZE = 20
+
+
+def _reference_execute_flow(flow: Flow, arg: Any) -> Any:
+    result = arg
+    for op in flow:
+        if isinstance(op, Transformer):
+            result = op._safe_transform(result)
+        else:
+            raise NotImplementedError()
+    return result
+
+
+@benchmark("hooks.reference", number=5_000, per=CHAIN_SIZE)
+def reference():
+    flow = chain(CHAIN_SIZE)._flow
+    return lambda: _reference_execute_flow(flow, 0)
+
+
+@benchmark("hooks.disabled", number=5_000, per=CHAIN_SIZE)
+def disabled():
+    flow = chain(CHAIN_SIZE)._flow
+    return lambda: _execute_flow(flow, 0)
+
+
+@benchmark("hooks.one_noop_hook", number=5_000, per=CHAIN_SIZE)
+def one_noop_hook():
+    pipeline = with_hooks(chain(CHAIN_SIZE), TransformerHook())
+    return lambda: pipeline(0)
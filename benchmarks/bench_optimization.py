@@ -0,0 +1,37 @@
+from gloe.collection import Filter, Map
+from gloe.optimization import optimize
+from gloe.utils import attach
+from benchmarks._pipelines import increment, is_even
+from benchmarks._utils import benchmark
+
+ITEMS = 10_000
+
+
+@benchmark("optimization.fused_map_chain_per_item", number=10, per=ITEMS)
+def fused_map_chain_items():
+    pipeline = optimize(
+        Map(increment) >> Map(increment) >> Filter(is_even) >> Map(increment)
+    )
+    data = list(range(ITEMS))
+    return lambda: pipeline(data)
+
+
+@benchmark("optimization.attach", number=5_000)
+def attach_without_identities():
+    pipeline = optimize(increment >> attach(increment))
+    return lambda: pipeline(0)
+
+
+@benchmark("optimization.shared_prefix", number=5_000)
+def shared_prefix():
+    parse = increment >> increment >> increment
+    pipeline = increment >> (parse >> increment, parse >> increment, parse)
+    optimized = optimize(pipeline)
+    return lambda: optimized(0)
+
+
+@benchmark("optimization.unshared_prefix", number=5_000)
+def unshared_prefix():
+    parse = increment >> increment >> increment
+    pipeline = increment >> (parse >> increment, parse >> increment, parse)
+    return lambda: pipeline(0)
@@ -5,7 +5,7 @@ from gloe.functional import (
     partial_async_transformer,
     async_transformer,
 )
-from gloe.conditional import If, condition
+from gloe.conditional import If, Switch, condition
 from gloe.ensurer import ensure
 from gloe.exceptions import UnsupportedTransformerArgException
 from gloe.transformers import Transformer
@@ -21,6 +21,7 @@ __all__ = [
     "partial_async_transformer",
     "async_transformer",
     "If",
+    "Switch",
     "condition",
     "ensure",
     "UnsupportedTransformerArgException",
@@ -0,0 +1,55 @@
+from contextvars import Context, ContextVar, copy_context
+from typing import Any, NamedTuple, Optional
+
+from gloe._hooks import _Flag
+
+
+class _EnsuredCall(NamedTuple):
+    input_data: Any
+    validating: bool
+    previous: Optional["_EnsuredCall"]
+
+
+_NO_CALL = _EnsuredCall(None, True, None)
+
+
+def _calls_var() -> ContextVar[_EnsuredCall]:
+    """
+    On pipelines, the incoming data is received by the first node but validated by
+    the last one. Each ensured pipeline keeps the calls in progress in its own
+    context variable, so concurrent executions on other threads or tasks never see
+    each other's data.
+    """
+    return ContextVar("gloe_ensured_call", default=_NO_CALL)
+
+
+def _enter(calls: ContextVar[_EnsuredCall], data: Any, validating: bool):
+    calls.set(_EnsuredCall(data, validating, calls.get()))
+
+
+def _leave(calls: ContextVar[_EnsuredCall]) -> _EnsuredCall:
+    """
+    Restores the call that was in progress before the current one, so an ensured
+    pipeline executed inside itself gets its own data back.
+    """
+    call = calls.get()
+    calls.set(call.previous or _NO_CALL)
+    return call
+
+
+def _restore_calls(snapshot: Context):
+    """
+    Bring the calls of every ensured pipeline back to the given snapshot of the
+    context. A flow failing between the first and the last node of an ensured
+    pipeline never reaches the node leaving the call, so the flow restores them.
+    """
+    for var, call in copy_context().items():
+        if isinstance(call, _EnsuredCall):
+            previous = snapshot.get(var, _NO_CALL)
+            if previous is not call:
+                var.set(previous)
+
+
+# enabled once some pipeline keeping a call between its first and last nodes is
+# ensured, so the failing flows restore the calls
+_ensured_calls = _Flag()
@@ -0,0 +1,39 @@
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from gloe._hooks import _Flag
+
+
+class ExecutionContext:
+    """
+    Values shared by the transformers of a single pipeline invocation.
+
+    A new context is created when a pipeline is called outside any other pipeline
+    and it is released as soon as that call returns. The nested pipelines, the
+    branches of the gateways and the stages offloaded with
+    :func:`contextvars.copy_context` share the context of the invocation that
+    started them.
+    """
+
+    __slots__ = ("values", "_closers")
+
+    def __init__(self):
+        self.values: dict[Any, Any] = {}
+        self._closers: list[Callable[[], Any]] = []
+
+    def on_close(self, callback: Callable[[], Any]):
+        """Call :code:`callback` once the invocation has finished"""
+        self._closers.append(callback)
+
+    def _close(self):
+        for callback in self._closers:
+            callback()
+
+
+_current_execution: ContextVar[Optional[ExecutionContext]] = ContextVar(
+    "gloe_current_execution", default=None
+)
+
+
+# enabled once some feature depending on the context, like the bridges, is used
+_executions = _Flag()
@@ -0,0 +1,339 @@
+import asyncio
+import math
+import time
+from concurrent.futures import Executor, Future
+from contextvars import Context, ContextVar, copy_context
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Generator,
+    Hashable,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from gloe._hooks import _Flag
+
+OffloadPolicy = Literal["thread", "auto"]
+
+_SMOOTHING = 0.2
+
+
+def _smoothed(estimate: float, duration: float) -> float:
+    if estimate == math.inf:
+        return duration
+    return estimate + _SMOOTHING * (duration - estimate)
+
+
+class _ExecutorScope(NamedTuple):
+    executor: Executor
+    inline_below: float
+    offload: Optional[OffloadPolicy]
+    stage_costs: dict[Hashable, float]
+    eager: bool = False
+
+    def offloads(self, stage: Hashable) -> bool:
+        """
+        Tells whether a sync stage of an async flow must be executed in the executor.
+        On automatic offloading, stages never measured are offloaded.
+        """
+        if self.offload == "thread":
+            return True
+        return self.stage_costs.get(stage, math.inf) >= self.inline_below
+
+    def timed(self, stage: Hashable, func: Callable[[Any], Any], data: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return func(data)
+        finally:
+            duration = time.perf_counter() - start
+            costs = self.stage_costs
+            costs[stage] = _smoothed(costs.get(stage, math.inf), duration)
+
+
+_current_scope: ContextVar[Optional[_ExecutorScope]] = ContextVar(
+    "gloe_executor_scope", default=None
+)
+
+
+def _detached(func: Callable[..., Any], *args: Any) -> Any:
+    # the gateways inside a submitted branch run inline, so a branch never waits for
+    # other branches queued in the same executor
+    _current_scope.set(None)
+    return func(*args)
+
+
+def _submit(executor: Executor, func: Callable[..., Any], *args: Any) -> Future:
+    """
+    Execute the function in the executor, inside a copy of the current context, so
+    the context variables, like the execution context of the pipeline, go along.
+    """
+    return executor.submit(copy_context().run, _detached, func, *args)
+
+
+_MISSING = object()
+
+
+def _propagate(context: Context):
+    """
+    Bring back to the current context the variables changed by a call executed in
+    the given copy of it, like the state of the ensured pipelines entered there.
+    """
+    for var, value in context.items():
+        if var is not _current_scope and var.get(_MISSING) is not value:
+            var.set(value)
+
+
+async def _offload(executor: Optional[Executor], func: Callable[..., Any], *args):
+    """
+    Execute a blocking call in the executor, or in the default executor of the event
+    loop, without blocking the loop. The call sees and changes the context variables
+    as if it was executed inline.
+    """
+    context = copy_context()
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor, context.run, _detached, func, *args)
+    finally:
+        _propagate(context)
+
+
+# enabled once some pipeline is built with an offload policy, so the async flows
+# look for an executor scope offloading their sync stages
+_offloads = _Flag()
+
+
+def _discard(future: "asyncio.Future[Any]"):
+    if not future.done():
+        future.cancel()
+    elif not future.cancelled():
+        future.exception()
+
+
+_RESUMED = object()
+
+
+class _Resumed(Coroutine[Any, Any, Any]):
+    """
+    Coroutine resuming, inside its own context, a coroutine started outside of a
+    task, so a task can execute it. The first step just hands to the task what the
+    coroutine is awaiting. Everything sent or thrown later, like a cancellation, is
+    passed down to the coroutine.
+    """
+
+    __slots__ = ("coroutine", "context", "awaited")
+
+    def __init__(
+        self, coroutine: Coroutine[Any, Any, Any], context: Context, awaited: Any
+    ):
+        self.coroutine = coroutine
+        self.context = context
+        self.awaited = awaited
+
+    def send(self, value: Any) -> Any:
+        awaited = self.awaited
+        if awaited is not _RESUMED:
+            self.awaited = _RESUMED
+            return awaited
+        return self.context.run(self.coroutine.send, value)
+
+    def throw(self, typ, val=None, tb=None) -> Any:  # type: ignore[override]
+        self.awaited = _RESUMED
+        if val is None and tb is None:
+            return self.context.run(self.coroutine.throw, typ)
+        return self.context.run(self.coroutine.throw, typ, val, tb)
+
+    def close(self):
+        self.coroutine.close()
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        step = partial(self.send, None)
+        while True:
+            try:
+                awaited = step()
+            except StopIteration as stop:
+                return stop.value
+            try:
+                step = partial(self.send, (yield awaited))
+            except BaseException as exception:
+                step = partial(self.throw, exception)
+
+
+def _start_eagerly(
+    coroutine: Coroutine[Any, Any, Any],
+) -> tuple[bool, Union[Any, "asyncio.Future[Any]"]]:
+    """
+    Execute the coroutine until its first suspension, inside a copy of the current
+    context, like a task would (:func:`asyncio.eager_task_factory`). A coroutine
+    finishing without suspending returns :code:`(True, result)` and never goes
+    through the event loop. A suspended one returns :code:`(False, task)`, with a
+    task resuming it.
+    """
+    context = copy_context()
+    try:
+        awaited = context.run(coroutine.send, None)
+    except StopIteration as stop:
+        return True, stop.value
+    return False, asyncio.ensure_future(_Resumed(coroutine, context, awaited))
+
+
+async def _gather_eagerly(coroutines: Sequence[Coroutine[Any, Any, Any]]) -> list[Any]:
+    """
+    Like :func:`asyncio.gather`, but starting each coroutine eagerly, so only the
+    ones suspending become tasks. If some coroutine fails, the others are cancelled.
+    """
+    results: list[Any] = [None] * len(coroutines)
+    pending: list[tuple[int, asyncio.Future]] = []
+    started = 0
+    try:
+        for position, coroutine in enumerate(coroutines):
+            started += 1
+            done, outcome = _start_eagerly(coroutine)
+            if done:
+                results[position] = outcome
+            else:
+                pending.append((position, outcome))
+        if len(pending) > 0:
+            outputs = await asyncio.gather(*[task for _, task in pending])
+            for (position, _), output in zip(pending, outputs):
+                results[position] = output
+    except BaseException:
+        for coroutine in coroutines[started:]:
+            coroutine.close()
+        for _, task in pending:
+            _discard(task)
+        raise
+    return results
+
+
+class _BranchCosts:
+    """
+    Moving average of the duration of each branch of a gateway. Branches never
+    measured have an infinite cost, so they are treated as the longest ones.
+    """
+
+    __slots__ = ("estimates",)
+
+    def __init__(self, size: int):
+        self.estimates = [math.inf] * size
+
+    def observe(self, branch: int, duration: float):
+        self.estimates[branch] = _smoothed(self.estimates[branch], duration)
+
+    def longest_first(self) -> list[int]:
+        estimates = self.estimates
+        return sorted(range(len(estimates)), key=lambda i: -estimates[i])
+
+    def timed(self, branch: int, func: Callable[[Any], Any], data: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return func(data)
+        finally:
+            self.observe(branch, time.perf_counter() - start)
+
+    async def timed_async(
+        self, branch: int, func: Callable[[Any], Awaitable[Any]], data: Any
+    ) -> Any:
+        start = time.perf_counter()
+        try:
+            return await func(data)
+        finally:
+            self.observe(branch, time.perf_counter() - start)
+
+
+def _run_scheduled(
+    scope: _ExecutorScope,
+    costs: _BranchCosts,
+    branches: Sequence[Callable[[Any], Any]],
+    data: Any,
+) -> list[Any]:
+    """
+    Execute the branches in the executor of the scope, submitting the longest ones
+    first (LPT scheduling). The cheap branches, and the shortest one when all of them
+    are expensive, are executed in the calling thread while the others run.
+    """
+    submitted = []
+    inline = []
+    for branch in costs.longest_first():
+        if costs.estimates[branch] < scope.inline_below:
+            inline.append(branch)
+        else:
+            submitted.append(branch)
+    if len(inline) == 0:
+        inline.append(submitted.pop())
+
+    futures = [
+        (branch, _submit(scope.executor, costs.timed, branch, branches[branch], data))
+        for branch in submitted
+    ]
+    results: list[Any] = [None] * len(branches)
+    try:
+        for branch in inline:
+            results[branch] = costs.timed(branch, branches[branch], data)
+        for branch, future in futures:
+            results[branch] = future.result()
+    except BaseException:
+        for _, future in futures:
+            future.cancel()
+        raise
+    return results
+
+
+async def _run_scheduled_async(
+    scope: _ExecutorScope,
+    costs: _BranchCosts,
+    branches: Sequence[Callable[[Any], Any]],
+    async_branches: Sequence[bool],
+    data: Any,
+) -> list[Any]:
+    """
+    Execute the async branches concurrently and the expensive sync ones in the
+    executor of the scope, submitted longest first. The cheap sync branches are
+    executed in the event loop while the others run. On eager scopes, each async
+    branch is started right away and becomes a task only if it suspends.
+    """
+    loop = asyncio.get_running_loop()
+    results: list[Any] = [None] * len(branches)
+    pending: list[tuple[int, asyncio.Future]] = []
+    concurrent = []
+    inline = []
+    try:
+        for branch in costs.longest_first():
+            if async_branches[branch]:
+                concurrent.append(branch)
+            elif costs.estimates[branch] < scope.inline_below:
+                inline.append(branch)
+            else:
+                submitted = _submit(
+                    scope.executor, costs.timed, branch, branches[branch], data
+                )
+                pending.append((branch, asyncio.wrap_future(submitted, loop=loop)))
+
+        for branch in concurrent:
+            coroutine = costs.timed_async(branch, branches[branch], data)
+            if not scope.eager:
+                pending.append((branch, asyncio.ensure_future(coroutine)))
+                continue
+            done, outcome = _start_eagerly(coroutine)
+            if done:
+                results[branch] = outcome
+            else:
+                pending.append((branch, outcome))
+
+        for branch in inline:
+            results[branch] = costs.timed(branch, branches[branch], data)
+        if len(pending) > 0:
+            outputs = await asyncio.gather(*[future for _, future in pending])
+            for (branch, _), output in zip(pending, outputs):
+                results[branch] = output
+    except BaseException:
+        for _, future in pending:
+            _discard(future)
+        raise
+    return results
@@ -1,4 +1,70 @@
-from typing import Any
+import json
+from collections import deque
+from typing import Any, Iterator, TextIO
+
+from typing_extensions import Protocol
+
+from gloe._plotting_utils import NodeType
+
+_TOPOLOGY_VERSION = 1
+
+
+class GraphOverlay(Protocol):
+    """Anything able to decorate a graph before it is exported, like a profile"""
+
+    def overlay(self, graph: "GloeGraph") -> "GloeGraph":
+        pass
+
+
+def _plain_attrs(attrs: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: value
+        for key, value in attrs.items()
+        if isinstance(value, (str, int, float))
+    }
+
+
+def _dot_id(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    text = str(value).replace('"', '\\"').replace("\n", "\\n")
+    return f'"{text}"'
+
+
+def _dot_attrs(attrs: dict[str, Any], skip_label: bool = False) -> str:
+    """
+    Format the attributes in the dot syntax. Attributes holding arbitrary objects,
+    like the transformer of each node, are not part of the dot format.
+    """
+    pairs = [
+        f"{key}={_dot_id(value)}"
+        for key, value in _plain_attrs(attrs).items()
+        if not (skip_label and key == "label")
+    ]
+    if len(pairs) == 0:
+        return ""
+    return " [" + ", ".join(pairs) + "]"
+
+
+def _topology(attrs: dict[str, Any]) -> dict[str, Any]:
+    """
+    Describe the transformer behind a node, which is the transformer itself or the
+    gateway or conditioner owning the node. Graphs loaded from a topology keep this
+    description, since they don't have the transformers anymore.
+    """
+    topology = attrs.get("_topology")
+    if topology is not None:
+        return topology
+
+    transformer = attrs.get("transformer", attrs.get("_owner"))
+    if transformer is None:
+        return {}
+    return {
+        "label": transformer.label,
+        "async": transformer.plotting_settings.is_async,
+        "input": transformer.input_annotation,
+        "output": transformer.output_annotation,
+    }
 
 
 class GloeGraph:
@@ -20,6 +86,23 @@ class GloeGraph:
     def add_subgraph(self, subgraph: "GloeGraph"):
         self.subgraphs.append(subgraph)
 
+    def copy(self) -> "GloeGraph":
+        """Copy the graph structure, the attributes of each element are copied too"""
+        copied = GloeGraph(name=self.name)
+        copied.attrs = dict(self.attrs)
+        copied.nodes = {node: dict(attrs) for node, attrs in self.nodes.items()}
+        copied.edges = {edge: dict(attrs) for edge, attrs in self.edges.items()}
+        copied.subgraphs = [subgraph.copy() for subgraph in self.subgraphs]
+        return copied
+
+    def walk(self) -> Iterator["GloeGraph"]:
+        """Iterate over this graph and all its nested subgraphs"""
+        pending = deque([self])
+        while len(pending) > 0:
+            graph = pending.popleft()
+            yield graph
+            pending.extend(graph.subgraphs)
+
     def to_agraph(self, with_edge_labels: bool = True):
         try:
             import pygraphviz  # noqa: F401
@@ -36,33 +119,148 @@ class GloeGraph:
         A = pygraphviz.AGraph(
             name=self.name, compound=True, directed=True, style="dotted", **self.attrs
         )
+        self._fill_agraph(A, with_edge_labels)
+
+        pending = deque((A, subgraph) for subgraph in self.subgraphs)
+        while len(pending) > 0:
+            parent_agraph, subgraph = pending.popleft()
+            sub_agraph = parent_agraph.add_subgraph(
+                name=subgraph.name, **subgraph.attrs
+            )
+            subgraph._fill_agraph(sub_agraph, with_edge_labels)
+            pending.extend((sub_agraph, nested) for nested in subgraph.subgraphs)
 
-        subgraphs_stack = [(self, self.subgraphs)]
-        sub_agraph = A
-        while len(subgraphs_stack) > 0:
-            graph, subgraphs = subgraphs_stack.pop(0)
-            for subgraph in subgraphs:
-                sub_agraph = sub_agraph.add_subgraph(
-                    name=subgraph.name, **subgraph.attrs
+        return A
+
+    def _fill_agraph(self, agraph, with_edge_labels: bool):
+        for node, nodedata in self.nodes.items():
+            agraph.add_node(node, **nodedata)
+
+        for (u, v), edgedata in self.edges.items():
+            if not with_edge_labels:
+                edgedata = {k: val for k, val in edgedata.items() if k != "label"}
+            agraph.add_edge(u, v, **edgedata)
+
+    def write_dot(self, file: TextIO, with_edge_labels: bool = True):
+        """
+        Write the graph in the dot format without depending on pygraphviz.
+
+        The graph is streamed to the file in a single pass over its nodes, edges and
+        subgraphs, so big graphs don't need to be built in memory before being
+        written.
+
+        Args:
+            file: text stream receiving the dot content.
+            with_edge_labels: if the type annotations are shown in the edges.
+        """
+        file.write(f"strict digraph {_dot_id(self.name)} {{\n")
+        root_attrs = {"compound": True, "style": "dotted", **self.attrs}
+        file.write(f"\tgraph{_dot_attrs(root_attrs)};\n")
+
+        # each graph is visited twice: once to open it and once to close it, after
+        # all its subgraphs were written
+        pending: list[tuple[GloeGraph, int, bool]] = [(self, 1, True)]
+        while len(pending) > 0:
+            graph, depth, opening = pending.pop()
+            indent = "\t" * depth
+            if opening:
+                if graph is not self:
+                    file.write(f"{indent[:-1]}subgraph {_dot_id(graph.name)} {{\n")
+                    if len(graph.attrs) > 0:
+                        file.write(f"{indent}graph{_dot_attrs(graph.attrs)};\n")
+                pending.append((graph, depth, False))
+                pending.extend(
+                    (subgraph, depth + 1, True) for subgraph in graph.subgraphs[::-1]
                 )
+                continue
 
-                for node, nodedata in subgraph.nodes.items():
-                    sub_agraph.add_node(node, **nodedata)
+            for node, nodedata in graph.nodes.items():
+                file.write(f"{indent}{_dot_id(node)}{_dot_attrs(nodedata)};\n")
 
-                for (u, v), edgedata in subgraph.edges.items():
-                    if not with_edge_labels and "label" in edgedata:
-                        del edgedata["label"]
-                    sub_agraph.add_edge(u, v, **edgedata)
+            for (u, v), edgedata in graph.edges.items():
+                attrs = _dot_attrs(edgedata, skip_label=not with_edge_labels)
+                file.write(f"{indent}{_dot_id(u)} -> {_dot_id(v)}{attrs};\n")
 
-                if len(subgraph.subgraphs) > 0:
-                    subgraphs_stack.append((subgraph, subgraph.subgraphs))
+            if graph is not self:
+                file.write(f"{indent[:-1]}}}\n")
 
+        file.write("}\n")
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Describe the topology of the graph with plain data: its nodes, with their
+        types, labels, async flags and type annotations, its edges and its nested
+        subgraphs, like the clusters of collections and the branches of gateways.
+        The description is accepted by :meth:`GloeGraph.from_dict`.
+        """
+        return {"version": _TOPOLOGY_VERSION, **self._topology_dict()}
+
+    def _topology_dict(self) -> dict[str, Any]:
+        nodes = []
         for node, nodedata in self.nodes.items():
-            A.add_node(node, **nodedata)
+            node_type = nodedata.get("_type")
+            nodes.append(
+                {
+                    "id": node,
+                    "type": None if node_type is None else node_type.value,
+                    **_topology(nodedata),
+                    "attrs": _plain_attrs(nodedata),
+                }
+            )
 
-        for (u, v), edgedata in self.edges.items():
-            if not with_edge_labels and "label" in edgedata:
-                del edgedata["label"]
-            A.add_edge(u, v, **edgedata)
+        return {
+            "name": self.name,
+            "attrs": _plain_attrs(self.attrs),
+            "nodes": nodes,
+            "edges": [
+                {"source": u, "target": v, "attrs": _plain_attrs(edgedata)}
+                for (u, v), edgedata in self.edges.items()
+            ],
+            "subgraphs": [subgraph._topology_dict() for subgraph in self.subgraphs],
+        }
 
-        return A
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> "GloeGraph":
+        """
+        Build a graph from the description returned by :meth:`GloeGraph.to_dict`.
+        The loaded graph can be exported again, but its nodes aren't bound to any
+        transformer.
+        """
+        version = data.get("version", _TOPOLOGY_VERSION)
+        if version != _TOPOLOGY_VERSION:
+            raise ValueError(f"Unsupported graph topology version: {version}.")
+        return GloeGraph._from_topology_dict(data)
+
+    @staticmethod
+    def _from_topology_dict(data: dict[str, Any]) -> "GloeGraph":
+        graph = GloeGraph(name=data["name"])
+        graph.attrs = dict(data["attrs"])
+        for node in data["nodes"]:
+            nodedata = dict(node["attrs"])
+            if node["type"] is not None:
+                nodedata["_type"] = NodeType(node["type"])
+            topology = {
+                key: node[key]
+                for key in ("label", "async", "input", "output")
+                if key in node
+            }
+            if len(topology) > 0:
+                nodedata["_topology"] = topology
+            graph.nodes[node["id"]] = nodedata
+
+        for edge in data["edges"]:
+            graph.edges[(edge["source"], edge["target"])] = dict(edge["attrs"])
+
+        graph.subgraphs = [
+            GloeGraph._from_topology_dict(subgraph) for subgraph in data["subgraphs"]
+        ]
+        return graph
+
+    def write_json(self, file: TextIO):
+        """Write the topology of the graph to the file as compact JSON"""
+        json.dump(self.to_dict(), file, separators=(",", ":"))
+
+    @staticmethod
+    def read_json(file: TextIO) -> "GloeGraph":
+        """Load a graph from the JSON written by :meth:`GloeGraph.write_json`"""
+        return GloeGraph.from_dict(json.load(file))
@@ -0,0 +1,99 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from gloe.base_transformer import BaseTransformer
+
+__all__ = ["TransformerHook"]
+
+
+class TransformerHook:
+    """
+    Callbacks invoked around the execution of each transformer of a pipeline.
+
+    Override only the callbacks you need, the default implementations do nothing.
+    Hooks are called synchronously, in the thread (or event loop) running the
+    transformer, so they must be fast and must not block.
+    """
+
+    def on_start(self, transformer: BaseTransformer, data: Any):
+        """Called right before the transformer starts processing the incoming data"""
+
+    def on_end(self, transformer: BaseTransformer, data: Any, output: Any):
+        """Called right after the transformer returns its output"""
+
+    def on_error(
+        self, transformer: BaseTransformer, data: Any, exception: BaseException
+    ):
+        """
+        Called when the transformer raises an exception, before it is propagated.
+        Interruptions, like the cancellation of an async transformer, are reported
+        here too.
+        """
+
+
+Hooks = tuple[TransformerHook, ...]
+
+_scoped_hooks: ContextVar[Hooks] = ContextVar("gloe_scoped_hooks", default=())
+
+
+class _Flag:
+    """
+    Tells the execution flows whether they must pay for an optional feature. It
+    stays disabled until the feature is first used, so the hot path pays only for
+    reading the :attr:`enabled` flag.
+    """
+
+    __slots__ = ("enabled",)
+
+    def __init__(self):
+        self.enabled = False
+
+
+class _HookRegistry:
+    """
+    Keeps the global hooks and tells the execution flows whether they must pay for
+    the hooks dispatching. The :attr:`enabled` flag is the only thing read by the
+    hot path when no hooks are in use.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.global_hooks: Hooks = ()
+        self._active_scopes = 0
+        self.enabled = False
+
+    def _refresh(self):
+        self.enabled = len(self.global_hooks) > 0 or self._active_scopes > 0
+
+    def register(self, hook: TransformerHook):
+        with self._lock:
+            self.global_hooks = self.global_hooks + (hook,)
+            self._refresh()
+
+    def unregister(self, hook: TransformerHook):
+        with self._lock:
+            self.global_hooks = tuple(h for h in self.global_hooks if h is not hook)
+            self._refresh()
+
+    @contextmanager
+    def scope(self, hooks: Hooks) -> Iterator[None]:
+        with self._lock:
+            self._active_scopes += 1
+            self._refresh()
+        token = _scoped_hooks.set(_scoped_hooks.get() + hooks)
+        try:
+            yield
+        finally:
+            _scoped_hooks.reset(token)
+            with self._lock:
+                self._active_scopes -= 1
+                self._refresh()
+
+
+_registry = _HookRegistry()
+
+
+def _current_hooks() -> Hooks:
+    return _registry.global_hooks + _scoped_hooks.get()
@@ -51,4 +51,5 @@ def dot_props(node_type: NodeType) -> dict[str, Any]:
     elif node_type == NodeType.End:
         node_props = {"shape": "doublecircle", "width": 0.2, "height": 0.2, "label": ""}
 
+    node_props["_type"] = node_type
     return node_props
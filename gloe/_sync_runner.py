@@ -0,0 +1,118 @@
+import asyncio
+import os
+import threading
+from typing import Any, Coroutine, Optional, Sequence
+
+from gloe._executors import _gather_eagerly
+
+
+async def _gather_all(
+    awaitables: Sequence[Coroutine[Any, Any, Any]], eager: bool = False
+) -> list[Any]:
+    """Like :func:`asyncio.gather`, but cancels the pending calls when one fails"""
+    if eager:
+        return await _gather_eagerly(awaitables)
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+class _ThreadLoop:
+    """Event loop owned by a thread, closed when the thread ends"""
+
+    __slots__ = ("loop", "pid")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.pid = os.getpid()
+
+    def __del__(self):
+        self.loop.close()
+
+
+class _SyncRunner:
+    """
+    Executes coroutines from sync code. Each thread without a running event loop
+    keeps its own loop, reused by all its calls. The threads already running a loop,
+    which can't be blocked waiting for another coroutine on it, send the coroutines
+    to a loop running forever in a daemon thread. The loops are created again in
+    processes forked after them.
+    """
+
+    def __init__(self):
+        self.use_uvloop = False
+        self.started = False
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._background: Optional[asyncio.AbstractEventLoop] = None
+        self._background_thread: Optional[threading.Thread] = None
+        self._background_pid: Optional[int] = None
+
+    def _new_event_loop(self) -> asyncio.AbstractEventLoop:
+        self.started = True
+        if self.use_uvloop:
+            import uvloop
+
+            return uvloop.new_event_loop()
+        return asyncio.new_event_loop()
+
+    def run(self, coroutine: Coroutine[Any, Any, Any]) -> Any:
+        """Execute the coroutine inside a copy of the caller's context"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return self._run_in_thread(coroutine)
+        return self._run_in_background(coroutine)
+
+    def _run_in_thread(self, coroutine: Coroutine[Any, Any, Any]) -> Any:
+        thread_loop: Optional[_ThreadLoop] = getattr(self._local, "loop", None)
+        if thread_loop is None or thread_loop.pid != os.getpid():
+            thread_loop = _ThreadLoop(self._new_event_loop())
+            self._local.loop = thread_loop
+
+        loop = thread_loop.loop
+        task = loop.create_task(coroutine)
+        try:
+            return loop.run_until_complete(task)
+        except BaseException:
+            task.cancel()
+            raise
+
+    def _start_background(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            loop = self._background
+            if loop is None or self._background_pid != os.getpid():
+                loop = self._new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="gloe-event-loop", daemon=True
+                )
+                thread.start()
+                self._background = loop
+                self._background_thread = thread
+                self._background_pid = os.getpid()
+            return loop
+
+    def _run_in_background(self, coroutine: Coroutine[Any, Any, Any]) -> Any:
+        if threading.current_thread() is self._background_thread:
+            coroutine.close()
+            raise RuntimeError(
+                "A sync call of an async pipeline can't be made from a pipeline "
+                "already called from async code this way, await the pipeline instead."
+            )
+
+        loop = self._background
+        if loop is None or self._background_pid != os.getpid():
+            loop = self._start_background()
+        future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+
+_sync_runner = _SyncRunner()
@@ -0,0 +1,30 @@
+from inspect import Signature
+from typing import Generic, TypeVar
+
+from gloe._gloe_graph import GloeGraph
+from gloe.base_transformer import BaseTransformer, GloeNode
+
+_In = TypeVar("_In")
+_Out = TypeVar("_Out")
+
+
+class _Wrapper(Generic[_In, _Out], BaseTransformer[_In, _Out]):
+    """
+    Encapsulates a pipeline to change how it is executed. It is transparent to
+    plotting: the graph is exactly the encapsulated pipeline's graph.
+    """
+
+    def __init__(self, transformer: BaseTransformer[_In, _Out]):
+        super().__init__()
+        self._children = [transformer]
+        self._label = transformer.label
+        self._plotting_settings.is_gateway = True
+
+    def signature(self) -> Signature:
+        return self.children[0].signature()
+
+    def _dag(self, net: GloeGraph, root_node: GloeNode) -> GloeNode:
+        return self.children[0]._dag(net, root_node)
+
+    def __len__(self):
+        return len(self.children[0])
@@ -1,9 +1,29 @@
 from abc import abstractmethod
+from contextvars import copy_context
+from functools import partial
 from inspect import Signature
-from typing import TypeVar, overload, cast, Callable, Generic, Optional, Any
+from typing import (
+    TypeVar,
+    overload,
+    cast,
+    Callable,
+    Generic,
+    Iterable,
+    Optional,
+    Any,
+)
 
 from typing_extensions import Self
 
+from gloe._ensured_calls import _ensured_calls, _restore_calls
+from gloe._sync_runner import _gather_all, _sync_runner
+from gloe._executors import _ExecutorScope, _current_scope, _offload, _offloads
+from gloe._execution_context import (
+    ExecutionContext,
+    _current_execution,
+    _executions,
+)
+from gloe._hooks import _registry, _current_hooks
 from gloe._plotting_utils import PlottingSettings, NodeType
 from gloe._transformer_utils import catch_transformer_exception
 from gloe.base_transformer import BaseTransformer, Flow
@@ -22,23 +42,161 @@ _O6 = TypeVar("_O6")
 _O7 = TypeVar("_O7")
 
 
-async def _execute_async_flow(flow: Flow, arg: Any) -> Any:
+async def _execute_hooked_async_flow(flow: Flow, arg: Any) -> Any:
+    hooks = _current_hooks()
+    reversed_hooks = hooks[::-1]
     result = arg
     for op in flow:
-        if isinstance(op, BaseTransformer):
+        if not isinstance(op, BaseTransformer) or not hasattr(op, "_safe_transform"):
+            raise NotImplementedError()
+
+        for hook in hooks:
+            hook.on_start(op, result)
+        try:
             if isinstance(op, AsyncTransformer):
-                result = await op._safe_transform(result)
+                output = await op._safe_transform(result)
             else:
-                if hasattr(op, "_safe_transform"):
-                    result = op._safe_transform(result)
-                else:
-                    raise NotImplementedError()
-        else:
+                output = op._safe_transform(result)
+        except BaseException as exception:
+            for hook in reversed_hooks:
+                hook.on_error(op, result, exception)
+            raise
+        for hook in reversed_hooks:
+            hook.on_end(op, result, output)
+        result = output
+    return result
+
+
+# an async transformer, or a run of consecutive sync transformers
+_Segment = tuple[bool, Any]
+
+
+def _compile_async_flow(flow: Flow) -> list[_Segment]:
+    """
+    Group the maximal runs of consecutive sync transformers of an async flow, so
+    each run is executed by a single sync call, inline or in a single offload, and
+    the type of each node is checked only once.
+    """
+    segments: list[_Segment] = []
+    run: list[BaseTransformer] = []
+    for op in flow:
+        if not isinstance(op, BaseTransformer) or not hasattr(op, "_safe_transform"):
             raise NotImplementedError()
+
+        if isinstance(op, AsyncTransformer):
+            if len(run) > 0:
+                segments.append((False, tuple(run)))
+                run = []
+            segments.append((True, op))
+        else:
+            run.append(op)
+    if len(run) > 0:
+        segments.append((False, tuple(run)))
+    return segments
+
+
+def _execute_sync_segment(segment: tuple[Any, ...], arg: Any) -> Any:
+    result = arg
+    for op in segment:
+        result = op._safe_transform(result)
+    return result
+
+
+def _execute_hooked_sync_segment(segment: tuple[Any, ...], arg: Any) -> Any:
+    hooks = _current_hooks()
+    reversed_hooks = hooks[::-1]
+    result = arg
+    for op in segment:
+        for hook in hooks:
+            hook.on_start(op, result)
+        try:
+            output = op._safe_transform(result)
+        except BaseException as exception:
+            for hook in reversed_hooks:
+                hook.on_error(op, result, exception)
+            raise
+        for hook in reversed_hooks:
+            hook.on_end(op, result, output)
+        result = output
     return result
 
 
+async def _execute_offloaded_async_flow(
+    segments: list[_Segment], arg: Any, scope: _ExecutorScope
+) -> Any:
+    hooked = _registry.enabled
+    execute = _execute_hooked_sync_segment if hooked else _execute_sync_segment
+    automatic = scope.offload == "auto"
+    result = arg
+    for is_async, stage in segments:
+        if is_async:
+            if hooked:
+                result = await _execute_hooked_async_flow([stage], result)
+            else:
+                result = await stage._safe_transform(result)
+            continue
+
+        key = (stage[0].instance_id, len(stage))
+        if not scope.offloads(key):
+            result = scope.timed(key, partial(execute, stage), result)
+        elif automatic:
+            result = await _offload(
+                scope.executor, scope.timed, key, partial(execute, stage), result
+            )
+        else:
+            result = await _offload(scope.executor, execute, stage, result)
+    return result
+
+
+async def _execute_scoped_async_flow(
+    flow: Flow, arg: Any, segments: Optional[list[_Segment]]
+) -> Any:
+    execution = ExecutionContext()
+    token = _current_execution.set(execution)
+    try:
+        return await _execute_async_flow(flow, arg, segments)
+    finally:
+        _current_execution.reset(token)
+        execution._close()
+
+
+async def _execute_async_flow(
+    flow: Flow, arg: Any, segments: Optional[list[_Segment]] = None
+) -> Any:
+    """
+    Execute an async flow. The owners of the flow can pass its compiled segments,
+    otherwise the flow is compiled on each execution.
+    """
+    if _executions.enabled and _current_execution.get() is None:
+        return await _execute_scoped_async_flow(flow, arg, segments)
+    if segments is None:
+        segments = _compile_async_flow(flow)
+    snapshot = copy_context() if _ensured_calls.enabled else None
+    try:
+        if _offloads.enabled:
+            scope = _current_scope.get()
+            if scope is not None and scope.offload is not None:
+                return await _execute_offloaded_async_flow(segments, arg, scope)
+        if _registry.enabled:
+            return await _execute_hooked_async_flow(flow, arg)
+
+        result = arg
+        for is_async, stage in segments:
+            if is_async:
+                result = await stage._safe_transform(result)
+            else:
+                for op in stage:
+                    result = op._safe_transform(result)
+        return result
+    except BaseException:
+        if snapshot is not None:
+            _restore_calls(snapshot)
+        raise
+
+
 class AsyncTransformer(Generic[_In, _Out], BaseTransformer[_In, _Out]):
+    _compiled_flow: Optional[tuple[Flow, list[_Segment]]] = None
+
     def __init__(self):
         super().__init__()
 
@@ -94,8 +252,56 @@ class AsyncTransformer(Generic[_In, _Out], BaseTransformer[_In, _Out]):
 
         raise NotImplementedError  # pragma: no cover
 
+    def _segments(self) -> list[_Segment]:
+        """
+        Compiled segments of the flow. They are compiled again whenever the flow is
+        replaced, like on copies.
+        """
+        compiled = self._compiled_flow
+        if compiled is None or compiled[0] is not self._flow:
+            compiled = (self._flow, _compile_async_flow(self._flow))
+            self._compiled_flow = compiled
+        return compiled[1]
+
     async def __call__(self, data: _In) -> _Out:
-        return await _execute_async_flow(self._flow, data)
+        return await _execute_async_flow(self._flow, data, self._segments())
+
+    def run_sync(self, data: _In) -> _Out:
+        """
+        Execute the pipeline from sync code, like a CLI command or a Celery task, and
+        wait for its result.
+
+        The pipeline runs in an event loop kept by Gloe for the calling thread, so
+        there is no event loop to be created and closed on each call, as with
+        :code:`asyncio.run(pipeline(data))`. When the calling thread is already
+        running an event loop, the pipeline runs in a loop kept by Gloe in a
+        background thread. The pipeline sees the context variables of the caller.
+
+        Args:
+            data: the incoming data of the pipeline.
+
+        Return:
+            The outcome of the pipeline.
+        """
+        return _sync_runner.run(self(data))
+
+    def run_sync_many(self, data: Iterable[_In], eager: bool = False) -> list[_Out]:
+        """
+        Execute the pipeline concurrently for each item of :code:`data`, like
+        :meth:`run_sync`, and wait for all the results. If some execution fails, the
+        others are cancelled and the exception is raised.
+
+        Args:
+            data: the incoming data of each execution.
+            eager: whether each execution is started right away, becoming a task
+                only if it suspends, like with :func:`asyncio.eager_task_factory`.
+                It saves a round trip through the event loop for each item when
+                most of them finish without suspending.
+
+        Return:
+            The outcomes of the executions, in the order of the items.
+        """
+        return _sync_runner.run(_gather_all([self(item) for item in data], eager))
 
     def copy(
         self,
@@ -23,7 +23,7 @@ from typing import (
 
 from typing_extensions import Self, TypeAlias, deprecated
 
-from gloe._gloe_graph import GloeGraph
+from gloe._gloe_graph import GloeGraph, GraphOverlay
 from gloe._plotting_utils import PlottingSettings, NodeType, dot_props
 from gloe._typing_utils import _format_return_annotation
 
@@ -372,17 +372,66 @@ class BaseTransformer(Generic[_In, _Out], ABC):
     def export(self, path: str, with_edge_labels: bool = True):
         """Export Transformer object in dot format"""
 
-        self.graph().to_agraph(with_edge_labels).write(path)
+        with open(path, "w") as file:
+            self.graph().write_dot(file, with_edge_labels)
 
-    def to_dot(self, path: str, with_edge_labels: bool = True):
-        """Export Transformer object in dot format"""
+    def _export_graph(self, overlay: Optional[GraphOverlay]) -> GloeGraph:
+        graph = self.graph()
+        if overlay is not None:
+            graph = overlay.overlay(graph)
+        return graph
+
+    def to_dot(
+        self,
+        path: str,
+        with_edge_labels: bool = True,
+        overlay: Optional[GraphOverlay] = None,
+    ):
+        """
+        Export Transformer object in dot format. The file is written natively, so
+        pygraphviz is not required.
+
+        Args:
+            path: destination file.
+            with_edge_labels: if the type annotations are shown in the edges.
+            overlay: decorates the graph before exporting it, like a
+                :class:`gloe.profiling.Profiler` painting the time spent in each node.
+        """
+
+        with open(path, "w") as file:
+            self._export_graph(overlay).write_dot(file, with_edge_labels)
+
+    def to_json(self, path: str, overlay: Optional[GraphOverlay] = None):
+        """
+        Export the topology of the Transformer object as compact JSON. The file can
+        be loaded back with :meth:`GloeGraph.read_json`, without the transformers.
+
+        Args:
+            path: destination file.
+            overlay: decorates the graph before exporting it, like a
+                :class:`gloe.profiling.Profiler` painting the time spent in each node.
+        """
+
+        with open(path, "w") as file:
+            self._export_graph(overlay).write_json(file)
 
-        self.graph().to_agraph(with_edge_labels).write(path)
+    def to_image(
+        self,
+        path: str,
+        with_edge_labels: bool = True,
+        overlay: Optional[GraphOverlay] = None,
+    ):
+        """
+        Export Transformer object in a custom image format
 
-    def to_image(self, path: str, with_edge_labels: bool = True):
-        """Export Transformer object in a custom image format"""
+        Args:
+            path: destination file, its extension defines the image format.
+            with_edge_labels: if the type annotations are shown in the edges.
+            overlay: decorates the graph before exporting it, like a
+                :class:`gloe.profiling.Profiler` painting the time spent in each node.
+        """
 
-        self.graph().to_agraph(with_edge_labels).draw(path, prog="dot")
+        self._export_graph(overlay).to_agraph(with_edge_labels).draw(path, prog="dot")
 
     def __len__(self):
         return 1
@@ -1,4 +1,12 @@
-__all__ = ["MapOver", "Map", "Filter", "MapOverAsync", "MapAsync", "FilterAsync"]
+__all__ = [
+    "MapOver",
+    "Map",
+    "Filter",
+    "MapOverAsync",
+    "MapAsync",
+    "FilterAsync",
+    "Partition",
+]
 
 from gloe.collection._mapover import MapOver
 from gloe.collection._map import Map
@@ -6,3 +14,4 @@ from gloe.collection._filter import Filter
 from gloe.collection._mapover_async import MapOverAsync
 from gloe.collection._map_async import MapAsync
 from gloe.collection._filter_async import FilterAsync
+from gloe.collection._partition import Partition
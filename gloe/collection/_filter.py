@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar, Iterable
+from typing import Generic, TypeVar, Iterable, cast
 
 from gloe._plotting_utils import PlottingSettings, NodeType
 from gloe.transformers import Transformer
@@ -27,7 +27,6 @@ class Filter(Generic[_T], Transformer[Iterable[_T], Iterable[_T]]):
 
     def __init__(self, filter_transformer: Transformer[_T, bool]):
         super().__init__()
-        self.filter_transformer = filter_transformer
         self.plotting_settings.invisible = True
         self._children = [filter_transformer]
 
@@ -36,6 +35,11 @@ class Filter(Generic[_T], Transformer[Iterable[_T], Iterable[_T]]):
             node_type=NodeType.Transformer,
         )
 
+    @property
+    def filter_transformer(self) -> Transformer[_T, bool]:
+        """Transformer that decides if each item of the incoming iterable is kept"""
+        return cast(Transformer[_T, bool], self._children[0])
+
     def transform(self, data: Iterable[_T]) -> Iterable[_T]:
         """
         Args:
@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar, Iterable
+from typing import Generic, TypeVar, Iterable, cast
 
 from gloe import AsyncTransformer
 from gloe._plotting_utils import PlottingSettings, NodeType
@@ -27,15 +27,20 @@ class FilterAsync(Generic[_T], AsyncTransformer[Iterable[_T], Iterable[_T]]):
 
     def __init__(self, filter_transformer: AsyncTransformer[_T, bool]):
         super().__init__()
-        self.filter_transformer = filter_transformer
         self.plotting_settings.invisible = True
         self._children = [filter_transformer]
 
         self._plotting_settings: PlottingSettings = PlottingSettings(
             has_children=True,
             node_type=NodeType.Transformer,
+            is_async=True,
         )
 
+    @property
+    def filter_transformer(self) -> AsyncTransformer[_T, bool]:
+        """Transformer that decides if each item of the incoming iterable is kept"""
+        return cast(AsyncTransformer[_T, bool], self._children[0])
+
     async def transform_async(self, data: Iterable[_T]) -> Iterable[_T]:
         """
         Args:
@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar, Iterable
+from typing import Generic, TypeVar, Iterable, cast
 
 from gloe.transformers import Transformer
 
@@ -29,10 +29,14 @@ class Map(Generic[_T, _U], Transformer[Iterable[_T], Iterable[_U]]):
 
     def __init__(self, mapping_transformer: Transformer[_T, _U]):
         super().__init__()
-        self.mapping_transformer = mapping_transformer
         self.plotting_settings.has_children = True
         self._children = [mapping_transformer]
 
+    @property
+    def mapping_transformer(self) -> Transformer[_T, _U]:
+        """Transformer applied to each item of the incoming iterable"""
+        return cast(Transformer[_T, _U], self._children[0])
+
     def transform(self, data: Iterable[_T]) -> Iterable[_U]:
         """
         Args:
@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar, Iterable
+from typing import Generic, TypeVar, Iterable, cast
 
 from gloe import AsyncTransformer
 
@@ -29,10 +29,14 @@ class MapAsync(Generic[_T, _U], AsyncTransformer[Iterable[_T], Iterable[_U]]):
 
     def __init__(self, mapping_transformer: AsyncTransformer[_T, _U]):
         super().__init__()
-        self.mapping_transformer = mapping_transformer
         self.plotting_settings.has_children = True
         self._children = [mapping_transformer]
 
+    @property
+    def mapping_transformer(self) -> AsyncTransformer[_T, _U]:
+        """Transformer applied to each item of the incoming iterable"""
+        return cast(AsyncTransformer[_T, _U], self._children[0])
+
     async def transform_async(self, data: Iterable[_T]) -> Iterable[_U]:
         """
         Args:
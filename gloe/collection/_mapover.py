@@ -1,4 +1,4 @@
-from typing import Generic, Iterable, TypeVar
+from typing import Any, Generic, Iterable, TypeVar, cast
 
 
 from gloe.transformers import Transformer
@@ -16,10 +16,14 @@ class MapOver(Generic[_T, _U], Transformer[_T, Iterable[_U]]):
     ):
         super().__init__()
         self.iterable = iterable
-        self.mapping_transformer = mapping_transformer
         self.plotting_settings.has_children = True
         self._children = [mapping_transformer]
 
+    @property
+    def mapping_transformer(self) -> Transformer[tuple[_T, Any], _U]:
+        """Transformer applied to each pair of incoming data and iterable item"""
+        return cast(Transformer[tuple[_T, Any], _U], self._children[0])
+
     def transform(self, data: _T) -> Iterable[_U]:
         lopping_result = []
         for item in self.iterable:
@@ -1,4 +1,4 @@
-from typing import Generic, Iterable, TypeVar
+from typing import Any, Generic, Iterable, TypeVar, cast
 
 from gloe import AsyncTransformer
 
@@ -15,10 +15,14 @@ class MapOverAsync(Generic[_T, _U], AsyncTransformer[_T, Iterable[_U]]):
     ):
         super().__init__()
         self.iterable = iterable
-        self.mapping_transformer = mapping_transformer
         self.plotting_settings.has_children = True
         self._children = [mapping_transformer]
 
+    @property
+    def mapping_transformer(self) -> AsyncTransformer[tuple[_T, Any], _U]:
+        """Transformer applied to each pair of incoming data and iterable item"""
+        return cast(AsyncTransformer[tuple[_T, Any], _U], self._children[0])
+
     async def transform_async(self, data: _T) -> Iterable[_U]:
         lopping_result = []
         for item in self.iterable:
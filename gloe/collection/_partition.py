@@ -0,0 +1,293 @@
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
+
+from gloe._executors import _current_scope
+from gloe._sync_runner import _gather_all
+from gloe.async_transformer import AsyncTransformer
+from gloe.base_transformer import BaseTransformer
+from gloe.conditional._base_conditioner import BaseConditioner
+from gloe.conditional._implication import _AsyncImplication
+from gloe.exceptions import UnsupportedTransformerArgException
+from gloe.functional import transformer
+from gloe.transformers import Transformer
+
+_T = TypeVar("_T")
+_U = TypeVar("_U", covariant=True)
+_V = TypeVar("_V")
+_ElseOut = TypeVar("_ElseOut")
+
+
+@transformer
+def forget_all(data: list[Any]) -> list[None]:
+    """Transform each item of the batch to `None`"""
+    return [None] * len(data)
+
+
+class _BasePartitioner(BaseConditioner[list[_T], list[_U], list[_ElseOut]]):
+    """
+    Routes each item of the incoming iterable to the first branch whose condition
+    holds for it, then executes each branch only once, with the batch of all its
+    items. The outputs of the branches are scattered back to the original positions
+    of the items.
+    """
+
+    def _partition(
+        self, data: Iterable[_T]
+    ) -> tuple[int, list[list[_T]], list[list[int]]]:
+        implications = self.implications
+        else_branch = len(implications)
+        batches: list[list[_T]] = [[] for _ in range(else_branch + 1)]
+        positions: list[list[int]] = [[] for _ in range(else_branch + 1)]
+
+        size = 0
+        for position, item in enumerate(data):
+            branch = else_branch
+            for i, implication in enumerate(implications):
+                if implication.condition(item):  # type: ignore[arg-type]
+                    branch = i
+                    break
+            batches[branch].append(item)
+            positions[branch].append(position)
+            size += 1
+
+        for branch, batch in enumerate(batches):
+            self._branch_hits[branch] += len(batch)
+        return size, batches, positions
+
+    def _branch(self, branch: int) -> BaseTransformer:
+        if branch < len(self.implications):
+            return self.implications[branch].then_transformer
+        return self.else_transformer
+
+    def _scatter(
+        self,
+        result: list[Any],
+        branch: int,
+        positions: list[int],
+        outputs: Iterable[Any],
+    ):
+        outputs = list(outputs)
+        if len(outputs) != len(positions):
+            branch_transformer = self._branch(branch)
+            raise ValueError(
+                f"The branch {branch_transformer.label} returned {len(outputs)} "
+                f"items for a batch of {len(positions)} items. Partition branches "
+                f"must return one output for each item of the batch."
+            )
+        for position, output in zip(positions, outputs):
+            result[position] = output
+
+
+class _Partitioner(_BasePartitioner[_T, _U, _ElseOut], Transformer[Iterable[_T], Any]):
+    def transform(self, data: Iterable[_T]) -> list[Union[_U, _ElseOut]]:
+        size, batches, positions = self._partition(data)
+        result: list[Any] = [None] * size
+        for branch, batch in enumerate(batches):
+            if len(batch) > 0:
+                branch_transformer = cast(Transformer, self._branch(branch))
+                self._scatter(
+                    result, branch, positions[branch], branch_transformer(batch)
+                )
+        return result
+
+
+class _AsyncPartitioner(  # type: ignore[misc]
+    _BasePartitioner[_T, _U, _ElseOut], AsyncTransformer[Iterable[_T], Any]
+):
+    async def _run_branch(self, branch: int, batch: list[_T]) -> Any:
+        branch_transformer = self._branch(branch)
+        if isinstance(branch_transformer, AsyncTransformer):
+            return await branch_transformer(batch)
+        return cast(Transformer, branch_transformer)(batch)
+
+    async def transform_async(self, data: Iterable[_T]) -> list[Union[_U, _ElseOut]]:
+        size, batches, positions = self._partition(data)
+        branches = [branch for branch, batch in enumerate(batches) if len(batch) > 0]
+        runs = [self._run_branch(branch, batches[branch]) for branch in branches]
+        scope = _current_scope.get()
+        outputs = await _gather_all(runs, eager=scope is not None and scope.eager)
+
+        result: list[Any] = [None] * size
+        for branch, branch_outputs in zip(branches, outputs):
+            self._scatter(result, branch, positions[branch], branch_outputs)
+        return result
+
+
+class _BasePartitionThen(Generic[_T, _U]):
+    def __init__(
+        self,
+        name: str,
+        implications: Sequence[_AsyncImplication[list[_T], Any]],
+    ):
+        self._name = name
+        self._implications = implications
+
+    def _build(self, else_transformer: BaseTransformer) -> BaseTransformer:
+        is_async = any(
+            isinstance(impl.then_transformer, AsyncTransformer)
+            for impl in self._implications
+        ) or isinstance(else_transformer, AsyncTransformer)
+
+        partitioner: _BasePartitioner
+        if is_async:
+            partitioner = _AsyncPartitioner(self._implications, else_transformer)
+        else:
+            partitioner = _Partitioner(self._implications, else_transformer)
+        partitioner._label = self._name
+        return partitioner
+
+
+class _PartitionThen(_BasePartitionThen[_T, _U]):
+    def ElseIf(self, condition: Callable[[_T], bool]) -> "_PartitionElseIf[_T, _U]":
+        return _PartitionElseIf(condition, self._name, self._implications)
+
+    @overload
+    def Else(
+        self, else_transformer: Transformer[list[_T], list[_ElseOut]]
+    ) -> Transformer[Iterable[_T], list[Union[_U, _ElseOut]]]:
+        pass
+
+    @overload
+    def Else(
+        self, else_transformer: AsyncTransformer[list[_T], list[_ElseOut]]
+    ) -> AsyncTransformer[Iterable[_T], list[Union[_U, _ElseOut]]]:
+        pass
+
+    def Else(self, else_transformer):
+        if not isinstance(else_transformer, BaseTransformer):
+            raise UnsupportedTransformerArgException(else_transformer)
+        return self._build(else_transformer)
+
+    def ElseNone(self) -> Transformer[Iterable[_T], list[Optional[_U]]]:
+        return self._build(forget_all)  # type: ignore[return-value]
+
+
+class _AsyncPartitionThen(_BasePartitionThen[_T, _U]):
+    def ElseIf(
+        self, condition: Callable[[_T], bool]
+    ) -> "_AsyncPartitionElseIf[_T, _U]":
+        return _AsyncPartitionElseIf(condition, self._name, self._implications)
+
+    def Else(
+        self, else_transformer: BaseTransformer[list[_T], list[_ElseOut]]
+    ) -> AsyncTransformer[Iterable[_T], list[Union[_U, _ElseOut]]]:
+        if not isinstance(else_transformer, BaseTransformer):
+            raise UnsupportedTransformerArgException(else_transformer)
+        return self._build(else_transformer)  # type: ignore[return-value]
+
+    def ElseNone(self) -> AsyncTransformer[Iterable[_T], list[Optional[_U]]]:
+        return self._build(forget_all)  # type: ignore[return-value]
+
+
+class _BasePartitionElseIf(Generic[_T, _U]):
+    def __init__(
+        self,
+        condition: Callable[[_T], bool],
+        name: str,
+        implications: Sequence[_AsyncImplication[list[_T], Any]] = (),
+    ):
+        self._condition = condition
+        self._name = name
+        self._implications = implications
+
+    def _add_branch(
+        self, batch_transformer: BaseTransformer
+    ) -> tuple[str, list[_AsyncImplication]]:
+        if not isinstance(batch_transformer, BaseTransformer):
+            raise UnsupportedTransformerArgException(batch_transformer)
+        implication = _AsyncImplication(self._condition, batch_transformer)
+        return self._name, [*self._implications, implication]
+
+
+class _PartitionElseIf(_BasePartitionElseIf[_T, _U]):
+    @overload
+    def Then(
+        self, batch_transformer: Transformer[list[_T], list[_V]]
+    ) -> _PartitionThen[_T, Union[_U, _V]]:
+        pass
+
+    @overload
+    def Then(
+        self, batch_transformer: AsyncTransformer[list[_T], list[_V]]
+    ) -> _AsyncPartitionThen[_T, Union[_U, _V]]:
+        pass
+
+    def Then(self, batch_transformer):
+        """Add a branch executed with the batch of items the condition holds for"""
+        if isinstance(batch_transformer, AsyncTransformer):
+            return _AsyncPartitionThen(*self._add_branch(batch_transformer))
+        return _PartitionThen(*self._add_branch(batch_transformer))
+
+
+class _AsyncPartitionElseIf(_BasePartitionElseIf[_T, _U]):
+    def Then(
+        self, batch_transformer: BaseTransformer[list[_T], list[_V]]
+    ) -> _AsyncPartitionThen[_T, Union[_U, _V]]:
+        """Add a branch executed with the batch of items the condition holds for"""
+        return _AsyncPartitionThen(*self._add_branch(batch_transformer))
+
+
+class Partition(Generic[_T]):
+    """
+    It is used to start a batch-aware condition chaining over an iterable. It is an
+    alternative to a :class:`Map` of a condition chain where the branches process a
+    whole batch at once.
+
+    Each item is checked against the conditions in declaration order and is assigned
+    to the first branch whose condition holds, or to the else branch. Then, each
+    branch transformer is executed only once, receiving the list of its items and
+    returning a list with one output for each of them. The outputs are put back in
+    the original positions of the items. Branches without items aren't executed.
+    When any branch is async, the resulting transformer is async and the branches
+    are executed concurrently.
+
+    Example:
+        The below example scores the small orders with a cheap rule and sends the
+        big ones to a model in a single request::
+
+            @transformer
+            def score_with_rule(orders: list[Order]) -> list[float]: ...
+
+            @async_transformer
+            async def score_with_model(orders: list[Order]) -> list[float]: ...
+
+            score_orders = (
+                Partition[Order](lambda order: order.total < 100)
+                    .Then(score_with_rule)
+                .Else(score_with_model)
+            )
+
+    Args:
+        condition: callable returning a boolean for each item.
+        name: optional argument that adds a label to partition node during plotting.
+    """
+
+    def __init__(self, condition: Callable[[_T], bool], name: Union[str, None] = None):
+        self._condition = condition
+        self._name: str = name or condition.__name__
+
+    @overload
+    def Then(
+        self, batch_transformer: Transformer[list[_T], list[_V]]
+    ) -> _PartitionThen[_T, _V]:
+        pass
+
+    @overload
+    def Then(
+        self, batch_transformer: AsyncTransformer[list[_T], list[_V]]
+    ) -> _AsyncPartitionThen[_T, _V]:
+        pass
+
+    def Then(self, batch_transformer):
+        """Add a branch executed with the batch of items the condition holds for"""
+        return _PartitionElseIf(self._condition, self._name).Then(batch_transformer)
@@ -1,3 +1,4 @@
-__all__ = ["If", "condition"]
+__all__ = ["If", "condition", "Switch"]
 
 from gloe.conditional._if import If, condition
+from gloe.conditional._switch import Switch
@@ -1,9 +1,15 @@
+import asyncio
+import inspect
+
 from typing_extensions import Self
 
 from gloe.async_transformer import AsyncTransformer
+from gloe._executors import _discard
+from gloe.base_transformer import BaseTransformer
 from gloe.transformers import Transformer
 from gloe.conditional._base_conditioner import BaseConditioner
-from typing import TypeVar, Union, Optional, Callable
+from gloe.conditional._implication import _BaseImplication
+from typing import Any, TypeVar, Union, Optional, Callable, Sequence
 
 In = TypeVar("In")
 ThenOut = TypeVar("ThenOut", covariant=True)
@@ -12,24 +18,143 @@ ElseIfOut = TypeVar("ElseIfOut")
 PrevThenOut = TypeVar("PrevThenOut")
 
 
+def _is_async_condition(condition: Callable[..., Any]) -> bool:
+    return inspect.iscoroutinefunction(condition) or inspect.iscoroutinefunction(
+        getattr(condition, "__call__", None)
+    )
+
+
 class AsyncConditioner(
     BaseConditioner[In, ThenOut, ElseOut], AsyncTransformer[In, Union[ThenOut, ElseOut]]
 ):
-    async def transform_async(self, data: In) -> Union[ThenOut, ElseOut]:
-        for implication in self.implications:
-            if implication.condition(data):
-                if isinstance(implication.then_transformer, AsyncTransformer):
-                    return await implication.then_transformer(data)
-                elif isinstance(implication.then_transformer, Transformer):
-                    return implication.then_transformer(data)
-
-        if isinstance(self.else_transformer, AsyncTransformer):
-            return await self.else_transformer(data)
-        elif isinstance(self.else_transformer, Transformer):
-            return self.else_transformer(data)
+    """
+    Conditioner executed asynchronously. The conditions may be async callables, in
+    which case they are awaited.
+
+    Args:
+        implications: the conditions and the transformers executed when they hold.
+        else_transformer: transformer executed when no condition holds.
+        concurrent_conditions: when :code:`True`, the async conditions are all
+            started at once instead of one after another. The first condition that
+            holds, in declaration order, is still the one selected, and the
+            conditions which are still running are cancelled.
+        speculative: when :code:`True`, the branch selected most often so far is
+            started together with the conditions, and cancelled if another branch
+            is selected. Only async branches are started ahead, and they must be
+            safe to cancel and free of side effects, because their work is thrown
+            away on a misprediction.
+        mutually_exclusive: declares that at most one condition holds for any
+            data, which allows the conditions to be checked in the order of how
+            often they hold. It doesn't apply to concurrent conditions.
+    """
+
+    def __init__(
+        self,
+        implications: Sequence[_BaseImplication[In, ThenOut]],
+        else_transformer: BaseTransformer[In, ElseOut],
+        concurrent_conditions: bool = False,
+        speculative: bool = False,
+        mutually_exclusive: bool = False,
+    ):
+        super().__init__(implications, else_transformer, mutually_exclusive)
+        self.concurrent_conditions = concurrent_conditions
+        self.speculative = speculative
+
+    def _reset_hits(self):
+        super()._reset_hits()
+        self._predicted_branch: Optional[int] = None
+
+    def _observe(self, branch: int):
+        super()._observe(branch)
+        hits = self._branch_hits
+        predicted = self._predicted_branch
+        if predicted is None or hits[branch] > hits[predicted]:
+            self._predicted_branch = branch
+
+    def _branch(self, branch: int) -> BaseTransformer:
+        if branch < len(self.implications):
+            return self.implications[branch].then_transformer
+        return self.else_transformer
+
+    async def _select_sequentially(self, data: In) -> int:
+        implications = self.implications
+        for branch in self._evaluation_order:
+            holds = implications[branch].condition(data)
+            if holds.__class__ is not bool and inspect.isawaitable(holds):
+                holds = await holds
+            if holds:
+                return branch
+        return len(implications)
+
+    async def _select_concurrently(self, data: In) -> int:
+        """
+        Every condition is called before any of them is awaited, so all the async
+        ones run together. A condition is async when it returns an awaitable, even
+        if it is a plain function, like a lambda calling an async function.
+        """
+        pending: dict[int, asyncio.Future] = {}
+        outcomes: list[Any] = []
+        try:
+            for i, implication in enumerate(self.implications):
+                holds = implication.condition(data)
+                if holds.__class__ is not bool and inspect.isawaitable(holds):
+                    pending[i] = asyncio.ensure_future(holds)
+                outcomes.append(holds)
+
+            for i, holds in enumerate(outcomes):
+                if i in pending:
+                    holds = await pending.pop(i)
+                if holds:
+                    return i
+            return len(outcomes)
+        finally:
+            for future in pending.values():
+                _discard(future)
+
+    async def _select(self, data: In) -> int:
+        if self.concurrent_conditions:
+            return await self._select_concurrently(data)
+        return await self._select_sequentially(data)
+
+    async def _run_branch(self, branch: int, data: In) -> Union[ThenOut, ElseOut]:
+        selected = self._branch(branch)
+        if isinstance(selected, AsyncTransformer):
+            return await selected(data)
+        elif isinstance(selected, Transformer):
+            return selected(data)
 
         raise NotImplementedError()
 
+    async def _transform_speculatively(self, data: In) -> Union[ThenOut, ElseOut]:
+        predicted = self._predicted_branch
+        speculation: Optional[asyncio.Future] = None
+        if predicted is not None:
+            predicted_transformer = self._branch(predicted)
+            if isinstance(predicted_transformer, AsyncTransformer):
+                speculation = asyncio.ensure_future(predicted_transformer(data))
+
+        try:
+            branch = await self._select(data)
+        except BaseException:
+            if speculation is not None:
+                _discard(speculation)
+            raise
+
+        self._observe(branch)
+        if speculation is not None:
+            if branch == predicted:
+                return await speculation
+            _discard(speculation)
+        return await self._run_branch(branch, data)
+
+    async def transform_async(self, data: In) -> Union[ThenOut, ElseOut]:
+        if self.speculative:
+            return await self._transform_speculatively(data)
+
+        branch = await self._select(data)
+        self._observe(branch)
+        return await self._run_branch(branch, data)
+
     def copy(
         self,
         transform: Optional[Callable[[Self, In], Union[ThenOut, ElseOut]]] = None,
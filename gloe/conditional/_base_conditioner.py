@@ -38,18 +38,56 @@ class BaseConditioner(
         self,
         implications: Sequence[_BaseImplication[In, ThenOut]],
         else_transformer: BaseTransformer[In, ElseOut],
+        mutually_exclusive: bool = False,
     ):
         super().__init__()
         self.implications = implications
         self.else_transformer = else_transformer
+        self.mutually_exclusive = mutually_exclusive
+        self._reset_hits()
         self._plotting_settings = PlottingSettings(
-            NodeType.Transformer, has_children=True, is_gateway=True
+            NodeType.Transformer,
+            has_children=True,
+            is_gateway=True,
+            is_async=self._plotting_settings.is_async,
         )
         self._children = [
             *[impl.then_transformer for impl in implications],
             else_transformer,
         ]
 
+    @property
+    def hit_counts(self) -> list[int]:
+        """
+        How many times each branch was selected: one count per implication, in
+        declaration order, followed by the count of the else branch.
+        """
+        return list(self._branch_hits)
+
+    def _reset_hits(self):
+        self._branch_hits = [0] * (len(self.implications) + 1)
+        self._evaluation_order = list(range(len(self.implications)))
+
+    def _observe(self, branch: int):
+        """
+        Count a selected branch. When the conditions are mutually exclusive, their
+        order doesn't change the result, so a condition that holds more often than
+        the one checked before it takes its place. The order list is replaced
+        instead of mutated, so concurrent executions always see a complete order.
+        """
+        hits = self._branch_hits
+        hits[branch] += 1
+        if not self.mutually_exclusive or branch == len(self.implications):
+            return
+
+        order = self._evaluation_order
+        position = order.index(branch)
+        if position > 0 and hits[branch] > hits[order[position - 1]]:
+            new_order = list(order)
+            new_order[position - 1] = branch
+            new_order[position] = order[position - 1]
+            self._evaluation_order = new_order
+
     def signature(self) -> Signature:
         else_signature: Signature = self.else_transformer.signature()
         return_signature: list[Signature] = [
@@ -88,6 +126,7 @@ class BaseConditioner(
             *[impl.then_transformer for impl in copied.implications],
             copied.else_transformer,
         ]
+        copied._reset_hits()
         return copied
 
     def __len__(self):
@@ -102,7 +141,7 @@ class BaseConditioner(
         root_node: GloeNode,
     ) -> GloeNode:
         in_converge_id = str(uuid.uuid4())
-        label = self.__class__.__name__
+        label = self.label
         in_converge = GloeNode(
             id=in_converge_id,
             input_annotation=self.input_annotation,
@@ -113,6 +152,7 @@ class BaseConditioner(
             in_converge_id,
             label=label,
             _label=label,
+            _owner=self,
             **dot_props(NodeType.ConditionBegin),
         )
 
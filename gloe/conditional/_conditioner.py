@@ -1,3 +1,5 @@
+import inspect
+
 from gloe.conditional._base_conditioner import BaseConditioner
 from gloe.conditional._implication import _Implication
 from typing import (
@@ -8,7 +10,6 @@ from typing import (
 
 from gloe.transformers import Transformer
 
-
 In = TypeVar("In")
 ThenOut = TypeVar("ThenOut", covariant=True)
 ElseOut = TypeVar("ElseOut")
@@ -23,14 +24,28 @@ class Conditioner(
         self,
         implications: Sequence[_Implication[In, ThenOut]],
         else_transformer: Transformer[In, ElseOut],
+        mutually_exclusive: bool = False,
     ):
-        super().__init__(implications, else_transformer)
+        super().__init__(implications, else_transformer, mutually_exclusive)
         self.implications: Sequence[_Implication[In, ThenOut]] = implications
         self.else_transformer: Transformer[In, ElseOut] = else_transformer
 
     def transform(self, data: In) -> Union[ThenOut, ElseOut]:
-        for implication in self.implications:
-            if implication.condition(data):
+        implications = self.implications
+        for branch in self._evaluation_order:
+            implication = implications[branch]
+            holds = implication.condition(data)
+            if holds.__class__ is not bool and inspect.isawaitable(holds):
+                if inspect.iscoroutine(holds):
+                    holds.close()
+                name = getattr(implication.condition, "__name__", "")
+                raise TypeError(
+                    f"The condition {name} returned an awaitable on a sync "
+                    "conditioner. Async conditions must be async functions."
+                )
+            if holds:
+                self._observe(branch)
                 return implication.then_transformer(data)
 
+        self._observe(len(implications))
         return self.else_transformer(data)
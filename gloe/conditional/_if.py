@@ -1,9 +1,12 @@
 from gloe.async_transformer import AsyncTransformer
+from gloe.conditional._async_conditioner import _is_async_condition
 from gloe.base_transformer import BaseTransformer
 from gloe.exceptions import UnsupportedTransformerArgException
 from gloe.conditional._if_then_else import _IfThen, _AsyncIfThen, _BaseIfThen
 from gloe.conditional._implication import _Implication, _AsyncImplication
 from typing import (
+    Any,
+    Awaitable,
     Callable,
     Generic,
     TypeVar,
@@ -13,7 +16,6 @@ from typing import (
 
 from gloe.transformers import Transformer
 
-
 In = TypeVar("In")
 ThenOut = TypeVar("ThenOut", covariant=True)
 
@@ -31,15 +33,36 @@ class If(Generic[In]):
                 .Else(send_member_email)
             )
 
+    When the condition is an async callable, the resulting conditioner is always
+    async, no matter the transformers used in the branches.
+
     Args:
-        condition: callable returning a boolean.
+        condition: callable returning a boolean, or an async callable.
         name: optional argument that adds a label to condition node during plotting.
     """
 
-    def __init__(self, condition: Callable[[In], bool], name: Union[str, None] = None):
-        super().__init__()
-        self._condition = condition
-        self._name: str = name or condition.__name__
+    _condition: Callable[[In], Any]
+    _name: str
+
+    @overload
+    def __new__(
+        cls, condition: Callable[[In], Awaitable[bool]], name: Union[str, None] = None
+    ) -> "_AsyncIf[In]":
+        pass
+
+    @overload
+    def __new__(
+        cls, condition: Callable[[In], bool], name: Union[str, None] = None
+    ) -> "If[In]":
+        pass
+
+    def __new__(cls, condition: Any, name: Union[str, None] = None) -> Any:
+        if cls is If and _is_async_condition(condition):
+            cls = _AsyncIf
+        if_condition = super().__new__(cls)
+        if_condition._condition = condition
+        if_condition._name = name or condition.__name__
+        return if_condition
 
     @overload
     def Then(
@@ -73,7 +96,30 @@ class If(Generic[In]):
         raise UnsupportedTransformerArgException(next_transformer)
 
 
+class _AsyncIf(If[In]):
+    def Then(  # type: ignore[override]
+        self, next_transformer: BaseTransformer[In, ThenOut]
+    ) -> _AsyncIfThen[In, ThenOut, ThenOut]:
+        if not isinstance(next_transformer, BaseTransformer):
+            raise UnsupportedTransformerArgException(next_transformer)
+
+        async_implication = _AsyncImplication[In, ThenOut](
+            self._condition, next_transformer
+        )
+        return _AsyncIfThen[In, ThenOut, ThenOut](async_implication, name=self._name)
+
+
+@overload
+def condition(func: Callable[[In], Awaitable[bool]]) -> _AsyncIf[In]:
+    pass
+
+
+@overload
 def condition(func: Callable[[In], bool]) -> If[In]:
+    pass
+
+
+def condition(func):
     """
     The condition decorator is responsible to build an instance of :code:`If[T]`
     class given a :code:`Callable[[T], bool]`.
@@ -99,7 +145,7 @@ def condition(func: Callable[[In], bool]) -> If[In]:
 
     Args:
         func: A callable that check somenting about the incoming data and returns a
-            boolean.
+            boolean. It can also be an async callable.
     """
     condition = If(func, func.__name__)
     return condition
@@ -1,7 +1,7 @@
 from gloe.async_transformer import AsyncTransformer
 from gloe.base_transformer import BaseTransformer
 from gloe.exceptions import UnsupportedTransformerArgException
-from gloe.conditional._async_conditioner import AsyncConditioner
+from gloe.conditional._async_conditioner import AsyncConditioner, _is_async_condition
 from gloe.conditional._conditioner import Conditioner
 from gloe.conditional._implication import (
     _Implication,
@@ -10,6 +10,8 @@ from gloe.conditional._implication import (
 )
 
 from typing import (
+    Any,
+    Awaitable,
     Callable,
     Generic,
     Optional,
@@ -22,7 +24,6 @@ from typing import (
 from gloe.transformers import Transformer
 from gloe.utils import forget
 
-
 In = TypeVar("In")
 ThenOut = TypeVar("ThenOut", covariant=True)
 ElseOut = TypeVar("ElseOut")
@@ -62,20 +63,33 @@ class _IfThen(_BaseIfThen[In, ThenOut, PrevThenOut]):
 
     @overload
     def Else(
-        self, else_transformer: Transformer[In, ElseOut]
+        self,
+        else_transformer: Transformer[In, ElseOut],
+        mutually_exclusive: bool = False,
     ) -> Transformer[In, Union[ThenOut, PrevThenOut, ElseOut]]:
         pass
 
     @overload
     def Else(
-        self, else_transformer: AsyncTransformer[In, ElseOut]
+        self,
+        else_transformer: AsyncTransformer[In, ElseOut],
+        mutually_exclusive: bool = False,
     ) -> AsyncTransformer[In, Union[ThenOut, PrevThenOut, ElseOut]]:
         pass
 
-    def Else(self, else_transformer):
+    def Else(self, else_transformer, mutually_exclusive=False):
+        """
+        Args:
+            else_transformer: transformer executed when no condition holds.
+            mutually_exclusive: declares that at most one condition holds for any
+                data, so the conditions are checked in the order of how often
+                they hold instead of the declaration order.
+        """
         if isinstance(else_transformer, AsyncTransformer):
             new_atransformer: AsyncConditioner = AsyncConditioner(
-                self._implications, else_transformer
+                self._implications,
+                else_transformer,
+                mutually_exclusive=mutually_exclusive,
             )
             new_atransformer.__class__.__name__ = self._name
             new_atransformer._label = self._name
@@ -84,7 +98,7 @@ class _IfThen(_BaseIfThen[In, ThenOut, PrevThenOut]):
 
         elif isinstance(else_transformer, Transformer):
             new_transformer: Conditioner = Conditioner(
-                self._implications, else_transformer
+                self._implications, else_transformer, mutually_exclusive
             )
 
             new_transformer.__class__.__name__ = self._name
@@ -95,30 +109,64 @@ class _IfThen(_BaseIfThen[In, ThenOut, PrevThenOut]):
         raise NotImplementedError()
 
     def ElseNone(
-        self,
+        self, mutually_exclusive: bool = False
     ) -> Transformer[In, Optional[Union[ThenOut, PrevThenOut]]]:
         new_transformer: Conditioner[In, Union[ThenOut, PrevThenOut], None] = (
-            Conditioner(self._implications, forget)
+            Conditioner(self._implications, forget, mutually_exclusive)
         )
         new_transformer.__class__.__name__ = self.__class__.__name__
+        new_transformer._label = self._name
         return new_transformer
 
+    @overload
+    def ElseIf(
+        self, condition: Callable[[In], Awaitable[bool]]
+    ) -> "_AsyncElseIf[In, Union[ThenOut, PrevThenOut]]":
+        pass
+
+    @overload
     def ElseIf(
         self, condition: Callable[[In], bool]
     ) -> "_ElseIf[In, Union[ThenOut, PrevThenOut]]":
-        else_if: "_ElseIf[In, Union[ThenOut, PrevThenOut]]" = _ElseIf(
-            condition, self._implications, self._name
-        )
+        pass
+
+    def ElseIf(self, condition):
+        else_if: _BaseElseIf
+        if _is_async_condition(condition):
+            else_if = _AsyncElseIf(condition, self._implications, self._name)
+        else:
+            else_if = _ElseIf(condition, self._implications, self._name)
         else_if.__class__.__name__ = self.__class__.__name__
         return else_if
 
 
 class _AsyncIfThen(_BaseIfThen[In, ThenOut, PrevThenOut]):
     def Else(
-        self, else_transformer: BaseTransformer[In, ElseOut]
+        self,
+        else_transformer: BaseTransformer[In, ElseOut],
+        concurrent_conditions: bool = False,
+        speculative: bool = False,
+        mutually_exclusive: bool = False,
     ) -> AsyncTransformer[In, Union[ThenOut, PrevThenOut, ElseOut]]:
+        """
+        Args:
+            else_transformer: transformer executed when no condition holds.
+            concurrent_conditions: start all the async conditions at once. The
+                first condition that holds, in declaration order, is selected.
+            speculative: start the most frequently selected branch together with
+                the conditions, cancelling it if another branch is selected.
+            mutually_exclusive: declares that at most one condition holds for any
+                data, so the conditions are checked in the order of how often
+                they hold instead of the declaration order.
+        """
         new_transformer: AsyncConditioner[In, Union[ThenOut, PrevThenOut], ElseOut] = (
-            AsyncConditioner(self._implications, else_transformer)
+            AsyncConditioner(
+                self._implications,
+                else_transformer,
+                concurrent_conditions,
+                speculative,
+                mutually_exclusive,
+            )
         )
 
         new_transformer.__class__.__name__ = self._name
@@ -128,15 +176,25 @@ class _AsyncIfThen(_BaseIfThen[In, ThenOut, PrevThenOut]):
 
     def ElseNone(
         self,
+        concurrent_conditions: bool = False,
+        speculative: bool = False,
+        mutually_exclusive: bool = False,
     ) -> AsyncTransformer[In, Optional[Union[ThenOut, PrevThenOut]]]:
         new_transformer: AsyncConditioner[In, Union[ThenOut, PrevThenOut], None] = (
-            AsyncConditioner(self._implications, forget)
+            AsyncConditioner(
+                self._implications,
+                forget,
+                concurrent_conditions,
+                speculative,
+                mutually_exclusive,
+            )
         )
         new_transformer.__class__.__name__ = self.__class__.__name__
+        new_transformer._label = self._name
         return new_transformer
 
     def ElseIf(
-        self, condition: Callable[[In], bool]
+        self, condition: Callable[[In], Union[bool, Awaitable[bool]]]
     ) -> "_AsyncElseIf[In, Union[ThenOut, PrevThenOut]]":
         else_if: "_AsyncElseIf[In, Union[ThenOut, PrevThenOut]]" = _AsyncElseIf(
             condition, self._implications, self._name
@@ -148,7 +206,7 @@ class _AsyncIfThen(_BaseIfThen[In, ThenOut, PrevThenOut]):
 class _BaseElseIf(Generic[In, PrevThenOut]):
     def __init__(
         self,
-        condition: Callable[[In], bool],
+        condition: Callable[[In], Any],
         prev_implications: Sequence[_BaseImplication[In, PrevThenOut]],
         name: str,
     ):
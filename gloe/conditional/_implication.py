@@ -9,9 +9,11 @@ from gloe.base_transformer import BaseTransformer
 if sys.version_info >= (3, 10):
     pass
 from typing import (
+    Awaitable,
     Callable,
     Generic,
     TypeVar,
+    Union,
 )
 
 from gloe.transformers import Transformer
@@ -21,7 +23,7 @@ ThenOut = TypeVar("ThenOut", covariant=True)
 
 
 class _BaseImplication(Generic[In, ThenOut]):
-    condition: Callable[[In], bool]
+    condition: Callable[[In], Union[bool, Awaitable[bool]]]
     then_transformer: BaseTransformer[In, ThenOut]
 
     def copy(self) -> Self:
@@ -40,5 +42,5 @@ class _Implication(_BaseImplication[In, ThenOut]):
 
 @dataclass
 class _AsyncImplication(_BaseImplication[In, ThenOut]):
-    condition: Callable[[In], bool]
+    condition: Callable[[In], Union[bool, Awaitable[bool]]]
     then_transformer: BaseTransformer[In, ThenOut]
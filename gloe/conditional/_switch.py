@@ -0,0 +1,265 @@
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
+
+from typing_extensions import Self
+
+from gloe.async_transformer import AsyncTransformer
+from gloe.base_transformer import BaseTransformer
+from gloe.conditional._async_conditioner import AsyncConditioner
+from gloe.conditional._conditioner import Conditioner
+from gloe.conditional._implication import _AsyncImplication, _Implication
+from gloe.exceptions import UnsupportedTransformerArgException
+from gloe.transformers import Transformer
+from gloe.utils import forget
+
+In = TypeVar("In")
+Key = TypeVar("Key", bound=Hashable)
+CaseOut = TypeVar("CaseOut", covariant=True)
+NewCaseOut = TypeVar("NewCaseOut")
+DefaultOut = TypeVar("DefaultOut")
+
+
+def _case_condition(key: Callable[[Any], Any], value: Any) -> Callable[[Any], bool]:
+    def condition(data: Any) -> bool:
+        return key(data) == value
+
+    condition.__name__ = repr(value)
+    return condition
+
+
+class _BaseSwitchConditioner:
+    """
+    Dispatches to the transformer of the case whose value is equal to the computed
+    key through a single dict lookup. The implications are kept only to describe the
+    cases, so the signature and the plotting are the same of other conditioners.
+    """
+
+    implications: Any
+    else_transformer: Any
+    _observe: Callable[[int], None]
+
+    def _setup_cases(self, key: Callable[[Any], Any], values: Sequence[Any]):
+        self._key = key
+        self._case_values = list(values)
+        self._build_cases()
+
+    def _build_cases(self):
+        cases: dict[Any, int] = {}
+        for branch, value in enumerate(self._case_values):
+            cases.setdefault(value, branch)
+        self._cases = cases
+        self._branches: list[BaseTransformer] = [
+            *[implication.then_transformer for implication in self.implications],
+            self.else_transformer,
+        ]
+
+    def _dispatch(self, data: Any) -> BaseTransformer:
+        branch = self._cases.get(self._key(data), len(self._case_values))
+        self._observe(branch)
+        return self._branches[branch]
+
+
+class _SwitchConditioner(_BaseSwitchConditioner, Conditioner[In, CaseOut, DefaultOut]):
+    def transform(self, data: In) -> Union[CaseOut, DefaultOut]:
+        case_transformer = cast(Transformer, self._dispatch(data))
+        return case_transformer(data)
+
+    def copy(
+        self,
+        transform: Optional[Callable[[Self, In], Union[CaseOut, DefaultOut]]] = None,
+        regenerate_instance_id: bool = False,
+        force: bool = False,
+    ) -> Self:
+        copied = super().copy(transform, regenerate_instance_id, force)
+        copied._build_cases()
+        return copied
+
+
+class _AsyncSwitchConditioner(
+    _BaseSwitchConditioner, AsyncConditioner[In, CaseOut, DefaultOut]
+):
+    async def transform_async(self, data: In) -> Union[CaseOut, DefaultOut]:
+        case_transformer = self._dispatch(data)
+        if isinstance(case_transformer, AsyncTransformer):
+            return await case_transformer(data)
+        return cast(Transformer, case_transformer)(data)
+
+    def copy(
+        self,
+        transform: Optional[Callable[[Self, In], Union[CaseOut, DefaultOut]]] = None,
+        regenerate_instance_id: bool = False,
+        force: bool = False,
+    ) -> Self:
+        copied = super().copy(transform, regenerate_instance_id, force)
+        copied._build_cases()
+        return copied
+
+
+class _BaseSwitchCases(Generic[In, Key, CaseOut]):
+    def __init__(
+        self,
+        key: Callable[[In], Key],
+        name: str,
+        values: Sequence[Key],
+        transformers: Sequence[BaseTransformer[In, Any]],
+    ):
+        self._key = key
+        self._name = name
+        self._values = values
+        self._transformers = transformers
+
+    def _add_case(self, value: Key, transformer: BaseTransformer) -> dict[str, Any]:
+        if not isinstance(transformer, BaseTransformer):
+            raise UnsupportedTransformerArgException(transformer)
+        return {
+            "key": self._key,
+            "name": self._name,
+            "values": [*self._values, value],
+            "transformers": [*self._transformers, transformer],
+        }
+
+    def _build(self, default_transformer: BaseTransformer) -> BaseTransformer:
+        is_async = any(
+            isinstance(t, AsyncTransformer)
+            for t in [*self._transformers, default_transformer]
+        )
+        if is_async:
+            async_implications = [
+                _AsyncImplication(_case_condition(self._key, value), transformer)
+                for value, transformer in zip(self._values, self._transformers)
+            ]
+            async_switch: _AsyncSwitchConditioner = _AsyncSwitchConditioner(
+                async_implications, default_transformer
+            )
+            async_switch._setup_cases(self._key, self._values)
+            async_switch._label = self._name
+            return async_switch
+
+        implications: list[_Implication] = [
+            _Implication(_case_condition(self._key, value), cast(Transformer, t))
+            for value, t in zip(self._values, self._transformers)
+        ]
+        switch: _SwitchConditioner = _SwitchConditioner(
+            implications, default_transformer  # type: ignore[arg-type]
+        )
+        switch._setup_cases(self._key, self._values)
+        switch._label = self._name
+        return switch
+
+
+class _SwitchCases(_BaseSwitchCases[In, Key, CaseOut]):
+    @overload
+    def Case(
+        self, value: Key, transformer: Transformer[In, NewCaseOut]
+    ) -> "_SwitchCases[In, Key, Union[CaseOut, NewCaseOut]]":
+        pass
+
+    @overload
+    def Case(
+        self, value: Key, transformer: AsyncTransformer[In, NewCaseOut]
+    ) -> "_AsyncSwitchCases[In, Key, Union[CaseOut, NewCaseOut]]":
+        pass
+
+    def Case(self, value, transformer):
+        """Add a case executed when the key is equal to :code:`value`"""
+        cases = self._add_case(value, transformer)
+        if isinstance(transformer, AsyncTransformer):
+            return _AsyncSwitchCases(**cases)
+        return _SwitchCases(**cases)
+
+    @overload
+    def Default(
+        self, default_transformer: Transformer[In, DefaultOut]
+    ) -> Transformer[In, Union[CaseOut, DefaultOut]]:
+        pass
+
+    @overload
+    def Default(
+        self, default_transformer: AsyncTransformer[In, DefaultOut]
+    ) -> AsyncTransformer[In, Union[CaseOut, DefaultOut]]:
+        pass
+
+    def Default(self, default_transformer):
+        """Finish the switch with the transformer executed when no case matches"""
+        if not isinstance(default_transformer, BaseTransformer):
+            raise UnsupportedTransformerArgException(default_transformer)
+        return self._build(default_transformer)
+
+    def DefaultNone(self) -> Transformer[In, Optional[CaseOut]]:
+        """Finish the switch returning :code:`None` when no case matches"""
+        return self._build(forget)  # type: ignore[return-value]
+
+
+class _AsyncSwitchCases(_BaseSwitchCases[In, Key, CaseOut]):
+    def Case(
+        self, value: Key, transformer: BaseTransformer[In, NewCaseOut]
+    ) -> "_AsyncSwitchCases[In, Key, Union[CaseOut, NewCaseOut]]":
+        """Add a case executed when the key is equal to :code:`value`"""
+        return _AsyncSwitchCases(**self._add_case(value, transformer))
+
+    def Default(
+        self, default_transformer: BaseTransformer[In, DefaultOut]
+    ) -> AsyncTransformer[In, Union[CaseOut, DefaultOut]]:
+        """Finish the switch with the transformer executed when no case matches"""
+        if not isinstance(default_transformer, BaseTransformer):
+            raise UnsupportedTransformerArgException(default_transformer)
+        return self._build(default_transformer)  # type: ignore[return-value]
+
+    def DefaultNone(self) -> AsyncTransformer[In, Optional[CaseOut]]:
+        """Finish the switch returning :code:`None` when no case matches"""
+        return self._build(forget)  # type: ignore[return-value]
+
+
+class Switch(Generic[In, Key]):
+    """
+    It is used to start a keyed dispatch. Unlike :class:`If` chains, which check each
+    condition in order, the switch computes a key once and finds the case to be
+    executed with a single dict lookup, so its cost doesn't depend on the number of
+    cases. When many cases have the same value, the first one is used.
+
+    Example:
+        The below example routes each event to its handler::
+
+            handle_event = (
+                Switch(lambda event: event.kind, name="event_kind")
+                .Case("created", handle_creation)
+                .Case("updated", handle_update)
+                .Case("deleted", handle_deletion)
+                .Default(ignore_event)
+            )
+
+    Args:
+        key: callable computing a hashable key from the incoming data.
+        name: optional argument that adds a label to switch node during plotting.
+    """
+
+    def __init__(self, key: Callable[[In], Key], name: Union[str, None] = None):
+        super().__init__()
+        self._key = key
+        self._name: str = name or key.__name__
+
+    @overload
+    def Case(
+        self, value: Key, transformer: Transformer[In, CaseOut]
+    ) -> _SwitchCases[In, Key, CaseOut]:
+        pass
+
+    @overload
+    def Case(
+        self, value: Key, transformer: AsyncTransformer[In, CaseOut]
+    ) -> _AsyncSwitchCases[In, Key, CaseOut]:
+        pass
+
+    def Case(self, value, transformer):
+        """Add a case executed when the key is equal to :code:`value`"""
+        return _SwitchCases(self._key, self._name, [], []).Case(value, transformer)
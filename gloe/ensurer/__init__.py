@@ -1,4 +1,13 @@
-__all__ = ["TransformerEnsurer", "ensure"]
+__all__ = [
+    "TransformerEnsurer",
+    "AsyncTransformerEnsurer",
+    "ensure",
+    "configure_ensurers",
+]
 
-from gloe.ensurer._transformer_ensurer import TransformerEnsurer
+from gloe.ensurer._transformer_ensurer import (
+    TransformerEnsurer,
+    AsyncTransformerEnsurer,
+)
 from gloe.ensurer._ensure import ensure
+from gloe.ensurer._settings import configure_ensurers
@@ -1,4 +1,4 @@
-from typing import overload, Sequence, Callable, Any, TypeVar
+from typing import overload, Sequence, Callable, Any, TypeVar, Optional
 
 from gloe.ensurer._transformer_ensurer import (
     _ensure_incoming,
@@ -12,23 +12,46 @@ _S = TypeVar("_S")
 
 
 @overload
-def ensure(*, incoming: Sequence[Callable[[_T], Any]]) -> _ensure_incoming[_T]:
+def ensure(
+    *,
+    incoming: Sequence[Callable[[_T], Any]],
+    enabled: Optional[bool] = None,
+    sample_every: Optional[int] = None,
+    concurrent_incoming: bool = False,
+) -> _ensure_incoming[_T]:
     pass
 
 
 @overload
-def ensure(*, outcome: Sequence[Callable[[_S], Any]]) -> _ensure_outcome[_S]:
+def ensure(
+    *,
+    outcome: Sequence[Callable[[_S], Any]],
+    enabled: Optional[bool] = None,
+    sample_every: Optional[int] = None,
+    concurrent_incoming: bool = False,
+) -> _ensure_outcome[_S]:
     pass
 
 
 @overload
-def ensure(*, changes: Sequence[Callable[[_T, _S], Any]]) -> _ensure_changes[_T, _S]:
+def ensure(
+    *,
+    changes: Sequence[Callable[[_T, _S], Any]],
+    enabled: Optional[bool] = None,
+    sample_every: Optional[int] = None,
+    concurrent_incoming: bool = False,
+) -> _ensure_changes[_T, _S]:
     pass
 
 
 @overload
 def ensure(
-    *, incoming: Sequence[Callable[[_T], Any]], outcome: Sequence[Callable[[_S], Any]]
+    *,
+    incoming: Sequence[Callable[[_T], Any]],
+    outcome: Sequence[Callable[[_S], Any]],
+    enabled: Optional[bool] = None,
+    sample_every: Optional[int] = None,
+    concurrent_incoming: bool = False,
 ) -> _ensure_both[_T, _S]:
     pass
 
@@ -38,6 +61,9 @@ def ensure(
     *,
     incoming: Sequence[Callable[[_T], Any]],
     changes: Sequence[Callable[[_T, _S], Any]],
+    enabled: Optional[bool] = None,
+    sample_every: Optional[int] = None,
+    concurrent_incoming: bool = False,
 ) -> _ensure_both[_T, _S]:
     pass
 
@@ -47,6 +73,9 @@ def ensure(
     *,
     outcome: Sequence[Callable[[_T], Any]],
     changes: Sequence[Callable[[_T, _S], Any]],
+    enabled: Optional[bool] = None,
+    sample_every: Optional[int] = None,
+    concurrent_incoming: bool = False,
 ) -> _ensure_both[_T, _S]:
     pass
 
@@ -57,6 +86,9 @@ def ensure(
     incoming: Sequence[Callable[[_T], Any]],
     outcome: Sequence[Callable[[_S], Any]],
     changes: Sequence[Callable[[_T, _S], Any]],
+    enabled: Optional[bool] = None,
+    sample_every: Optional[int] = None,
+    concurrent_incoming: bool = False,
 ) -> _ensure_both[_T, _S]:
     pass
 
@@ -70,6 +102,9 @@ def ensure(*args, **kwargs):
     functions that validate certain aspects of the input, output, or the differences
     between them. If the validation fails, it must raise an exception.
 
+    Validators can also be async functions when the transformer is async. The async
+    validators of the same kind are executed concurrently.
+
     The decorator :code:`@ensure` returns some intermediate classes to assist with the
     internal logic of Gloe. However, the result of applying it to a transformer is just
     a new transformer with the exact same attributes, but it includes an additional
@@ -93,15 +128,30 @@ def ensure(*args, **kwargs):
             applied to both incoming and outcome data. The type :code:`_T` refers to the
             incoming type, and type :code:`_S` refers to the outcome type.
             Defaut value: :code:`[]`.
+        enabled (Optional[bool]): when :code:`False`, the transformer is returned
+            untouched, without any validation cost. Default value: the one defined
+            with :func:`gloe.ensurer.configure_ensurers`.
+        sample_every (Optional[int]): validate only one of every
+            :code:`sample_every` calls of the transformer. Default value: the one
+            defined with :func:`gloe.ensurer.configure_ensurers`.
+        concurrent_incoming (bool): on async transformers, execute the transformer
+            while the incoming data is being validated. If the validation fails,
+            the transformer is cancelled. Default value: :code:`False`.
     """
+    options = (
+        kwargs.pop("enabled", None),
+        kwargs.pop("sample_every", None),
+        kwargs.pop("concurrent_incoming", False),
+    )
+
     if len(kwargs.keys()) == 1 and "incoming" in kwargs:
-        return _ensure_incoming(kwargs["incoming"])
+        return _ensure_incoming(kwargs["incoming"], *options)
 
     if len(kwargs.keys()) == 1 and "outcome" in kwargs:
-        return _ensure_outcome(kwargs["outcome"])
+        return _ensure_outcome(kwargs["outcome"], *options)
 
     if len(kwargs.keys()) == 1 and "changes" in kwargs:
-        return _ensure_changes(kwargs["changes"])
+        return _ensure_changes(kwargs["changes"], *options)
 
     if len(kwargs.keys()) > 1:
         incoming = []
@@ -116,4 +166,4 @@ def ensure(*args, **kwargs):
         if "changes" in kwargs:
             changes = kwargs["changes"]
 
-        return _ensure_both(incoming, outcome, changes)
+        return _ensure_both(incoming, outcome, changes, *options)
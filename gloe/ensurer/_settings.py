@@ -0,0 +1,57 @@
+import itertools
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass
+class _EnsurerSettings:
+    enabled: bool = True
+    sample_every: int = 1
+
+
+_settings = _EnsurerSettings()
+
+
+def configure_ensurers(enabled: bool = True, sample_every: int = 1):
+    """
+    Define how the validations of the transformers decorated with :code:`@ensure` are
+    performed when the decorator doesn't say otherwise.
+
+    These settings are read when the decorator is applied, not when the transformer
+    is called, so they must be defined before the modules declaring the ensured
+    transformers are imported. Because of that, disabled ensurers have no cost at
+    all: the decorator returns the transformer untouched.
+
+    Example:
+        Validating only one of every 100 calls in production::
+
+            if settings.ENVIRONMENT == "production":
+                configure_ensurers(sample_every=100)
+
+    Args:
+        enabled: when :code:`False`, the validators are not attached to the
+            transformers.
+        sample_every: validate only one of every :code:`sample_every` calls of each
+            ensured transformer. The first call is always validated.
+    """
+    if sample_every < 1:
+        raise ValueError("The sample_every argument must be greater than zero.")
+
+    _settings.enabled = enabled
+    _settings.sample_every = sample_every
+
+
+def _sampler(sample_every: int) -> Optional[Callable[[], bool]]:
+    """
+    Returns a callable telling whether the current call must be validated, or
+    :code:`None` when all the calls must be.
+    """
+    if sample_every == 1:
+        return None
+
+    counter = itertools.count()
+
+    def should_validate() -> bool:
+        return next(counter) % sample_every == 0
+
+    return should_validate
@@ -1,13 +1,29 @@
+import asyncio
 import inspect
 from abc import abstractmethod, ABC
 from types import FunctionType
-from typing import Any, Callable, Generic, Sequence, TypeVar, cast, overload
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Generic,
+    Optional,
+    Sequence,
+    TypeVar,
+    cast,
+    overload,
+)
 
 from typing_extensions import ParamSpec
 
+from gloe._ensured_calls import _calls_var, _enter, _ensured_calls, _leave
+from gloe._executors import _discard
+from gloe._wrapper import _Wrapper
 from gloe.exceptions import UnsupportedEnsurerArgException
 from gloe.async_transformer import AsyncTransformer
 from gloe.transformers import Transformer
+from gloe.ensurer._settings import _settings, _sampler
 
 _T = TypeVar("_T")
 _S = TypeVar("_S")
@@ -25,7 +41,37 @@ class TransformerEnsurer(Generic[_T, _S], ABC):
         """Perform a validation on outcome data after execute the transformer code"""
 
 
+class AsyncTransformerEnsurer(TransformerEnsurer[_T, _S]):
+    """
+    Ensurer whose validations are awaited. It can only ensure async transformers, and
+    its validations are executed concurrently with the other async validations of
+    the same :code:`@ensure`.
+    """
+
+    @abstractmethod
+    async def validate_input(self, data: _T):
+        """Perform a validation on incoming data before execute the transformer code"""
+
+    @abstractmethod
+    async def validate_output(self, data: _T, output: _S):
+        """Perform a validation on outcome data after execute the transformer code"""
+
+
 def input_ensurer(func: Callable[[_T], Any]) -> TransformerEnsurer[_T, Any]:
+    if inspect.iscoroutinefunction(func):
+
+        class AsyncLambdaEnsurer(AsyncTransformerEnsurer[_T, _S]):
+            __doc__ = func.__doc__
+            __annotations__ = cast(FunctionType, func).__annotations__
+
+            async def validate_input(self, data: _T):
+                await func(data)
+
+            async def validate_output(self, data: _T, output: _S):  # pragma: no cover
+                pass
+
+        return AsyncLambdaEnsurer()
+
     class LambdaEnsurer(TransformerEnsurer[_T, _S]):
         __doc__ = func.__doc__
         __annotations__ = cast(FunctionType, func).__annotations__
@@ -50,6 +96,29 @@ def output_ensurer(func: Callable[[_S], Any]) -> TransformerEnsurer[Any, _S]:
 
 
 def output_ensurer(func: Callable):
+    only_output = len(inspect.signature(func).parameters) == 1
+
+    if inspect.iscoroutinefunction(func):
+
+        class AsyncLambdaEnsurer(AsyncTransformerEnsurer):
+            __doc__ = func.__doc__
+            __annotations__ = cast(FunctionType, func).__annotations__
+
+            async def validate_input(self, data):  # pragma: no cover
+                pass
+
+            if only_output:
+
+                async def validate_output(self, data, output):
+                    await func(output)
+
+            else:
+
+                async def validate_output(self, data, output):
+                    await func(data, output)
+
+        return AsyncLambdaEnsurer()
+
     class LambdaEnsurer(TransformerEnsurer):
         __doc__ = func.__doc__
         __annotations__ = cast(FunctionType, func).__annotations__
@@ -57,20 +126,176 @@ def output_ensurer(func: Callable):
         def validate_input(self, data):  # pragma: no cover
             pass
 
-        def validate_output(self, data, output):
-            if len(inspect.signature(func).parameters) == 1:
+        if only_output:
+
+            def validate_output(self, data, output):
                 func(output)
-            else:
+
+        else:
+
+            def validate_output(self, data, output):
                 func(data, output)
 
     return LambdaEnsurer()
 
 
+def _sync_ensurers(
+    ensurers: Sequence[TransformerEnsurer], node: Any
+) -> Sequence[TransformerEnsurer]:
+    for ensurer in ensurers:
+        if isinstance(ensurer, AsyncTransformerEnsurer):
+            raise UnsupportedEnsurerArgException(
+                f"{ensurer.__class__.__name__} is async and can't validate the sync "
+                f"transformer {node}"
+            )
+    return ensurers
+
+
+def _input_validation(
+    ensurers: Sequence[TransformerEnsurer],
+) -> Optional[Callable[[Any], None]]:
+    validators = tuple(ensurer.validate_input for ensurer in ensurers)
+    if len(validators) == 0:
+        return None
+    if len(validators) == 1:
+        return validators[0]
+
+    def validate_input(data):
+        for validator in validators:
+            validator(data)
+
+    return validate_input
+
+
+def _output_validation(
+    ensurers: Sequence[TransformerEnsurer],
+) -> Optional[Callable[[Any, Any], None]]:
+    validators = tuple(ensurer.validate_output for ensurer in ensurers)
+    if len(validators) == 0:
+        return None
+    if len(validators) == 1:
+        return validators[0]
+
+    def validate_output(data, output):
+        for validator in validators:
+            validator(data, output)
+
+    return validate_output
+
+
+async def _gather_validations(validations: Iterable[Awaitable[Any]]):
+    tasks = [asyncio.ensure_future(validation) for validation in validations]
+    if len(tasks) == 1:
+        await tasks[0]
+        return
+
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            _discard(task)
+        raise
+
+
+def _async_input_validation(
+    ensurers: Sequence[TransformerEnsurer],
+) -> Optional[Callable[[Any], Awaitable[None]]]:
+    """
+    The sync validators are executed first, one after another, then the async ones
+    are executed concurrently.
+    """
+    sync_validation = _input_validation(
+        [e for e in ensurers if not isinstance(e, AsyncTransformerEnsurer)]
+    )
+    async_validators = tuple(
+        e.validate_input for e in ensurers if isinstance(e, AsyncTransformerEnsurer)
+    )
+    if sync_validation is None and len(async_validators) == 0:
+        return None
+
+    async def validate_input(data):
+        if sync_validation is not None:
+            sync_validation(data)
+        if len(async_validators) > 0:
+            await _gather_validations(validator(data) for validator in async_validators)
+
+    return validate_input
+
+
+def _async_output_validation(
+    ensurers: Sequence[TransformerEnsurer],
+) -> Optional[Callable[[Any, Any], Awaitable[None]]]:
+    sync_validation = _output_validation(
+        [e for e in ensurers if not isinstance(e, AsyncTransformerEnsurer)]
+    )
+    async_validators = tuple(
+        e.validate_output for e in ensurers if isinstance(e, AsyncTransformerEnsurer)
+    )
+    if sync_validation is None and len(async_validators) == 0:
+        return None
+
+    async def validate_output(data, output):
+        if sync_validation is not None:
+            sync_validation(data, output)
+        if len(async_validators) > 0:
+            await _gather_validations(
+                validator(data, output) for validator in async_validators
+            )
+
+    return validate_output
+
+
+class _AsyncCopy(_Wrapper[_U, _S], AsyncTransformer[_U, _S]):
+    """
+    Sync node at the start or the end of an async pipeline, executed as an async
+    node so the async validators of the pipeline can be awaited around it.
+    """
+
+    async def transform_async(self, data: _U) -> _S:
+        return cast(Transformer[_U, _S], self.children[0]).transform(data)
+
+
+def _has_async_ensurers(ensurers: Sequence[TransformerEnsurer]) -> bool:
+    return any(isinstance(e, AsyncTransformerEnsurer) for e in ensurers)
+
+
+async def _transform_validating_input(
+    node: AsyncTransformer,
+    validate_input: Optional[Callable[[Any], Awaitable[None]]],
+    data: Any,
+    concurrently: bool,
+) -> Any:
+    if validate_input is None:
+        return await node.transform_async(data)
+
+    if not concurrently:
+        await validate_input(data)
+        return await node.transform_async(data)
+
+    transformation = asyncio.ensure_future(node.transform_async(data))
+    try:
+        await validate_input(data)
+    except BaseException:
+        _discard(transformation)
+        raise
+    return await transformation
+
+
 class _ensure_base:
-    def __init__(self):
-        self.input_ensurers_instances = []
-        self.output_ensurers_instances = []
-        self._input_data = None
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        sample_every: Optional[int] = None,
+        concurrent_incoming: bool = False,
+    ):
+        if sample_every is not None and sample_every < 1:
+            raise ValueError("The sample_every argument must be greater than zero.")
+
+        self.input_ensurers_instances: list[TransformerEnsurer] = []
+        self.output_ensurers_instances: list[TransformerEnsurer] = []
+        self._enabled = enabled
+        self._sample_every = sample_every
+        self._concurrent_incoming = concurrent_incoming
 
     @overload
     def __call__(self, transformer: Transformer[_U, _S]) -> Transformer[_U, _S]:
@@ -95,66 +320,91 @@ class _ensure_base:
         pass
 
     def __call__(self, arg):
+        if not isinstance(arg, (Transformer, AsyncTransformer)) and not callable(arg):
+            raise UnsupportedEnsurerArgException(arg)
+
+        enabled = _settings.enabled if self._enabled is None else self._enabled
+        if not enabled:
+            return arg
+
         if isinstance(arg, Transformer):
             return self._generate_new_transformer(arg)
         if isinstance(arg, AsyncTransformer):
             return self._generate_new_async_transformer(arg)
-        if callable(arg):
-            partial_transformer = arg
 
-            def ensured_partial_transformer(*args, **kwargs):
-                transformer = partial_transformer(*args, **kwargs)
-                if isinstance(transformer, Transformer):
-                    return self._generate_new_transformer(transformer)
-                if isinstance(transformer, AsyncTransformer):
-                    return self._generate_new_async_transformer(transformer)
+        partial_transformer = arg
+
+        def ensured_partial_transformer(*args, **kwargs):
+            transformer = partial_transformer(*args, **kwargs)
+            if isinstance(transformer, Transformer):
+                return self._generate_new_transformer(transformer)
+            if isinstance(transformer, AsyncTransformer):
+                return self._generate_new_async_transformer(transformer)
 
-                raise UnsupportedEnsurerArgException(transformer)
+            raise UnsupportedEnsurerArgException(transformer)
 
-            return ensured_partial_transformer
+        return ensured_partial_transformer
 
-        raise UnsupportedEnsurerArgException(arg)
+    def _sampler(self) -> Optional[Callable[[], bool]]:
+        sample_every = self._sample_every
+        if sample_every is None:
+            sample_every = _settings.sample_every
+        return _sampler(sample_every)
 
     def _generate_new_transformer(self, transformer: Transformer) -> Transformer:
         _flow = transformer._flow
         first_node = _flow[0]
         last_node = _flow[-1]
-
+        validate_input = _input_validation(
+            _sync_ensurers(self.input_ensurers_instances, transformer)
+        )
+        validate_output = _output_validation(
+            _sync_ensurers(self.output_ensurers_instances, transformer)
+        )
+        should_validate = self._sampler()
+        calls = _calls_var()
         if isinstance(first_node, Transformer) and len(transformer) == 1:
 
             def transform(_, data):
-                for ensurer in self.input_ensurers_instances:
-                    ensurer.validate_input(data)
+                if should_validate is not None and not should_validate():
+                    return transformer.transform(data)
+                if validate_input is not None:
+                    validate_input(data)
                 output = transformer.transform(data)
-                for ensurer in self.output_ensurers_instances:
-                    ensurer.validate_output(data, output)
+                if validate_output is not None:
+                    validate_output(data, output)
                 return output
 
             return transformer.copy(transform)
 
+        # the call is kept from the first node to the last one only when the last
+        # node validates the output
+        keeps_call = validate_output is not None and isinstance(last_node, Transformer)
+        if keeps_call:
+            _ensured_calls.enabled = True
+
         if isinstance(first_node, Transformer) and (
-            len(self.input_ensurers_instances) > 0
-            or len(self.output_ensurers_instances) > 0
+            validate_input is not None or validate_output is not None
         ):
 
             def transform(_, data):
-                for ensurer in self.input_ensurers_instances:
-                    ensurer.validate_input(data)
+                validating = should_validate is None or should_validate()
+                if validating and validate_input is not None:
+                    validate_input(data)
                 output = first_node.transform(data)
-                self._input_data = data
+                if keeps_call:
+                    _enter(calls, data, validating)
                 return output
 
             transformer._flow[0] = first_node.copy(transform)
 
-        if (
-            isinstance(last_node, Transformer)
-            and len(self.output_ensurers_instances) > 0
-        ):
+        if isinstance(last_node, Transformer) and validate_output is not None:
 
             def transform(_, data):
                 output = last_node.transform(data)
-                for ensurer in self.output_ensurers_instances:
-                    ensurer.validate_output(self._input_data, output)
+                call = _leave(calls)
+                if call.validating:
+                    validate_output(call.input_data, output)
                 return output
 
             transformer._flow[-1] = last_node.copy(transform)
@@ -164,64 +414,94 @@ class _ensure_base:
     def _generate_new_async_transformer(
         self, transformer: AsyncTransformer
     ) -> AsyncTransformer:
+        # a new list, so the segments compiled from the previous flow are discarded
+        transformer._flow = list(transformer._flow)
         _flow = transformer._flow
         first_node = _flow[0]
         last_node = _flow[-1]
+        input_ensurers = self.input_ensurers_instances
+        output_ensurers = self.output_ensurers_instances
+        should_validate = self._sampler()
+        concurrent_incoming = self._concurrent_incoming
+        calls = _calls_var()
 
         if isinstance(first_node, AsyncTransformer) and len(_flow) == 1:
+            validate_input_async = _async_input_validation(input_ensurers)
+            validate_output_async = _async_output_validation(output_ensurers)
 
             async def transform_async(_, data):
-                for ensurer in self.input_ensurers_instances:
-                    ensurer.validate_input(data)
-                output = await transformer.transform_async(data)
-                for ensurer in self.output_ensurers_instances:
-                    ensurer.validate_output(data, output)
+                if should_validate is not None and not should_validate():
+                    return await transformer.transform_async(data)
+                output = await _transform_validating_input(
+                    transformer, validate_input_async, data, concurrent_incoming
+                )
+                if validate_output_async is not None:
+                    await validate_output_async(data, output)
                 return output
 
             return transformer.copy(transform_async)
 
-        if (
-            len(self.input_ensurers_instances) > 0
-            or len(self.output_ensurers_instances) > 0
-        ):
+        keeps_call = len(output_ensurers) > 0
+        if keeps_call:
+            _ensured_calls.enabled = True
+
+        if isinstance(first_node, Transformer) and _has_async_ensurers(input_ensurers):
+            first_node = _AsyncCopy(first_node)
+        if isinstance(last_node, Transformer) and _has_async_ensurers(output_ensurers):
+            last_node = _AsyncCopy(last_node)
+
+        if len(input_ensurers) > 0 or len(output_ensurers) > 0:
             if isinstance(first_node, AsyncTransformer):
+                validate_first_async = _async_input_validation(input_ensurers)
 
                 async def transform_async(_, data):
-                    for ensurer in self.input_ensurers_instances:
-                        ensurer.validate_input(data)
-                    output = await first_node.transform_async(data)
-                    self._input_data = data
+                    validating = should_validate is None or should_validate()
+                    output = await _transform_validating_input(
+                        first_node,
+                        validate_first_async if validating else None,
+                        data,
+                        concurrent_incoming,
+                    )
+                    if keeps_call:
+                        _enter(calls, data, validating)
                     return output
 
                 transformer._flow[0] = first_node.copy(transform_async)
             elif isinstance(first_node, Transformer):
+                validate_first = _input_validation(input_ensurers)
 
                 def transform(_, data):
-                    for ensurer in self.input_ensurers_instances:
-                        ensurer.validate_input(data)
+                    validating = should_validate is None or should_validate()
+                    if validating and validate_first is not None:
+                        validate_first(data)
                     output = first_node.transform(data)
-                    self._input_data = data
+                    if keeps_call:
+                        _enter(calls, data, validating)
                     return output
 
                 transformer._flow[0] = first_node.copy(transform)
 
-        if len(self.output_ensurers_instances) > 0:
+        if len(output_ensurers) > 0:
             if isinstance(last_node, AsyncTransformer):
+                validate_last_async = _async_output_validation(output_ensurers)
 
                 async def transform_async(_, data):
                     output = await last_node.transform_async(data)
-                    for ensurer in self.output_ensurers_instances:
-                        ensurer.validate_output(self._input_data, output)
+                    call = _leave(calls)
+                    if call.validating and validate_last_async is not None:
+                        await validate_last_async(call.input_data, output)
                     return output
 
                 transformer._flow[-1] = last_node.copy(transform_async)
 
             elif isinstance(last_node, Transformer):
+                validate_last = _output_validation(output_ensurers)
 
                 def transform(_, data):
                     output = last_node.transform(data)
-                    for ensurer in self.output_ensurers_instances:
-                        ensurer.validate_output(self._input_data, output)
+                    call = _leave(calls)
+                    if call.validating and validate_last is not None:
+                        validate_last(call.input_data, output)
                     return output
 
                 transformer._flow[-1] = last_node.copy(transform)
@@ -230,22 +510,40 @@ class _ensure_base:
 
 
 class _ensure_incoming(Generic[_T], _ensure_base):
-    def __init__(self, incoming: Sequence[Callable[[_T], Any]]):
-        super().__init__()
+    def __init__(
+        self,
+        incoming: Sequence[Callable[[_T], Any]],
+        enabled: Optional[bool] = None,
+        sample_every: Optional[int] = None,
+        concurrent_incoming: bool = False,
+    ):
+        super().__init__(enabled, sample_every, concurrent_incoming)
         self.input_ensurers_instances = [input_ensurer(ensurer) for ensurer in incoming]
 
 
 class _ensure_outcome(Generic[_S], _ensure_base):
-    def __init__(self, incoming: Sequence[Callable[[_S], Any]]):
-        super().__init__()
+    def __init__(
+        self,
+        incoming: Sequence[Callable[[_S], Any]],
+        enabled: Optional[bool] = None,
+        sample_every: Optional[int] = None,
+        concurrent_incoming: bool = False,
+    ):
+        super().__init__(enabled, sample_every, concurrent_incoming)
         self.output_ensurers_instances = [
             output_ensurer(ensurer) for ensurer in incoming
         ]
 
 
 class _ensure_changes(Generic[_T, _S], _ensure_base):
-    def __init__(self, changes: Sequence[Callable[[_T, _S], Any]]):
-        super().__init__()
+    def __init__(
+        self,
+        changes: Sequence[Callable[[_T, _S], Any]],
+        enabled: Optional[bool] = None,
+        sample_every: Optional[int] = None,
+        concurrent_incoming: bool = False,
+    ):
+        super().__init__(enabled, sample_every, concurrent_incoming)
         self.output_ensurers_instances = [
             output_ensurer(ensurer) for ensurer in changes
         ]
@@ -257,8 +555,11 @@ class _ensure_both(Generic[_T, _S], _ensure_base):
         incoming: Sequence[Callable[[_T], Any]],
         outcome: Sequence[Callable[[_S], Any]],
         changes: Sequence[Callable[[_T, _S], Any]],
+        enabled: Optional[bool] = None,
+        sample_every: Optional[int] = None,
+        concurrent_incoming: bool = False,
     ):
-        super().__init__()
+        super().__init__(enabled, sample_every, concurrent_incoming)
         incoming_seq = incoming if isinstance(incoming, list) else [incoming]
         self.input_ensurers_instances = [
             input_ensurer(ensurer) for ensurer in incoming_seq
@@ -0,0 +1,5 @@
+__all__ = ["configure_event_loop", "offload", "with_executor"]
+
+from gloe.executors._event_loop import configure_event_loop
+from gloe.executors._offload import offload
+from gloe.executors._with_executor import with_executor
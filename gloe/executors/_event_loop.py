@@ -0,0 +1,32 @@
+from gloe._sync_runner import _sync_runner
+
+
+def configure_event_loop(uvloop: bool = False):
+    """
+    Define how the event loops running the sync calls of the async pipelines, made
+    with :meth:`AsyncTransformer.run_sync` and
+    :meth:`AsyncTransformer.run_sync_many`, are created.
+
+    The first loop is created on the first sync call, so this function must be
+    called before it.
+
+    Args:
+        uvloop: when :code:`True`, the loops are created by the uvloop package,
+            which must be installed.
+    """
+    if _sync_runner.started:
+        raise RuntimeError(
+            "The event loop was already started by a sync call of an async pipeline."
+        )
+
+    if uvloop:
+        try:
+            import uvloop as _uvloop  # noqa: F401
+        except ImportError as err:
+            raise ImportError(
+                "Please, the module uvloop is required for this option, install "
+                + """with "pip install uvloop". More information is available in """
+                + "https://uvloop.readthedocs.io"
+            ) from err
+
+    _sync_runner.use_uvloop = uvloop
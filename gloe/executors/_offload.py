@@ -0,0 +1,54 @@
+from concurrent.futures import Executor
+from typing import Optional, TypeVar
+
+from gloe._executors import _offload
+from gloe._wrapper import _Wrapper
+from gloe.async_transformer import AsyncTransformer
+from gloe.exceptions import UnsupportedTransformerArgException
+from gloe.transformers import Transformer, _execute_flow
+
+_In = TypeVar("_In")
+_Out = TypeVar("_Out")
+
+
+class _Offloaded(_Wrapper[_In, _Out], AsyncTransformer[_In, _Out]):
+    """Executes a sync pipeline in an executor, awaiting its result"""
+
+    def __init__(
+        self, transformer: Transformer[_In, _Out], executor: Optional[Executor]
+    ):
+        super().__init__(transformer)
+        self._executor = executor
+
+    async def transform_async(self, data: _In) -> _Out:
+        return await _offload(
+            self._executor, _execute_flow, self.children[0]._flow, data
+        )
+
+
+def offload(
+    transformer: Transformer[_In, _Out], executor: Optional[Executor] = None
+) -> AsyncTransformer[_In, _Out]:
+    """
+    Build an async transformer that executes the sync :code:`transformer` in a
+    thread, so a blocking step of an async pipeline doesn't stall the other
+    coroutines of the event loop.
+
+    The transformer runs inside a copy of the caller's context, like with
+    :func:`asyncio.to_thread`, and the context variables it changes are brought back,
+    so bridges, hooks and ensurers behave as if it was executed inline.
+
+    Example:
+        Parsing large documents between two network calls::
+
+            pipeline = download_document >> offload(parse_pdf) >> store_document
+
+    Args:
+        transformer: the sync transformer, or pipeline, to be offloaded.
+        executor: the executor running the transformer. By default, the default
+            executor of the event loop is used.
+    """
+    if isinstance(transformer, Transformer):
+        return _Offloaded(transformer, executor)
+
+    raise UnsupportedTransformerArgException(transformer)
@@ -0,0 +1,154 @@
+from concurrent.futures import Executor
+from typing import Optional, TypeVar, cast, get_args, overload
+
+from gloe._executors import OffloadPolicy, _current_scope, _ExecutorScope, _offloads
+from gloe._wrapper import _Wrapper
+from gloe.async_transformer import AsyncTransformer, _execute_async_flow
+from gloe.base_transformer import BaseTransformer
+from gloe.exceptions import UnsupportedTransformerArgException
+from gloe.transformers import Transformer, _execute_flow
+
+_In = TypeVar("_In")
+_Out = TypeVar("_Out")
+
+
+class _BaseWithExecutor(_Wrapper[_In, _Out]):
+    """
+    Encapsulates a pipeline and schedules the branches of its parallel gateways in
+    an executor while it is executing.
+    """
+
+    def __init__(
+        self,
+        transformer: BaseTransformer[_In, _Out],
+        executor: Executor,
+        inline_below: float,
+        offload: Optional[OffloadPolicy],
+        eager: bool,
+    ):
+        super().__init__(transformer)
+        self._scope = _ExecutorScope(executor, inline_below, offload, {}, eager)
+
+    @property
+    def executor(self) -> Executor:
+        """Executor receiving the branches of the parallel gateways"""
+        return self._scope.executor
+
+
+class _TransformerWithExecutor(_BaseWithExecutor[_In, _Out], Transformer[_In, _Out]):
+    def transform(self, data: _In) -> _Out:
+        token = _current_scope.set(self._scope)
+        try:
+            return _execute_flow(self.children[0]._flow, data)
+        finally:
+            _current_scope.reset(token)
+
+
+class _AsyncTransformerWithExecutor(
+    _BaseWithExecutor[_In, _Out], AsyncTransformer[_In, _Out]
+):
+    async def transform_async(self, data: _In) -> _Out:
+        token = _current_scope.set(self._scope)
+        try:
+            pipeline = cast(AsyncTransformer, self.children[0])
+            return await _execute_async_flow(pipeline._flow, data, pipeline._segments())
+        finally:
+            _current_scope.reset(token)
+
+
+@overload
+def with_executor(
+    transformer: Transformer[_In, _Out],
+    executor: Executor,
+    inline_below: float = 0.0001,
+    offload: Optional[OffloadPolicy] = None,
+    eager: bool = False,
+) -> Transformer[_In, _Out]:
+    pass
+
+
+@overload
+def with_executor(
+    transformer: AsyncTransformer[_In, _Out],
+    executor: Executor,
+    inline_below: float = 0.0001,
+    offload: Optional[OffloadPolicy] = None,
+    eager: bool = False,
+) -> AsyncTransformer[_In, _Out]:
+    pass
+
+
+def with_executor(
+    transformer, executor, inline_below=0.0001, offload=None, eager=False
+):
+    """
+    Build a new pipeline that behaves exactly like :code:`transformer`, but executes
+    the branches of its parallel gateways concurrently, using :code:`executor`.
+
+    Each gateway keeps a moving average of how long each of its branches takes and
+    submits the longest ones first, so a pool smaller than the number of branches
+    isn't left waiting for a long branch submitted last. The branches usually
+    faster than :code:`inline_below` seconds aren't worth the cost of the executor
+    and are executed by the calling thread while the others run. In async
+    pipelines, the async branches run as tasks of the event loop and only the sync
+    ones are sent to the executor.
+
+    Async pipelines can also send their sync stages to the executor, so a blocking
+    stage doesn't stall the other coroutines of the event loop. With
+    :code:`offload="thread"`, every sync stage is offloaded. With
+    :code:`offload="auto"`, each stage is measured and only the ones usually slower
+    than :code:`inline_below` seconds are offloaded.
+
+    With :code:`eager=True`, the async branches and partitions of the pipeline are
+    started right away, in the calling task, like with
+    :func:`asyncio.eager_task_factory`. A branch finishing without suspending, like
+    one reading a warm cache, never becomes a task nor waits for the event loop.
+    Only the branches that really suspend are scheduled as tasks.
+
+    The branches and the offloaded stages run inside a copy of the caller's
+    context, so bridges and hooks keep working. The gateways nested in a branch
+    already running in the executor execute their own branches sequentially, which
+    avoids a branch waiting for others queued behind it.
+
+    Example:
+        Fetching the data of a user from many services::
+
+            fetch_user_data = get_user >> (
+                get_user_posts,
+                get_user_followers,
+                get_user_likes,
+            )
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                concurrent_fetch = with_executor(fetch_user_data, pool)
+                user_data = concurrent_fetch(user_id)
+
+    Args:
+        transformer: the pipeline to be executed.
+        executor: the executor receiving the branches, usually a
+            :class:`concurrent.futures.ThreadPoolExecutor`.
+        inline_below: estimated duration, in seconds, under which a branch or a sync
+            stage is executed in the calling thread. Branches and stages never
+            executed before are always considered long.
+        offload: policy for the sync stages of async pipelines, :code:`"thread"`
+            or :code:`"auto"`. By default, they are executed in the event loop.
+        eager: whether the concurrent async branches are started eagerly.
+    """
+    if offload is not None:
+        if offload not in get_args(OffloadPolicy):
+            raise ValueError(
+                f"Unknown offload policy {offload!r}. "
+                f"Use one of {', '.join(map(repr, get_args(OffloadPolicy)))}."
+            )
+        _offloads.enabled = True
+
+    if isinstance(transformer, AsyncTransformer):
+        return _AsyncTransformerWithExecutor(
+            transformer, executor, inline_below, offload, eager
+        )
+    if isinstance(transformer, Transformer):
+        return _TransformerWithExecutor(
+            transformer, executor, inline_below, offload, eager
+        )
+
+    raise UnsupportedTransformerArgException(transformer)
@@ -1,6 +1,6 @@
-from contextvars import ContextVar
-from typing import Generic, TypeVar
+from typing import Generic, TypeVar, cast
 
+from gloe._execution_context import _current_execution, _executions
 from gloe.transformers import Transformer
 
 T = TypeVar("T")
@@ -16,38 +16,49 @@ class EmptyBridgeOnDrop(Exception):
 
 
 class _pick(Generic[T], Transformer[T, T]):
-    def __init__(self, variable: ContextVar[T]):
+    def __init__(self, bridge: "bridge[T]"):
         super().__init__()
         self.plotting_settings.invisible = True
-        self.variable = variable
+        self._bridge = bridge
 
     def transform(self, data: T) -> T:
-        self.variable.set(data)
+        execution = _current_execution.get()
+        if execution is not None:
+            execution.values[self._bridge] = data
         return data
 
 
 class _drop(Generic[B, T], Transformer[B, tuple[B, T]]):
-    def __init__(self, variable: ContextVar[T]):
+    def __init__(self, bridge: "bridge[T]"):
         super().__init__()
         self.plotting_settings.invisible = True
-        self._variable = variable
+        self._bridge = bridge
 
     def transform(self, data: B) -> tuple[B, T]:
-        current_value: T
-        try:
-            current_value = self._variable.get()
-        except LookupError:
-            raise EmptyBridgeOnDrop(self._variable.name)
-        return data, current_value
+        execution = _current_execution.get()
+        if execution is None or self._bridge not in execution.values:
+            raise EmptyBridgeOnDrop(self._bridge.name)
+        return data, cast(T, execution.values[self._bridge])
 
 
 class bridge(Generic[T]):
+    """
+    Carries a value picked in some point of a pipeline to a later point of it.
+
+    The picked values are kept in the execution context of the pipeline invocation,
+    so they are released when the invocation finishes and never leak to other
+    invocations running concurrently. Stages offloaded to other threads see the
+    values only when they run inside a copy of the caller context, as with
+    :func:`asyncio.to_thread` or :code:`contextvars.copy_context().run`.
+    """
+
     def __init__(self, name: str):
-        self._variable: ContextVar[T] = ContextVar(name)
+        self.name = name
+        _executions.enabled = True
 
     def pick(self) -> Transformer[T, T]:
-        return _pick(self._variable)
+        return _pick(self)
 
     def drop(self) -> Transformer[B, tuple[B, T]]:
-        drop: _drop[B, T] = _drop(self._variable)
+        drop: _drop[B, T] = _drop(self)
         return drop
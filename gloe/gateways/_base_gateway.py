@@ -58,6 +58,7 @@ class _base_gateway(Generic[_In], BaseTransformer[_In, Any]):
         net.add_node(
             in_converge_id,
             _label="gateway_begin",
+            _owner=self,
             **dot_props(NodeType.ParallelGatewayBegin),
         )
 
@@ -1,6 +1,13 @@
-from typing import Any, TypeVar
-from typing_extensions import cast, TypeAlias
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+from typing_extensions import cast, Self, TypeAlias
 
+from gloe._executors import (
+    _BranchCosts,
+    _current_scope,
+    _run_scheduled,
+    _run_scheduled_async,
+)
 from gloe.base_transformer import BaseTransformer
 from gloe.async_transformer import AsyncTransformer, _execute_async_flow
 from gloe.gateways._base_gateway import _base_gateway
@@ -15,8 +22,38 @@ BTrf: TypeAlias = BaseTransformer
 ATrf: TypeAlias = AsyncTransformer
 
 
-class _Parallel(_base_gateway[_In], Transformer[_In, tuple[Any, ...]]):
+class _BaseParallel(_base_gateway[_In]):
+    """
+    Executes all the branches with the same input. Inside a :func:`with_executor`
+    scope, the branches are scheduled in the executor according to the estimated
+    duration of each one, otherwise they are executed one after the other.
+    """
+
+    def __init__(self, *transformers: BaseTransformer[_In, Any]):
+        super().__init__(*transformers)
+        self._costs = _BranchCosts(len(self._children))
+
+    def _copy(
+        self,
+        transform: Optional[Callable[..., Any]] = None,
+        regenerate_instance_id: bool = False,
+        transform_method: str = "transform",
+        force: bool = False,
+    ) -> Self:
+        copied: Self = super()._copy(
+            transform, regenerate_instance_id, transform_method, force
+        )
+        copied._costs = _BranchCosts(len(copied._children))
+        return copied
+
+
+class _Parallel(_BaseParallel[_In], Transformer[_In, tuple[Any, ...]]):
     def transform(self, data: _In) -> tuple[Any, ...]:
+        scope = _current_scope.get()
+        if scope is not None:
+            branches = [partial(_execute_flow, t._flow) for t in self._children]
+            return tuple(_run_scheduled(scope, self._costs, branches, data))
+
         results = []
         for transformer in self._children:
             result = _execute_flow(transformer._flow, data)
@@ -24,12 +61,37 @@ class _Parallel(_base_gateway[_In], Transformer[_In, tuple[Any, ...]]):
         return tuple(results)
 
 
-class _ParallelAsync(_base_gateway[_In], AsyncTransformer[_In, tuple[Any, ...]]):
+class _ParallelAsync(_BaseParallel[_In], AsyncTransformer[_In, tuple[Any, ...]]):
     async def transform_async(self, data: _In) -> tuple[Any, ...]:
+        scope = _current_scope.get()
+        if scope is not None:
+            branches = []
+            async_branches = []
+            for transformer in self._children:
+                if isinstance(transformer, AsyncTransformer):
+                    branches.append(
+                        partial(
+                            _execute_async_flow,
+                            transformer._flow,
+                            segments=transformer._segments(),
+                        )
+                    )
+                    async_branches.append(True)
+                else:
+                    branches.append(partial(_execute_flow, transformer._flow))
+                    async_branches.append(False)
+            return tuple(
+                await _run_scheduled_async(
+                    scope, self._costs, branches, async_branches, data
+                )
+            )
+
         results = []
         for transformer in self._children:
             if isinstance(transformer, AsyncTransformer):
-                result = await _execute_async_flow(transformer._flow, data)
+                result = await _execute_async_flow(
+                    transformer._flow, data, transformer._segments()
+                )
             else:
                 result = _execute_flow(transformer._flow, data)
             results.append(result)
@@ -25,7 +25,9 @@ class _SequentialAsync(_base_gateway[_In], AsyncTransformer[_In, tuple[Any, ...]
         results = []
         for transformer in self._children:
             if isinstance(transformer, AsyncTransformer):
-                result = await _execute_async_flow(transformer._flow, data)
+                result = await _execute_async_flow(
+                    transformer._flow, data, transformer._segments()
+                )
             else:
                 result = _execute_flow(transformer._flow, data)
             results.append(result)
@@ -0,0 +1,5 @@
+__all__ = ["TransformerHook", "register_hook", "unregister_hook", "with_hooks"]
+
+from gloe._hooks import TransformerHook
+from gloe.hooks._registry import register_hook, unregister_hook
+from gloe.hooks._with_hooks import with_hooks
@@ -0,0 +1,36 @@
+from gloe._hooks import TransformerHook, _registry
+
+
+def register_hook(hook: TransformerHook):
+    """
+    Register a hook globally. It will be called around every transformer executed by
+    any pipeline until it is unregistered.
+
+    Example:
+        Counting how many times each transformer was executed::
+
+            class CallCounter(TransformerHook):
+                def __init__(self):
+                    self.calls = Counter()
+
+                def on_end(self, transformer, data, output):
+                    self.calls[transformer.label] += 1
+
+            counter = CallCounter()
+            register_hook(counter)
+
+    Args:
+        hook: the hook to be registered.
+    """
+    _registry.register(hook)
+
+
+def unregister_hook(hook: TransformerHook):
+    """
+    Remove a hook previously registered by :func:`register_hook`. When there are no
+    hooks left, the pipelines go back to the execution path without hooks dispatching.
+
+    Args:
+        hook: the hook to be unregistered.
+    """
+    _registry.unregister(hook)
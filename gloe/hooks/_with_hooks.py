@@ -0,0 +1,110 @@
+from typing import Any, TypeVar, cast, overload
+
+from gloe._hooks import TransformerHook, _registry
+from gloe._wrapper import _Wrapper
+from gloe.async_transformer import AsyncTransformer, _execute_async_flow
+from gloe.base_transformer import BaseTransformer
+from gloe.exceptions import UnsupportedTransformerArgException
+from gloe.transformers import Transformer, _execute_flow
+
+_In = TypeVar("_In")
+_Out = TypeVar("_Out")
+
+
+class _BaseHooked(_Wrapper[_In, _Out]):
+    """Encapsulates a pipeline and enables some hooks while it is executing"""
+
+    def __init__(self, transformer: BaseTransformer[_In, _Out], *hooks):
+        super().__init__(transformer)
+        self._hooks: tuple[TransformerHook, ...] = hooks
+
+    @property
+    def hooks(self) -> tuple[TransformerHook, ...]:
+        """Hooks enabled during the execution of this pipeline"""
+        return self._hooks
+
+    def _on_start(self, data: Any):
+        for hook in self._hooks:
+            hook.on_start(self, data)
+
+    def _on_end(self, data: Any, output: Any):
+        for hook in reversed(self._hooks):
+            hook.on_end(self, data, output)
+
+    def _on_error(self, data: Any, exception: BaseException):
+        for hook in reversed(self._hooks):
+            hook.on_error(self, data, exception)
+
+
+class _HookedTransformer(_BaseHooked[_In, _Out], Transformer[_In, _Out]):
+    def transform(self, data: _In) -> _Out:
+        with _registry.scope(self._hooks):
+            self._on_start(data)
+            try:
+                output = _execute_flow(self.children[0]._flow, data)
+            except BaseException as exception:
+                self._on_error(data, exception)
+                raise
+            self._on_end(data, output)
+            return output
+
+
+class _HookedAsyncTransformer(_BaseHooked[_In, _Out], AsyncTransformer[_In, _Out]):
+    async def transform_async(self, data: _In) -> _Out:
+        with _registry.scope(self._hooks):
+            self._on_start(data)
+            try:
+                pipeline = cast(AsyncTransformer, self.children[0])
+                output = await _execute_async_flow(
+                    pipeline._flow, data, pipeline._segments()
+                )
+            except BaseException as exception:
+                self._on_error(data, exception)
+                raise
+            self._on_end(data, output)
+            return output
+
+
+@overload
+def with_hooks(
+    transformer: Transformer[_In, _Out], *hooks: TransformerHook
+) -> Transformer[_In, _Out]:
+    pass
+
+
+@overload
+def with_hooks(
+    transformer: AsyncTransformer[_In, _Out], *hooks: TransformerHook
+) -> AsyncTransformer[_In, _Out]:
+    pass
+
+
+def with_hooks(transformer, *hooks):
+    """
+    Build a new pipeline that behaves exactly like :code:`transformer`, but calls the
+    given hooks around its whole execution and around each transformer executed
+    during it, including the ones executed inside collections, gateways and
+    conditionals.
+
+    The hooks are only enabled while this pipeline is running. It can be composed
+    with other transformers like any other transformer.
+
+    Example:
+        Logging every step of a single pipeline::
+
+            class LogHook(TransformerHook):
+                def on_start(self, transformer, data):
+                    logger.debug("%s <- %r", transformer.label, data)
+
+            logged_pipeline = with_hooks(get_users >> Map(get_user_posts), LogHook())
+
+    Args:
+        transformer: the pipeline to be executed with the hooks.
+        *hooks: the hooks enabled during the pipeline execution.
+    """
+    if isinstance(transformer, AsyncTransformer):
+        return _HookedAsyncTransformer(transformer, *hooks)
+    if isinstance(transformer, Transformer):
+        return _HookedTransformer(transformer, *hooks)
+
+    raise UnsupportedTransformerArgException(transformer)
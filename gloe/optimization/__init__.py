@@ -0,0 +1,11 @@
+__all__ = [
+    "optimize",
+    "eliminate_identities",
+    "fuse_collections",
+    "share_prefixes",
+]
+
+from gloe.optimization._optimize import optimize
+from gloe.optimization._fusion import fuse_collections
+from gloe.optimization._identities import eliminate_identities
+from gloe.optimization._prefixes import share_prefixes
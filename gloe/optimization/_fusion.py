@@ -0,0 +1,110 @@
+from typing import Any, Callable, Iterable, cast
+
+from gloe.async_transformer import AsyncTransformer
+from gloe.base_transformer import BaseTransformer, Flow
+from gloe.collection import Filter, FilterAsync, Map, MapAsync
+from gloe.transformers import Transformer
+
+_MAPS = (Map, MapAsync)
+_FILTERS = (Filter, FilterAsync)
+
+# each stage is a pair of a transformer applied to the item and whether it filters
+# the item or maps it
+Stage = tuple[Callable[[Any], Any], bool]
+
+
+def _stage(node: BaseTransformer) -> Stage:
+    item_transformer = cast(Callable[[Any], Any], node.children[0])
+    return item_transformer, type(node) in _FILTERS
+
+
+class _FusedCollection(Transformer[Iterable[Any], list[Any]]):
+    """
+    Applies consecutive maps and filters to each item in a single pass, without
+    building the intermediate lists.
+    """
+
+    def __init__(self, stages: list[Stage], label: str):
+        super().__init__()
+        self._stages = stages
+        self._label = label
+        self._children = [cast(BaseTransformer, stage) for stage, _ in stages]
+
+    def transform(self, data: Iterable[Any]) -> list[Any]:
+        stages = self._stages
+        result = []
+        for item in data:
+            for stage, is_filter in stages:
+                if is_filter:
+                    if not stage(item):
+                        break
+                else:
+                    item = stage(item)
+            else:
+                result.append(item)
+        return result
+
+
+class _FusedCollectionAsync(AsyncTransformer[Iterable[Any], list[Any]]):
+    def __init__(self, stages: list[Stage], label: str):
+        super().__init__()
+        self._stages = [
+            (stage, is_filter, isinstance(stage, AsyncTransformer))
+            for stage, is_filter in stages
+        ]
+        self._label = label
+        self._children = [cast(BaseTransformer, stage) for stage, _ in stages]
+
+    async def transform_async(self, data: Iterable[Any]) -> list[Any]:
+        stages = self._stages
+        result = []
+        for item in data:
+            for stage, is_filter, is_async in stages:
+                output = await stage(item) if is_async else stage(item)
+                if is_filter:
+                    if not output:
+                        break
+                else:
+                    item = output
+            else:
+                result.append(item)
+        return result
+
+
+def _fuse(nodes: Flow) -> BaseTransformer:
+    stages = [_stage(node) for node in nodes]
+    label = " >> ".join(node.label for node in nodes)
+    if any(isinstance(node, AsyncTransformer) for node in nodes):
+        return _FusedCollectionAsync(stages, label)
+    return _FusedCollection(stages, label)
+
+
+def fuse_collections(flow: Flow) -> Flow:
+    """
+    Fuse runs of consecutive :class:`Map`, :class:`Filter`, :class:`MapAsync` and
+    :class:`FilterAsync` into a single node, which takes each item through all the
+    stages before taking the next one. So, a chain like
+    :code:`Map(f) >> Map(g) >> Filter(p) >> Map(h)` makes a single pass over the data
+    instead of four, and the three intermediate lists are never built.
+
+    The outputs are the same, but the stages are interleaved: :code:`g` receives the
+    first item before :code:`f` receives the second one. Stages whose side effects
+    depend on the previous stage having processed every item shouldn't be fused.
+    The items are still processed one at a time, in order, like in :class:`MapAsync`.
+    """
+    optimized: Flow = []
+    run: Flow = []
+    for node in [*flow, None]:
+        if node is not None and type(node) in (*_MAPS, *_FILTERS):
+            run.append(node)
+            continue
+
+        if len(run) > 1:
+            optimized.append(_fuse(run))
+        else:
+            optimized.extend(run)
+        run = []
+
+        if node is not None:
+            optimized.append(node)
+    return optimized
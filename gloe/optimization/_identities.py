@@ -0,0 +1,59 @@
+from typing import Optional
+
+from gloe.base_transformer import BaseTransformer, Flow
+from gloe.optimization._parallel import (
+    _BranchGroup,
+    _branch_groups,
+    _lower,
+    _same_flow,
+)
+from gloe.utils import forward
+
+
+def _is_identity(node: BaseTransformer) -> bool:
+    return type(node) is forward
+
+
+def _lower_gateway(gateway: BaseTransformer) -> Optional[BaseTransformer]:
+    groups = _branch_groups(gateway)
+    if groups is None:
+        return None
+
+    changed = False
+    new_groups = []
+    size = 0
+    for prefix, branches in groups:
+        new_prefix = eliminate_identities(prefix)
+        new_branches = []
+        for position, suffix in branches:
+            new_suffix = eliminate_identities(suffix)
+            changed = changed or not _same_flow(new_suffix, suffix)
+            new_branches.append((position, new_suffix))
+            size += 1
+        changed = changed or not _same_flow(new_prefix, prefix)
+        new_groups.append(_BranchGroup(new_prefix, new_branches))
+
+    if not changed:
+        return None
+    return _lower(gateway, new_groups, size)
+
+
+def eliminate_identities(flow: Flow) -> Flow:
+    """
+    Remove the transformers that just forward the incoming data, like
+    :class:`gloe.utils.forward`, and replace the parallel gateways having branches
+    that only forward the data, like the ones built by :func:`gloe.utils.attach`, by
+    a node returning the data itself in the place of those branches. So,
+    :code:`attach(t)` is executed as :code:`(t(x), x)`, without extra calls.
+
+    Other invisible transformers, like the :code:`debug` ones or the bridges, have
+    effects and are kept.
+    """
+    optimized: Flow = []
+    for node in flow:
+        if _is_identity(node):
+            continue
+
+        lowered = _lower_gateway(node)
+        optimized.append(node if lowered is None else lowered)
+    return optimized
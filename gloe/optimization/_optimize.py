@@ -0,0 +1,128 @@
+from typing import Callable, TypeVar, cast, overload
+
+from gloe._hooks import _registry
+from gloe._wrapper import _Wrapper
+from gloe.async_transformer import (
+    AsyncTransformer,
+    _compile_async_flow,
+    _execute_async_flow,
+)
+from gloe.base_transformer import BaseTransformer, Flow
+from gloe.exceptions import UnsupportedTransformerArgException
+from gloe.optimization._fusion import fuse_collections
+from gloe.optimization._identities import eliminate_identities
+from gloe.optimization._prefixes import share_prefixes
+from gloe.transformers import Transformer, _execute_flow
+
+_In = TypeVar("_In")
+_Out = TypeVar("_Out")
+
+FlowPass = Callable[[Flow], Flow]
+
+_DEFAULT_PASSES: tuple[FlowPass, ...] = (
+    eliminate_identities,
+    share_prefixes,
+    fuse_collections,
+)
+
+
+class _BaseOptimized(_Wrapper[_In, _Out]):
+    """Encapsulates a pipeline and executes an optimized version of its flow"""
+
+    def __init__(self, transformer: BaseTransformer[_In, _Out], plan: Flow):
+        super().__init__(transformer)
+        self._plan = plan
+
+    @property
+    def plan(self) -> Flow:
+        """Nodes executed instead of the flow of the encapsulated pipeline"""
+        return self._plan
+
+    def _executed_flow(self) -> Flow:
+        # the hooks observe the nodes of the graph, not the optimized ones
+        if _registry.enabled:
+            return self.children[0]._flow
+        return self._plan
+
+
+class _OptimizedTransformer(_BaseOptimized[_In, _Out], Transformer[_In, _Out]):
+    def transform(self, data: _In) -> _Out:
+        return _execute_flow(self._executed_flow(), data)
+
+    def __call__(self, data: _In) -> _Out:
+        # when called directly, the plan is executed without wrapping it in a node
+        return _execute_flow(self._executed_flow(), data)
+
+
+class _OptimizedAsyncTransformer(
+    _BaseOptimized[_In, _Out], AsyncTransformer[_In, _Out]
+):
+    def __init__(self, transformer: AsyncTransformer[_In, _Out], plan: Flow):
+        super().__init__(transformer, plan)
+        self._plan_segments = _compile_async_flow(plan)
+
+    async def _execute(self, data: _In) -> _Out:
+        if _registry.enabled:
+            pipeline = cast(AsyncTransformer, self.children[0])
+            return await _execute_async_flow(pipeline._flow, data, pipeline._segments())
+        return await _execute_async_flow(self._plan, data, self._plan_segments)
+
+    async def transform_async(self, data: _In) -> _Out:
+        return await self._execute(data)
+
+    async def __call__(self, data: _In) -> _Out:
+        return await self._execute(data)
+
+
+@overload
+def optimize(
+    transformer: Transformer[_In, _Out], *passes: FlowPass
+) -> Transformer[_In, _Out]:
+    pass
+
+
+@overload
+def optimize(
+    transformer: AsyncTransformer[_In, _Out], *passes: FlowPass
+) -> AsyncTransformer[_In, _Out]:
+    pass
+
+
+def optimize(transformer, *passes):
+    """
+    Build a new pipeline that behaves like :code:`transformer`, but executes a flow
+    rewritten by optimization passes. The passes run only once, when this function
+    is called.
+
+    The new pipeline is plotted exactly like the original one. While hooks are
+    enabled, like during profiling or tracing, the original flow is executed, so the
+    observed transformers are the ones in the graph.
+
+    The default passes expect the transformers to be free of side effects that
+    depend on how many times, or in which order, they are called. For example, a
+    transformer starting two branches is executed only once.
+
+    Example:
+        Mapping and filtering the posts in a single pass::
+
+            get_titles = optimize(
+                get_posts >> Map(normalize) >> Filter(is_public) >> Map(get_title)
+            )
+
+    Args:
+        transformer: the pipeline to be optimized. Optimize the whole pipeline after
+            composing it, since composing the optimized pipeline with other
+            transformers doesn't optimize them.
+        *passes: functions receiving a flow, a list of transformers, and returning
+            the optimized one. When omitted, all the passes of this module are used.
+    """
+    if not isinstance(transformer, BaseTransformer):
+        raise UnsupportedTransformerArgException(transformer)
+
+    plan = list(transformer._flow)
+    for flow_pass in passes or _DEFAULT_PASSES:
+        plan = flow_pass(plan)
+
+    if isinstance(transformer, AsyncTransformer):
+        return _OptimizedAsyncTransformer(transformer, plan)
+    return _OptimizedTransformer(transformer, plan)
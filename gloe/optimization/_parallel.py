@@ -0,0 +1,210 @@
+from functools import partial
+from typing import Any, Callable, NamedTuple, Optional
+
+from typing_extensions import Self
+
+from gloe._executors import (
+    _BranchCosts,
+    _current_scope,
+    _run_scheduled,
+    _run_scheduled_async,
+)
+from gloe.async_transformer import (
+    AsyncTransformer,
+    _Segment,
+    _compile_async_flow,
+    _execute_async_flow,
+)
+from gloe.base_transformer import BaseTransformer, Flow
+from gloe.gateways._parallel import _Parallel, _ParallelAsync
+from gloe.transformers import Transformer, _execute_flow
+
+
+class _BranchGroup(NamedTuple):
+    """
+    Branches of a parallel gateway starting with the same nodes. The prefix is
+    executed once and its output is passed to the rest of each branch. Empty flows
+    just forward the data they receive.
+    """
+
+    prefix: Flow
+    branches: list[tuple[int, Flow]]
+
+
+def _is_async_flow(flow: Flow) -> bool:
+    return any(isinstance(node, AsyncTransformer) for node in flow)
+
+
+def _scatter(size: int, group_outputs: list[list[tuple[int, Any]]]) -> tuple:
+    results: list[Any] = [None] * size
+    for outputs in group_outputs:
+        for position, output in outputs:
+            results[position] = output
+    return tuple(results)
+
+
+class _BaseLowered(BaseTransformer[Any, tuple[Any, ...]]):
+    """
+    Parallel gateway whose branches were rewritten by optimization passes, so they
+    are executed from their flows instead of from the original transformers. Inside
+    a :func:`with_executor` scope, each group of branches is scheduled as a unit.
+    """
+
+    def __init__(self, groups: list[_BranchGroup], size: int, label: str):
+        super().__init__()
+        self.groups = groups
+        self._size = size
+        self._label = label
+        self._costs = _BranchCosts(len(groups))
+
+    def _copy(
+        self,
+        transform: Optional[Callable[..., Any]] = None,
+        regenerate_instance_id: bool = False,
+        transform_method: str = "transform",
+        force: bool = False,
+    ) -> Self:
+        copied: Self = super()._copy(
+            transform, regenerate_instance_id, transform_method, force
+        )
+        copied._costs = _BranchCosts(len(copied.groups))
+        return copied
+
+
+class _LoweredParallel(_BaseLowered, Transformer[Any, tuple[Any, ...]]):
+    def transform(self, data: Any) -> tuple[Any, ...]:
+        scope = _current_scope.get()
+        if scope is not None:
+            groups = [partial(_run_group, group) for group in self.groups]
+            return _scatter(
+                self._size, _run_scheduled(scope, self._costs, groups, data)
+            )
+
+        results: list[Any] = [None] * self._size
+        for prefix, branches in self.groups:
+            shared = _execute_flow(prefix, data) if len(prefix) > 0 else data
+            for position, suffix in branches:
+                if len(suffix) > 0:
+                    results[position] = _execute_flow(suffix, shared)
+                else:
+                    results[position] = shared
+        return tuple(results)
+
+
+def _run_group(group: _BranchGroup, data: Any) -> list[tuple[int, Any]]:
+    prefix, branches = group
+    shared = _execute_flow(prefix, data) if len(prefix) > 0 else data
+    return [
+        (position, _execute_flow(suffix, shared) if len(suffix) > 0 else shared)
+        for position, suffix in branches
+    ]
+
+
+class _LoweredParallelAsync(_BaseLowered, AsyncTransformer[Any, tuple[Any, ...]]):
+    def __init__(self, groups: list[_BranchGroup], size: int, label: str):
+        super().__init__(groups, size, label)
+        self._compiled = [
+            (
+                prefix,
+                _async_segments(prefix),
+                [
+                    (position, suffix, _async_segments(suffix))
+                    for position, suffix in branches
+                ],
+            )
+            for prefix, branches in groups
+        ]
+
+    async def transform_async(self, data: Any) -> tuple[Any, ...]:
+        scope = _current_scope.get()
+        if scope is not None:
+            groups: list[Callable[[Any], Any]] = []
+            async_groups = []
+            for group, compiled in zip(self.groups, self._compiled):
+                is_async = _is_async_group(compiled)
+                if is_async:
+                    groups.append(partial(_run_group_async, compiled))
+                else:
+                    groups.append(partial(_run_group, group))
+                async_groups.append(is_async)
+            outputs = await _run_scheduled_async(
+                scope, self._costs, groups, async_groups, data
+            )
+            return _scatter(self._size, outputs)
+
+        results: list[Any] = [None] * self._size
+        for prefix, prefix_segments, branches in self._compiled:
+            shared = await _run(prefix, prefix_segments, data)
+            for position, suffix, suffix_segments in branches:
+                results[position] = await _run(suffix, suffix_segments, shared)
+        return tuple(results)
+
+
+# the segments of each flow, or None for sync flows
+_CompiledGroup = tuple[
+    Flow, Optional[list[_Segment]], list[tuple[int, Flow, Optional[list[_Segment]]]]
+]
+
+
+def _async_segments(flow: Flow) -> Optional[list[_Segment]]:
+    return _compile_async_flow(flow) if _is_async_flow(flow) else None
+
+
+def _is_async_group(compiled: _CompiledGroup) -> bool:
+    _, prefix_segments, branches = compiled
+    return prefix_segments is not None or any(
+        segments is not None for _, _, segments in branches
+    )
+
+
+async def _run_group_async(
+    compiled: _CompiledGroup, data: Any
+) -> list[tuple[int, Any]]:
+    prefix, prefix_segments, branches = compiled
+    shared = await _run(prefix, prefix_segments, data)
+    return [
+        (position, await _run(suffix, suffix_segments, shared))
+        for position, suffix, suffix_segments in branches
+    ]
+
+
+async def _run(flow: Flow, segments: Optional[list[_Segment]], data: Any) -> Any:
+    if len(flow) == 0:
+        return data
+    if segments is not None:
+        return await _execute_async_flow(flow, data, segments)
+    return _execute_flow(flow, data)
+
+
+def _branch_groups(node: BaseTransformer) -> Optional[list[_BranchGroup]]:
+    """Describe the branches of a parallel gateway, or None for any other node"""
+    if type(node) in (_Parallel, _ParallelAsync):
+        return [
+            _BranchGroup([], [(position, list(child._flow))])
+            for position, child in enumerate(node.children)
+        ]
+    if isinstance(node, (_LoweredParallel, _LoweredParallelAsync)):
+        return node.groups
+    return None
+
+
+def _same_flow(flow: Flow, other: Flow) -> bool:
+    return len(flow) == len(other) and all(
+        node is other_node for node, other_node in zip(flow, other)
+    )
+
+
+def _branch_flows(groups: list[_BranchGroup]) -> list[Flow]:
+    flows: dict[int, Flow] = {}
+    for prefix, branches in groups:
+        for position, suffix in branches:
+            flows[position] = prefix + suffix
+    return [flows[position] for position in range(len(flows))]
+
+
+def _lower(
+    gateway: BaseTransformer, groups: list[_BranchGroup], size: int
+) -> BaseTransformer:
+    if isinstance(gateway, AsyncTransformer):
+        return _LoweredParallelAsync(groups, size, gateway.label)
+    return _LoweredParallel(groups, size, gateway.label)
@@ -0,0 +1,79 @@
+from typing import Any, Hashable, Optional
+
+from gloe.base_transformer import BaseTransformer, Flow
+from gloe.optimization._parallel import (
+    _BranchGroup,
+    _branch_flows,
+    _branch_groups,
+    _lower,
+    _same_flow,
+)
+
+
+def _node_key(node: BaseTransformer) -> Hashable:
+    """
+    Copies of a transformer keep its :attr:`id`, but some copies, like the ensured
+    ones, replace its transform method. Both must match for two nodes to be shared.
+    """
+    transform = node.__dict__.get("transform", node.__dict__.get("transform_async"))
+    return node.id, getattr(transform, "__func__", None)
+
+
+def _common_prefix_length(flows: list[Flow]) -> int:
+    length = 0
+    for nodes in zip(*flows):
+        first_key = _node_key(nodes[0])
+        if any(_node_key(node) != first_key for node in nodes[1:]):
+            break
+        length += 1
+    return length
+
+
+def _group_by_prefix(flows: list[Flow]) -> list[_BranchGroup]:
+    positions_by_head: dict[Any, list[int]] = {}
+    for position, flow in enumerate(flows):
+        head = _node_key(flow[0]) if len(flow) > 0 else position
+        positions_by_head.setdefault(head, []).append(position)
+
+    groups = []
+    for positions in positions_by_head.values():
+        members = [flows[position] for position in positions]
+        length = _common_prefix_length(members) if len(members) > 1 else 0
+        groups.append(
+            _BranchGroup(
+                members[0][:length],
+                [(position, flows[position][length:]) for position in positions],
+            )
+        )
+    return groups
+
+
+def _share_gateway_prefixes(gateway: BaseTransformer) -> Optional[BaseTransformer]:
+    groups = _branch_groups(gateway)
+    if groups is None:
+        return None
+
+    old_flows = _branch_flows(groups)
+    flows = [share_prefixes(flow) for flow in old_flows]
+    new_groups = _group_by_prefix(flows)
+    is_shared = any(len(group.prefix) > 0 for group in new_groups)
+    if not is_shared and all(map(_same_flow, flows, old_flows)):
+        return None
+    return _lower(gateway, new_groups, len(flows))
+
+
+def share_prefixes(flow: Flow) -> Flow:
+    """
+    Execute only once the nodes starting many branches of a parallel gateway. In
+    :code:`extract >> (parse >> a, parse >> b)`, :code:`parse` is executed once for
+    each input and its output is passed to both :code:`a` and :code:`b`.
+
+    Two nodes are the same when they are copies of the same transformer, which is the
+    case of a transformer used in many places of a pipeline. Since the shared output
+    is passed to many branches, they must not modify it.
+    """
+    optimized: Flow = []
+    for node in flow:
+        shared = _share_gateway_prefixes(node)
+        optimized.append(node if shared is None else shared)
+    return optimized
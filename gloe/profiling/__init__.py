@@ -0,0 +1,3 @@
+__all__ = ["Profiler", "NodeStats"]
+
+from gloe.profiling._profiler import Profiler, NodeStats
@@ -0,0 +1,52 @@
+import sys
+import tracemalloc
+from typing import Any
+
+_MAX_VISITED = 10_000
+
+
+def approximate_size(data: Any) -> int:
+    """
+    Approximate size in bytes of an object and the objects it contains. Containers
+    are followed recursively, and the traversal stops after visiting
+    :code:`_MAX_VISITED` objects to keep it cheap for large outputs.
+    """
+    seen: set[int] = set()
+    pending = [data]
+    size = 0
+    while len(pending) > 0 and len(seen) < _MAX_VISITED:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            pending.append(vars(obj))
+    return size
+
+
+def start_tracing() -> bool:
+    """Start tracing the memory blocks, telling whether it was not tracing yet"""
+    if tracemalloc.is_tracing():
+        return False
+    tracemalloc.start()
+    return True
+
+
+def traced_memory() -> tuple[int, int]:
+    """Current and peak sizes of the traced memory blocks"""
+    return tracemalloc.get_traced_memory()
+
+
+def format_bytes(size: float) -> str:
+    for unit in ["B", "KB", "MB"]:
+        if abs(size) < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
@@ -0,0 +1,346 @@
+import json
+import math
+import random
+import threading
+import time
+import tracemalloc
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from gloe._gloe_graph import GloeGraph
+from gloe._hooks import TransformerHook
+from gloe.base_transformer import BaseTransformer
+from gloe.collection import Filter, FilterAsync, Map, MapAsync, MapOver, MapOverAsync
+from gloe.profiling._memory import (
+    approximate_size,
+    format_bytes,
+    start_tracing,
+    traced_memory,
+)
+
+_COLLECTION_TYPES = (Map, MapAsync, Filter, FilterAsync, MapOver, MapOverAsync)
+
+
+@dataclass
+class NodeStats:
+    """
+    Aggregated measures of a single transformer of a pipeline. Times are in seconds.
+
+    :code:`items_in` and :code:`items_out` are only counted for collection
+    transformers, like :class:`gloe.collection.Map` and
+    :class:`gloe.collection.Filter`.
+
+    The memory fields are only filled when the profiler traces memory, sizes are in
+    bytes. :code:`allocated_bytes` is the sum over all the calls of the memory still
+    allocated when the transformer returned, :code:`peak_bytes` is the highest
+    memory peak above the memory in use when a call started, and
+    :code:`output_bytes` is the approximate size of the biggest output.
+    """
+
+    node_id: str
+    label: str
+    calls: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    items_in: int = 0
+    items_out: int = 0
+    allocated_bytes: int = 0
+    peak_bytes: int = 0
+    output_bytes: int = 0
+    samples: list[float] = field(default_factory=list, repr=False)
+
+    @property
+    def mean_time(self) -> float:
+        if self.calls == 0:
+            return 0.0
+        return self.total_time / self.calls
+
+    @property
+    def p99_time(self) -> float:
+        return self.percentile(99)
+
+    def percentile(self, percent: float) -> float:
+        """Nearest-rank percentile of the sampled execution times"""
+        if len(self.samples) == 0:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+        return ordered[rank - 1]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "node_id": self.node_id,
+            "label": self.label,
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_time": self.total_time,
+            "mean_time": self.mean_time,
+            "max_time": self.max_time,
+            "p99_time": self.p99_time,
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "allocated_bytes": self.allocated_bytes,
+            "peak_bytes": self.peak_bytes,
+            "output_bytes": self.output_bytes,
+        }
+
+
+class _Frame:
+    __slots__ = ("start", "memory_start", "memory_peak", "previous")
+
+    def __init__(self, start: int, memory_start: int, previous: Optional["_Frame"]):
+        self.start = start
+        self.memory_start = memory_start
+        self.memory_peak = memory_start
+        self.previous = previous
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f}ms"
+    return f"{seconds:.2f}s"
+
+
+def _cluster_owner(graph_node: str, suffix: str) -> str:
+    """
+    Node id of the transformer drawn as the cluster whose begin or end node is
+    :code:`graph_node`, or an empty string if it is not a cluster node.
+    """
+    prefix = "cluster_"
+    if graph_node.startswith(prefix) and graph_node.endswith(suffix):
+        end = len(graph_node) - len(suffix)
+        return graph_node[:end].replace(prefix, "", 1)
+    return ""
+
+
+def _annotate(label: str, stats: NodeStats, memory: bool) -> str:
+    annotated = (
+        f"{label}\\n"
+        f"{_format_seconds(stats.total_time)}"
+        f" | {stats.calls} calls"
+        f" | p99 {_format_seconds(stats.p99_time)}"
+    )
+    if memory:
+        annotated += f"\\npeak {format_bytes(stats.peak_bytes)}"
+    return annotated
+
+
+def _count(data: Any) -> Optional[int]:
+    try:
+        return len(data)
+    except TypeError:
+        return None
+
+
+class Profiler(TransformerHook):
+    """
+    Hook that measures the time spent in each transformer of the pipelines it is
+    enabled on, grouped by node.
+
+    The profile can be drawn over the pipeline graph as a heatmap: nodes are colored
+    by their total time and annotated with the call count and the p99 latency, and
+    the edges entering and leaving the collections are annotated with the number of
+    items that passed through them.
+
+    Example:
+        Profiling a pipeline and exporting its heatmap::
+
+            profiler = Profiler()
+            profiled = with_hooks(pipeline, profiler)
+            for data in dataset:
+                profiled(data)
+
+            pipeline.to_image("heatmap.png", overlay=profiler)
+
+    In the memory mode, the memory allocated by each transformer is measured with
+    :mod:`tracemalloc`, which is started if it is not tracing yet. Tracing slows the
+    whole process down, so call :meth:`stop` when done, or use the profiler as a
+    context manager, to stop the tracing started by the profiler. The memory
+    allocated by the transformers executed inside collections, gateways and
+    conditionals is also attributed to them. Since :mod:`tracemalloc` measures the
+    whole process, the measures of transformers running concurrently are mixed, and
+    the time measures include the tracing overhead.
+
+    Args:
+        max_samples: maximum number of execution times kept per node to estimate the
+            percentiles. When there are more executions, a uniform sample is kept.
+        memory: enables the memory mode.
+        measure_output: in the memory mode, also measure the approximate size of the
+            output of each transformer. It may be expensive for big outputs.
+    """
+
+    def __init__(
+        self,
+        max_samples: int = 10_000,
+        memory: bool = False,
+        measure_output: bool = False,
+    ):
+        self.max_samples = max_samples
+        self.memory = memory
+        self.measure_output = measure_output
+        self._stats: dict[str, NodeStats] = {}
+        self._lock = threading.Lock()
+        self._started_tracing = False
+        self._current: ContextVar[Optional[_Frame]] = ContextVar(
+            f"gloe_profiler_{id(self)}", default=None
+        )
+
+    @property
+    def stats(self) -> dict[str, NodeStats]:
+        """Stats of each executed transformer, indexed by their node id"""
+        with self._lock:
+            return dict(self._stats)
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+    def stop(self):
+        """
+        Stop tracing the memory if the profiler started it. The collected stats are
+        kept, and the tracing starts again if a profiled transformer is executed.
+        """
+        if self._started_tracing:
+            self._started_tracing = False
+            tracemalloc.stop()
+
+    def __enter__(self) -> "Profiler":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.stop()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {node_id: stats.to_dict() for node_id, stats in self.stats.items()}
+
+    def save(self, path: str):
+        """Save the collected stats as a JSON file"""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def on_start(self, transformer: BaseTransformer, data: Any):
+        previous = self._current.get()
+        memory_start = 0
+        if self.memory:
+            if start_tracing():
+                self._started_tracing = True
+            memory_start, memory_peak = traced_memory()
+            if previous is not None:
+                previous.memory_peak = max(previous.memory_peak, memory_peak)
+            tracemalloc.reset_peak()
+
+        self._current.set(_Frame(time.perf_counter_ns(), memory_start, previous))
+
+    def _record(self, transformer: BaseTransformer, data: Any, output: Any, ok: bool):
+        end = time.perf_counter_ns()
+        frame = self._current.get()
+        if frame is None:  # pragma: no cover
+            return
+        self._current.set(frame.previous)
+        elapsed = (end - frame.start) / 1e9
+
+        allocated = peak = output_size = 0
+        if self.memory:
+            memory_current, memory_peak = traced_memory()
+            frame.memory_peak = max(frame.memory_peak, memory_peak)
+            if frame.previous is not None:
+                frame.previous.memory_peak = max(
+                    frame.previous.memory_peak, frame.memory_peak
+                )
+            allocated = memory_current - frame.memory_start
+            peak = frame.memory_peak - frame.memory_start
+            if self.measure_output and ok:
+                output_size = approximate_size(output)
+
+        items_in: Optional[int] = None
+        items_out: Optional[int] = None
+        if isinstance(transformer, _COLLECTION_TYPES):
+            items_in = _count(data) if not isinstance(transformer, MapOver) else None
+            items_out = _count(output) if ok else None
+
+        node_id = transformer.node_id
+        with self._lock:
+            stats = self._stats.get(node_id)
+            if stats is None:
+                stats = NodeStats(node_id=node_id, label=transformer.label)
+                self._stats[node_id] = stats
+
+            stats.calls += 1
+            stats.errors += 0 if ok else 1
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+            stats.items_in += items_in or 0
+            stats.items_out += items_out or 0
+            stats.allocated_bytes += allocated
+            stats.peak_bytes = max(stats.peak_bytes, peak)
+            stats.output_bytes = max(stats.output_bytes, output_size)
+
+            if len(stats.samples) < self.max_samples:
+                stats.samples.append(elapsed)
+            else:
+                index = random.randrange(stats.calls)
+                if index < self.max_samples:
+                    stats.samples[index] = elapsed
+
+    def on_end(self, transformer: BaseTransformer, data: Any, output: Any):
+        self._record(transformer, data, output, ok=True)
+
+    def on_error(
+        self, transformer: BaseTransformer, data: Any, exception: BaseException
+    ):
+        self._record(transformer, data, None, ok=False)
+
+    def overlay(self, graph: GloeGraph) -> GloeGraph:
+        """
+        Return a copy of the graph with the profile drawn as a heatmap over its nodes
+        """
+        stats = self.stats
+        heated = graph.copy()
+        subgraphs = list(heated.walk())
+        max_total = max(
+            [
+                stats[node_id].total_time
+                for subgraph in subgraphs
+                for node_id in subgraph.nodes
+                if node_id in stats
+            ],
+            default=0.0,
+        )
+
+        for subgraph in subgraphs:
+            cluster_stats = stats.get(_cluster_owner(subgraph.name, ""))
+            if cluster_stats is not None:
+                subgraph.attrs["label"] = _annotate(
+                    subgraph.attrs.get("label", cluster_stats.label),
+                    cluster_stats,
+                    self.memory,
+                )
+
+            for node_id, attrs in subgraph.nodes.items():
+                node_stats = stats.get(node_id)
+                if node_stats is None:
+                    continue
+                heat = node_stats.total_time / max_total if max_total > 0 else 0.0
+                attrs["style"] = "filled"
+                attrs["fillcolor"] = f"0.000 {heat:.3f} 1.000"
+                attrs["label"] = _annotate(
+                    attrs.get("label", node_stats.label), node_stats, self.memory
+                )
+
+            for (u, v), attrs in subgraph.edges.items():
+                items: Optional[int] = None
+                collection_out = stats.get(_cluster_owner(u, "end"))
+                collection_in = stats.get(_cluster_owner(v, "begin"))
+                if collection_out is not None:
+                    items = collection_out.items_out
+                elif collection_in is not None:
+                    items = collection_in.items_in
+
+                if items is not None:
+                    attrs["label"] = f"{attrs.get('label', '')} ({items} items)"
+
+        return heated
@@ -0,0 +1,20 @@
+__all__ = [
+    "Span",
+    "Tracer",
+    "SpanExporter",
+    "InMemoryExporter",
+    "JSONLExporter",
+    "OpenTelemetryExporter",
+    "ChromeTraceExporter",
+    "chrome_trace_events",
+]
+
+from gloe.tracing._span import Span
+from gloe.tracing._tracer import Tracer
+from gloe.tracing._exporters import (
+    SpanExporter,
+    InMemoryExporter,
+    JSONLExporter,
+    OpenTelemetryExporter,
+)
+from gloe.tracing._chrome_trace import ChromeTraceExporter, chrome_trace_events
@@ -0,0 +1,101 @@
+import json
+import os
+import threading
+from typing import Any, Iterable
+
+from gloe.tracing._exporters import SpanExporter
+from gloe.tracing._span import Span
+
+
+def chrome_trace_events(spans: Iterable[Span]) -> list[dict[str, Any]]:
+    """
+    Convert spans to events of the Chrome Trace Event format.
+
+    Each span becomes a complete event (a slice) in a track of its own asyncio task,
+    or of its thread when it was not executed by a task. Thus, slices of different
+    tracks overlapping in time were executed concurrently, and the gaps in the track
+    of a task are the periods it was suspended.
+    """
+    pid = os.getpid()
+    tracks: dict[tuple[Any, Any], int] = {}
+    events: list[dict[str, Any]] = []
+
+    for span in sorted(spans, key=lambda s: s.start_time):
+        thread_id = span.attributes.get("thread_id")
+        task = span.attributes.get("task")
+        track = (thread_id, task)
+        if track not in tracks:
+            tracks[track] = len(tracks) + 1
+            track_name = f"thread {thread_id}" if task is None else task
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tracks[track],
+                    "args": {"name": track_name},
+                }
+            )
+
+        end_time = span.end_time if span.end_time is not None else span.start_time
+        events.append(
+            {
+                "name": span.name,
+                "cat": "gloe",
+                "ph": "X",
+                "ts": span.start_time / 1e3,
+                "dur": (end_time - span.start_time) / 1e3,
+                "pid": pid,
+                "tid": tracks[track],
+                "args": {
+                    "trace_id": span.trace_id,
+                    "span_id": span.span_id,
+                    "parent_id": span.parent_id,
+                    "node_id": span.node_id,
+                    "status": span.status,
+                    "error": span.error,
+                    **span.attributes,
+                },
+            }
+        )
+
+    return events
+
+
+class ChromeTraceExporter(SpanExporter):
+    """
+    Collect the finished spans to save them in the Chrome Trace Event format, which
+    can be opened in https://ui.perfetto.dev or in :code:`chrome://tracing`.
+
+    Example:
+        Checking if the branches of an async gateway run concurrently::
+
+            exporter = ChromeTraceExporter()
+            traced = with_hooks(pipeline, Tracer(exporter))
+            await traced(data)
+            exporter.save("pipeline.trace.json")
+    """
+
+    def __init__(self):
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        with self._lock:
+            self._spans.append(span)
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            spans = list(self._spans)
+        return {
+            "traceEvents": chrome_trace_events(spans),
+            "displayTimeUnit": "ms",
+        }
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, default=str)
+
+    def clear(self):
+        with self._lock:
+            self._spans = []
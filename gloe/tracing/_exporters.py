@@ -0,0 +1,160 @@
+import json
+import random
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Optional, IO
+
+from gloe.tracing._span import Span
+
+
+class SpanExporter(ABC):
+    """Destination of the spans finished by a :class:`Tracer`"""
+
+    @abstractmethod
+    def export(self, span: Span):
+        """Receive a finished span. It is called in the thread that executed it."""
+
+    def end_trace(self, trace_id: str):
+        """
+        Called once the pipeline invocation of the trace has finished, so no other
+        span of it will be exported.
+        """
+
+    def shutdown(self):
+        """Release any resource held by the exporter"""
+
+
+class InMemoryExporter(SpanExporter):
+    """
+    Keep the finished spans in memory.
+
+    Args:
+        max_spans: maximum number of spans kept, the oldest ones are discarded first.
+            By default, all the spans are kept.
+    """
+
+    def __init__(self, max_spans: Optional[int] = None):
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+
+    @property
+    def spans(self) -> list[Span]:
+        """Finished spans, in the order they have finished"""
+        return list(self._spans)
+
+    def export(self, span: Span):
+        self._spans.append(span)
+
+    def clear(self):
+        self._spans.clear()
+
+
+class JSONLExporter(SpanExporter):
+    """
+    Append each finished span to a file as a JSON object per line.
+
+    Args:
+        path: path of the file. It is created if it does not exist.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file: Optional[IO[str]] = None
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line + "\n")
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def shutdown(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class OpenTelemetryExporter(SpanExporter):
+    """
+    Forward the finished spans to OpenTelemetry. The spans of a trace are sent when
+    its pipeline invocation finishes, as a single OpenTelemetry trace with the same
+    trace id, preserving the parent/child relationships and the original timestamps.
+
+    Args:
+        tracer_provider: OpenTelemetry tracer provider used to create the spans. By
+            default, the global tracer provider is used.
+    """
+
+    def __init__(self, tracer_provider: Any = None):
+        try:
+            from opentelemetry import trace  # noqa: F401
+        except ImportError as err:
+            raise ImportError(
+                "Please, the module opentelemetry-api is required for this exporter,"
+                + """ install with "pip install opentelemetry-api". More information """
+                + "is available in https://opentelemetry.io/docs/languages/python/"
+            ) from err
+
+        self._trace = trace
+        self._tracer = trace.get_tracer("gloe", tracer_provider=tracer_provider)
+        self._pending: dict[str, list[Span]] = {}
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        with self._lock:
+            self._pending.setdefault(span.trace_id, []).append(span)
+
+    def end_trace(self, trace_id: str):
+        with self._lock:
+            trace_spans = self._pending.pop(trace_id, None)
+        if trace_spans is not None:
+            self._send(trace_id, trace_spans)
+
+    def _root_context(self, trace_id: str) -> Any:
+        """
+        Context carrying the gloe trace as a remote parent. The root spans of an
+        invocation are all created in it, so they share the same OpenTelemetry trace
+        instead of joining whatever span is current in the exporting thread.
+        """
+        trace = self._trace
+        span_context = trace.SpanContext(
+            trace_id=int(trace_id, 16),
+            span_id=random.getrandbits(64),
+            is_remote=True,
+            trace_flags=trace.TraceFlags(trace.TraceFlags.SAMPLED),
+        )
+        return trace.set_span_in_context(trace.NonRecordingSpan(span_context))
+
+    def _send(self, trace_id: str, spans: list[Span]):
+        from opentelemetry.trace import Status, StatusCode
+
+        root_context = self._root_context(trace_id)
+        otel_spans: dict[str, Any] = {}
+        for span in sorted(spans, key=lambda s: s.start_time):
+            parent = otel_spans.get(span.parent_id or "")
+            context = (
+                self._trace.set_span_in_context(parent)
+                if parent is not None
+                else root_context
+            )
+            attributes = {f"gloe.{key}": val for key, val in span.attributes.items()}
+            attributes["gloe.node_id"] = span.node_id
+            otel_span = self._tracer.start_span(
+                span.name,
+                context=context,
+                start_time=span.start_time,
+                attributes=attributes,
+            )
+            if span.status == "error":
+                otel_span.set_status(Status(StatusCode.ERROR, span.error))
+            otel_spans[span.span_id] = otel_span
+
+        for span in spans:
+            otel_spans[span.span_id].end(end_time=span.end_time)
@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+@dataclass
+class Span:
+    """
+    Execution record of a single transformer.
+
+    Timestamps are nanoseconds since the epoch. :code:`parent_id` is :code:`None` for
+    the root span of a trace, it means, the first transformer executed by the traced
+    pipeline.
+    """
+
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    name: str
+    node_id: str
+    start_time: int
+    end_time: Optional[int] = None
+    status: str = "ok"
+    error: Optional[str] = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> Optional[int]:
+        """Duration of the span in nanoseconds, if it has already ended"""
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "node_id": self.node_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "status": self.status,
+            "error": self.error,
+            "attributes": dict(self.attributes),
+        }
+
+    @staticmethod
+    def from_dict(span_dict: dict[str, Any]) -> "Span":
+        return Span(**span_dict)
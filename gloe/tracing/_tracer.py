@@ -0,0 +1,172 @@
+import asyncio
+import random
+import threading
+import time
+from contextvars import ContextVar
+from functools import partial
+from typing import Any, Optional, cast
+
+from gloe._execution_context import _current_execution, _executions
+from gloe._hooks import TransformerHook
+from gloe.async_transformer import AsyncTransformer
+from gloe.base_transformer import BaseTransformer
+from gloe.tracing._exporters import SpanExporter
+from gloe.tracing._span import Span
+
+
+class _Frame:
+    """
+    Entry of the stack of transformers being executed in a context. The span is
+    :code:`None` when the trace was not sampled.
+    """
+
+    __slots__ = ("span", "previous")
+
+    def __init__(self, span: Optional[Span], previous: Optional["_Frame"]):
+        self.span = span
+        self.previous = previous
+
+
+def _current_task_name() -> Optional[str]:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        return None
+    if task is None:
+        return None
+    return task.get_name()
+
+
+_MISSING = object()
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Tracer(TransformerHook):
+    """
+    Hook that records a :class:`Span` for each executed transformer and sends the
+    finished spans to an exporter.
+
+    Spans are nested following the execution: the transformers executed inside a
+    collection, a gateway or a conditional are children of the span of the
+    collection, gateway or conditional. The current span is kept in a context
+    variable, so it follows the :code:`await` points and the work started with
+    :func:`contextvars.copy_context` (like :func:`asyncio.to_thread` does).
+
+    Each pipeline invocation is a trace: the transformers executed directly by the
+    invoked pipeline are the root spans of the trace.
+
+    Example:
+        Tracing one of every 100 executions of a pipeline::
+
+            exporter = JSONLExporter("traces.jsonl")
+            traced_pipeline = with_hooks(pipeline, Tracer(exporter, sample_every=100))
+
+    Args:
+        exporter: destination of the finished spans.
+        sample_every: only one of every :code:`sample_every` pipeline invocations is
+            traced. The decision is taken once per invocation, so sampled traces are
+            always complete.
+    """
+
+    def __init__(self, exporter: SpanExporter, sample_every: int = 1):
+        if sample_every < 1:
+            raise ValueError("The parameter sample_every must be a positive integer")
+
+        self.exporter = exporter
+        self.sample_every = sample_every
+        self._counter = 0
+        self._lock = threading.Lock()
+        self._current: ContextVar[Optional[_Frame]] = ContextVar(
+            f"gloe_tracer_{id(self)}", default=None
+        )
+        # the trace of each invocation is kept in its execution context
+        _executions.enabled = True
+
+    @property
+    def current_span(self) -> Optional[Span]:
+        """The span of the transformer being executed in the current context"""
+        current = self._current.get()
+        if current is None:
+            return None
+        return current.span
+
+    def _should_sample(self) -> bool:
+        if self.sample_every == 1:
+            return True
+        with self._lock:
+            self._counter += 1
+            return self._counter % self.sample_every == 1
+
+    def _trace_id(self) -> Optional[str]:
+        """
+        Id of the trace of the current pipeline invocation, or :code:`None` when the
+        invocation isn't sampled.
+        """
+        execution = _current_execution.get()
+        if execution is None:  # pragma: no cover
+            return _new_id(128) if self._should_sample() else None
+
+        trace_id = execution.values.get(self, _MISSING)
+        if trace_id is _MISSING:
+            new_id = _new_id(128) if self._should_sample() else None
+            trace_id = execution.values.setdefault(self, new_id)
+            if new_id is not None and trace_id is new_id:
+                execution.on_close(partial(self.exporter.end_trace, new_id))
+        return cast(Optional[str], trace_id)
+
+    def on_start(self, transformer: BaseTransformer, data: Any):
+        current = self._current.get()
+        if current is None:
+            trace_id = self._trace_id()
+            if trace_id is None:
+                self._current.set(_Frame(None, current))
+                return
+            parent_id = None
+        elif current.span is None:
+            self._current.set(_Frame(None, current))
+            return
+        else:
+            trace_id = current.span.trace_id
+            parent_id = current.span.span_id
+
+        span = Span(
+            trace_id=trace_id,
+            span_id=_new_id(64),
+            parent_id=parent_id,
+            name=transformer.label,
+            node_id=transformer.node_id,
+            start_time=time.time_ns(),
+            attributes={
+                "thread_id": threading.get_ident(),
+                "task": _current_task_name(),
+                "is_async": isinstance(transformer, AsyncTransformer),
+            },
+        )
+        self._current.set(_Frame(span, current))
+
+    def _finish(self, status: str, error: Optional[BaseException] = None):
+        current = self._current.get()
+        if current is None:  # pragma: no cover
+            return
+
+        self._current.set(current.previous)
+        span = current.span
+        if span is None:
+            return
+
+        span.end_time = time.time_ns()
+        span.status = status
+        if error is not None:
+            span.error = repr(error)
+        self.exporter.export(span)
+
+    def on_end(self, transformer: BaseTransformer, data: Any, output: Any):
+        self._finish("ok")
+
+    def on_error(
+        self, transformer: BaseTransformer, data: Any, exception: BaseException
+    ):
+        self._finish("error", exception)
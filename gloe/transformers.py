@@ -1,10 +1,18 @@
 from abc import ABC, abstractmethod
+from contextvars import copy_context
 from inspect import Signature
 
 from typing import TypeVar, overload, cast, Optional, Any
 from typing_extensions import TypeAlias
 
 from gloe.async_transformer import AsyncTransformer
+from gloe._ensured_calls import _ensured_calls, _restore_calls
+from gloe._execution_context import (
+    ExecutionContext,
+    _current_execution,
+    _executions,
+)
+from gloe._hooks import _registry, _current_hooks
 from gloe._transformer_utils import catch_transformer_exception
 from gloe.base_transformer import BaseTransformer, Flow
 
@@ -35,16 +43,59 @@ O7 = TypeVar("O7")
 To = TypeVar("To", bound=BaseTransformer)
 
 
-def _execute_flow(flow: Flow, arg: Any) -> Any:
+def _execute_hooked_flow(flow: Flow, arg: Any) -> Any:
+    hooks = _current_hooks()
+    reversed_hooks = hooks[::-1]
     result = arg
     for op in flow:
-        if isinstance(op, Transformer):
-            result = op._safe_transform(result)
-        else:
+        if not isinstance(op, Transformer):
             raise NotImplementedError()
+
+        for hook in hooks:
+            hook.on_start(op, result)
+        try:
+            output = op._safe_transform(result)
+        except BaseException as exception:
+            for hook in reversed_hooks:
+                hook.on_error(op, result, exception)
+            raise
+        for hook in reversed_hooks:
+            hook.on_end(op, result, output)
+        result = output
     return result
 
 
+def _execute_scoped_flow(flow: Flow, arg: Any) -> Any:
+    execution = ExecutionContext()
+    token = _current_execution.set(execution)
+    try:
+        return _execute_flow(flow, arg)
+    finally:
+        _current_execution.reset(token)
+        execution._close()
+
+
+def _execute_flow(flow: Flow, arg: Any) -> Any:
+    if _executions.enabled and _current_execution.get() is None:
+        return _execute_scoped_flow(flow, arg)
+    snapshot = copy_context() if _ensured_calls.enabled else None
+    try:
+        if _registry.enabled:
+            return _execute_hooked_flow(flow, arg)
+
+        result = arg
+        for op in flow:
+            if isinstance(op, Transformer):
+                result = op._safe_transform(result)
+            else:
+                raise NotImplementedError()
+        return result
+    except BaseException:
+        if snapshot is not None:
+            _restore_calls(snapshot)
+        raise
+
+
 class Transformer(BaseTransformer[_I, _O], ABC):
     """
     A Transformer is the generic block with the responsibility to take an input of type
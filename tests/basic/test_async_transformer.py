@@ -1,6 +1,10 @@
 import asyncio
+import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from typing import TypeVar, Any, cast
+from unittest.mock import patch
 
 from gloe import (
     async_transformer,
@@ -10,11 +14,18 @@ from gloe import (
     AsyncTransformer,
     TransformerException,
 )
-from gloe.async_transformer import _execute_async_flow
+from gloe._sync_runner import _SyncRunner
+from gloe.async_transformer import _compile_async_flow, _execute_async_flow
+from gloe.executors import configure_event_loop
 from gloe.functional import partial_async_transformer
 from gloe.utils import forward
 from tests.lib.exceptions import LnOfNegativeNumber
-from tests.lib.transformers import async_plus1, async_natural_logarithm
+from tests.lib.transformers import (
+    async_natural_logarithm,
+    async_plus1,
+    minus1,
+    plus1,
+)
 
 _In = TypeVar("_In")
 
@@ -209,6 +220,25 @@ class TestAsyncTransformer(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(NotImplementedError):
             await _execute_async_flow(flow, 1)  # type: ignore
 
+    async def test_consecutive_sync_transformers_segment(self):
+        graph = async_plus1 >> plus1 >> minus1 >> plus1 >> async_plus1 >> minus1
+        segments = _compile_async_flow(graph._flow)
+
+        self.assertEqual(
+            [True, False, True, False], [is_async for is_async, _ in segments]
+        )
+        self.assertEqual(3, len(segments[1][1]))
+        self.assertEqual(2.0, await graph(0.0))
+        self.assertIs(segments[1][1][0], graph._flow[1])
+
+    async def test_segments_compiled_again_for_copies(self):
+        graph = async_plus1 >> plus1
+        await graph(0.0)
+        copied = graph.copy(regenerate_instance_id=True)
+
+        self.assertIsNot(graph._segments(), copied._segments())
+        self.assertIs(copied._flow[1], copied._segments()[1][1][0])
+
     async def test_composition_transform_method(self):
         test3 = forward[float]() >> async_plus1
 
@@ -218,3 +248,79 @@ class TestAsyncTransformer(unittest.IsolatedAsyncioTestCase):
 
         result2 = await test2.transform_async(5)
         self.assertIsNone(result2)
+
+
+_request_id: ContextVar[str] = ContextVar("request_id", default="")
+
+
+class TestAsyncTransformerRunSync(unittest.TestCase):
+    def test_run_sync(self):
+        graph = async_plus1 >> minus1 >> async_plus1
+
+        self.assertEqual(2.0, graph.run_sync(1.0))
+        self.assertEqual(3.0, graph.run_sync(2.0))
+
+    def test_run_sync_many(self):
+        self.assertEqual([2.0, 3.0, 4.0], async_plus1.run_sync_many([1.0, 2.0, 3.0]))
+        self.assertEqual([], async_plus1.run_sync_many([]))
+
+    def test_run_sync_many_eager(self):
+        @async_transformer
+        async def sleep_odd(num: int) -> int:
+            if num % 2 == 1:
+                await asyncio.sleep(0)
+            return num * 2
+
+        self.assertEqual([0, 2, 4, 6], sleep_odd.run_sync_many(range(4), eager=True))
+
+        with self.assertRaises(LnOfNegativeNumber):
+            async_natural_logarithm.run_sync_many([1.0, -1.0, 2.0], eager=True)
+
+    def test_run_sync_error(self):
+        with self.assertRaises(LnOfNegativeNumber):
+            async_natural_logarithm.run_sync(-1.0)
+
+        with self.assertRaises(LnOfNegativeNumber):
+            async_natural_logarithm.run_sync_many([1.0, -1.0])
+
+    def test_run_sync_context(self):
+        @async_transformer
+        async def current_request(data: None) -> str:
+            return _request_id.get()
+
+        token = _request_id.set("abc")
+        try:
+            self.assertEqual("abc", current_request.run_sync(None))
+        finally:
+            _request_id.reset(token)
+
+    def test_run_sync_inside_async_code(self):
+        @async_transformer
+        async def nested(num: float) -> float:
+            return async_plus1.run_sync(num)
+
+        @async_transformer
+        async def nested_twice(num: float) -> float:
+            return nested.run_sync(num)
+
+        self.assertEqual(2.0, nested.run_sync(1.0))
+        with self.assertRaises(RuntimeError):
+            nested_twice.run_sync(1.0)
+
+    def test_run_sync_on_threads(self):
+        graph = async_plus1 >> minus1 >> async_plus1
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(graph.run_sync, range(100)))
+
+        self.assertEqual([n + 1 for n in range(100)], results)
+
+    def test_configure_event_loop(self):
+        with patch("gloe.executors._event_loop._sync_runner", _SyncRunner()):
+            with patch.dict(sys.modules, {"uvloop": None}):
+                with self.assertRaises(ImportError):
+                    configure_event_loop(uvloop=True)
+
+        async_plus1.run_sync(1.0)
+        with self.assertRaises(RuntimeError):
+            configure_event_loop()
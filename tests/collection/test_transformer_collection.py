@@ -1,7 +1,7 @@
 import unittest
 
 from gloe.functional import transformer
-from gloe.collection import Map, MapOver, Filter
+from gloe.collection import Map, MapOver, Filter, Partition
 from tests.lib.transformers import square, plus1, sum_tuple2
 
 
@@ -50,3 +50,88 @@ class TestTransformerCollection(unittest.TestCase):
         result = list(mapping(-1.0))
 
         self.assertListEqual(result, data)
+
+    def test_transformer_partition(self):
+        """
+        Test the partition executes each branch once with its batch and puts the
+        outputs back in the original order
+        """
+        batches = []
+
+        @transformer
+        def halve_all(nums: list[int]) -> list[float]:
+            batches.append(nums)
+            return [num / 2 for num in nums]
+
+        @transformer
+        def describe_all(nums: list[int]) -> list[str]:
+            batches.append(nums)
+            return [f"odd {num}" for num in nums]
+
+        partition = (
+            Partition[int](lambda num: num % 2 == 0)
+            .Then(halve_all)
+            .ElseIf(lambda num: num > 100)
+            .Then(describe_all)
+            .ElseNone()
+        )
+
+        result = partition(iter([4, 101, 3, 10, 103]))
+
+        self.assertListEqual([2.0, "odd 101", None, 5.0, "odd 103"], result)
+        self.assertListEqual([[4, 10], [101, 103]], batches)
+        self.assertListEqual([2, 2, 1], getattr(partition, "hit_counts"))
+
+    def test_transformer_partition_name(self):
+        """
+        Test the name of a partition labels only its own node
+        """
+
+        @transformer
+        def keep_all(nums: list[int]) -> list[int]:
+            return nums
+
+        def is_even(num: int) -> bool:
+            return num % 2 == 0
+
+        unnamed = Partition[int](is_even).Then(keep_all).ElseNone()
+        named = Partition[int](is_even, name="evens").Then(keep_all).ElseNone()
+
+        self.assertEqual("is_even", unnamed.label)
+        self.assertEqual("evens", named.label)
+        self.assertEqual("_Partitioner", type(unnamed).__name__)
+
+    def test_transformer_partition_skips_empty_branches(self):
+        """
+        Test the partition doesn't execute branches without items
+        """
+
+        @transformer
+        def fail_all(nums: list[int]) -> list[int]:
+            raise AssertionError("It shouldn't be executed")
+
+        @transformer
+        def negate_all(nums: list[int]) -> list[int]:
+            return [-num for num in nums]
+
+        partition = Partition[int](lambda num: num < 0).Then(fail_all).Else(negate_all)
+
+        self.assertListEqual([-1, -2], partition([1, 2]))
+        self.assertListEqual([], partition([]))
+
+    def test_transformer_partition_wrong_batch_size(self):
+        """
+        Test the partition complains about branches not returning one output for
+        each item
+        """
+
+        @transformer
+        def first_only(nums: list[int]) -> list[int]:
+            return nums[:1]
+
+        partition = (
+            Partition[int](lambda num: num < 0).Then(first_only).Else(first_only)
+        )
+
+        with self.assertRaises(ValueError):
+            partition([1, 2, 3])
@@ -1,7 +1,8 @@
+import asyncio
 import unittest
 
-from gloe import async_transformer
-from gloe.collection import Map, FilterAsync, MapAsync, MapOverAsync
+from gloe import async_transformer, transformer
+from gloe.collection import Map, FilterAsync, MapAsync, MapOverAsync, Partition
 from tests.lib.transformers import (
     square,
     plus1,
@@ -57,3 +58,52 @@ class TestTransformerCollectionAsync(unittest.IsolatedAsyncioTestCase):
         result = list(await mapping(-1.0))
 
         self.assertListEqual(result, data)
+
+    async def test_transformer_async_partition(self):
+        """
+        Test the partition becomes async when any branch is async
+        """
+
+        @async_transformer
+        async def increment_all(nums: list[int]) -> list[int]:
+            return [num + 1 for num in nums]
+
+        @transformer
+        def decrement_all(nums: list[int]) -> list[int]:
+            return [num - 1 for num in nums]
+
+        partition = (
+            Partition[int](lambda num: num > 0)
+            .Then(decrement_all)
+            .ElseIf(lambda num: num < -10)
+            .Then(increment_all)
+            .Else(decrement_all)
+        )
+
+        self.assertListEqual([0, -19, -1, 4], await partition([1, -20, 0, 5]))
+
+    async def test_transformer_async_partition_cancels_branches(self):
+        """
+        Test the partition cancels the running branches when another one fails
+        """
+        cancelled = asyncio.Event()
+
+        @async_transformer
+        async def wait_all(nums: list[int]) -> list[int]:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return nums
+
+        @async_transformer
+        async def fail_all(nums: list[int]) -> list[int]:
+            await asyncio.sleep(0.01)
+            raise ValueError()
+
+        partition = Partition[int](lambda num: num > 0).Then(wait_all).Else(fail_all)
+
+        with self.assertRaises(ValueError):
+            await partition([1, -1])
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
@@ -2,8 +2,10 @@ from typing import TypeVar, Iterable
 
 from typing_extensions import assert_type
 
-from gloe import Transformer
-from gloe.collection import Map, Filter
+from typing import Union
+
+from gloe import Transformer, AsyncTransformer, async_transformer, transformer
+from gloe.collection import Map, Filter, Partition
 from gloe.utils import forward
 from tests.lib.transformers import format_currency, check_is_even
 from tests.type_utils.mypy_test_suite import MypyTestSuite
@@ -33,3 +35,39 @@ class TestTransformerCollectionTypes(MypyTestSuite):
         mapped_logarithm = forward[list[float]]() >> Filter(check_is_even)
 
         assert_type(mapped_logarithm, Transformer[list[float], Iterable[float]])
+
+    def test_transformer_partition(self):
+        """
+        Test the transformer partition collection operation
+        """
+
+        @transformer
+        def halve_all(nums: list[int]) -> list[float]:
+            return [num / 2 for num in nums]
+
+        @transformer
+        def describe_all(nums: list[int]) -> list[str]:
+            return [str(num) for num in nums]
+
+        @async_transformer
+        async def negate_all(nums: list[int]) -> list[int]:
+            return [-num for num in nums]
+
+        partition = (
+            Partition[int](lambda num: num > 0).Then(halve_all).Else(describe_all)
+        )
+
+        assert_type(partition, Transformer[Iterable[int], list[Union[float, str]]])
+
+        async_partition = (
+            Partition[int](lambda num: num > 0)
+            .Then(halve_all)
+            .ElseIf(lambda num: num < -10)
+            .Then(negate_all)
+            .ElseNone()
+        )
+
+        assert_type(
+            async_partition,
+            AsyncTransformer[Iterable[int], list[Union[float, int, None]]],
+        )
@@ -1,15 +1,28 @@
+import asyncio
+import time
 import unittest
 
-from gloe import If
-from tests.lib.conditioners import if_not_zero
+from gloe import If, async_transformer
+from tests.lib.conditioners import if_not_zero, async_if_not_zero
 from tests.lib.transformers import (
     square,
     plus1,
     minus1,
     async_plus1,
+    to_string,
 )
 
 
+async def _is_negative(num: float) -> bool:
+    await asyncio.sleep(0.01)
+    return num < 0
+
+
+async def _is_big(num: float) -> bool:
+    await asyncio.sleep(0.05)
+    return num > 10
+
+
 class TestAsyncConditionerTransformer(unittest.IsolatedAsyncioTestCase):
 
     async def test_conditioner_unsupported_argument(self):
@@ -37,3 +50,175 @@ class TestAsyncConditionerTransformer(unittest.IsolatedAsyncioTestCase):
             .Else(minus1)
         )
         self.assertEqual(121, await graph2(11))
+
+    async def test_async_condition(self):
+        """
+        Test async conditions make the conditioner async, even with sync branches
+        """
+        graph = async_if_not_zero.Then(plus1).Else(minus1)
+        self.assertEqual(2, await graph(1))
+        self.assertEqual(-1, await graph(0))
+
+        graph2 = If(_is_negative).Then(square).ElseNone()
+        self.assertEqual(4, await graph2(-2))
+        self.assertIsNone(await graph2(2))
+
+    async def test_async_else_if_condition(self):
+        """
+        Test async conditions chained after sync conditions
+        """
+        graph = (
+            If[float](lambda x: x == 0)
+            .Then(to_string)
+            .ElseIf(_is_negative)
+            .Then(square)
+            .Else(minus1)
+        )
+        self.assertEqual("0", await graph(0))
+        self.assertEqual(9, await graph(-3))
+        self.assertEqual(2, await graph(3))
+
+    async def test_concurrent_conditions(self):
+        """
+        Test the first condition that holds, in declaration order, is selected when
+        the conditions are evaluated concurrently
+        """
+        calls = []
+
+        async def _is_even(num: float) -> bool:
+            calls.append(num)
+            await asyncio.sleep(0.05)
+            return num % 2 == 0
+
+        graph = (
+            If(_is_big)
+            .Then(plus1)
+            .ElseIf(_is_even)
+            .Then(square)
+            .ElseIf(_is_negative)
+            .Then(minus1)
+            .Else(to_string, concurrent_conditions=True)
+        )
+
+        self.assertEqual(13, await graph(12))
+        self.assertEqual(-4, await graph(-3))
+        self.assertEqual(16, await graph(4))
+        self.assertEqual("3", await graph(3))
+        self.assertEqual([12, -3, 4, 3], calls)
+
+    async def test_concurrent_conditions_returning_awaitables(self):
+        """
+        Test plain functions returning awaitables are awaited as conditions when
+        the conditions are evaluated concurrently
+        """
+        graph = (
+            If(_is_negative)
+            .Then(plus1)
+            .ElseIf(lambda num: _is_big(num))
+            .Then(minus1)
+            .Else(to_string, concurrent_conditions=True)
+        )
+
+        self.assertEqual("1", await graph(1))
+        self.assertEqual(11, await graph(12))
+        self.assertEqual(0, await graph(-1))
+
+    async def test_concurrent_conditions_are_cancelled(self):
+        """
+        Test the conditions still running are cancelled once one holds
+        """
+        cancelled = asyncio.Event()
+
+        async def _never_answers(num: float) -> bool:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return False
+
+        graph = (
+            If(_is_negative)
+            .Then(plus1)
+            .ElseIf(_never_answers)
+            .Then(minus1)
+            .ElseNone(concurrent_conditions=True)
+        )
+
+        self.assertEqual(0, await graph(-1))
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    async def test_speculative_branch(self):
+        """
+        Test the most frequent branch is started together with the conditions and
+        cancelled when another branch is selected
+        """
+        started = []
+        cancelled = []
+
+        @async_transformer
+        async def slow_plus1(num: float) -> float:
+            started.append(num)
+            try:
+                await asyncio.sleep(0.05)
+            except asyncio.CancelledError:
+                cancelled.append(num)
+                raise
+            return num + 1
+
+        graph = If(_is_big).Then(slow_plus1).Else(minus1, speculative=True)
+
+        self.assertEqual(12, await graph(11))
+        self.assertEqual([11], started)
+
+        start = time.perf_counter()
+        self.assertEqual(21, await graph(20))
+        self.assertLess(time.perf_counter() - start, 0.09)
+
+        self.assertEqual(0, await graph(1))
+        self.assertEqual([11, 20, 1], started)
+        await asyncio.sleep(0)
+        self.assertEqual([1], cancelled)
+
+    async def test_speculative_copy_resets_predictions(self):
+        """
+        Test copies of speculative conditioners don't share the observed branches
+        """
+        graph = If(_is_negative).Then(async_plus1).Else(minus1, speculative=True)
+        await graph(-1)
+
+        copied = graph.copy()
+        self.assertIsNone(getattr(copied, "_predicted_branch"))
+        self.assertEqual(0, getattr(graph, "_predicted_branch"))
+
+    async def test_async_mutually_exclusive_reordering(self):
+        """
+        Test async conditions are reordered and counted as the sync ones
+        """
+        checked = []
+
+        async def _equals_one(num: float) -> bool:
+            checked.append(1)
+            return num == 1
+
+        async def _equals_two(num: float) -> bool:
+            checked.append(2)
+            return num == 2
+
+        graph = (
+            If(_equals_one)
+            .Then(plus1)
+            .ElseIf(_equals_two)
+            .Then(square)
+            .ElseNone(mutually_exclusive=True)
+        )
+
+        await graph(2)
+        await graph(2)
+        checked.clear()
+
+        self.assertEqual(4, await graph(2))
+        self.assertEqual([2], checked)
+        self.assertEqual(2, await graph(1))
+        self.assertIsNone(await graph(3))
+        self.assertEqual([1, 3, 1], getattr(graph, "hit_counts"))
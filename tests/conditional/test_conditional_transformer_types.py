@@ -6,7 +6,8 @@ from gloe import (
     Transformer,
     AsyncTransformer,
 )
-from tests.lib.conditioners import if_not_zero, if_is_even
+from gloe import If
+from tests.lib.conditioners import if_not_zero, if_is_even, async_if_not_zero
 from tests.lib.transformers import (
     square,
     square_root,
@@ -82,3 +83,27 @@ class TestTransformerTypes(MypyTestSuite):
             async_chained_conditions_graph,
             AsyncTransformer[float, Union[float, None]],
         )
+
+    def test_async_condition_flow_types(self):
+        """
+        Test the typing of conditions with async predicates
+        """
+
+        async def is_positive(num: float) -> bool:
+            return num > 0
+
+        async_condition_graph = async_if_not_zero.Then(plus1).Else(to_string)
+
+        assert_type(async_condition_graph, AsyncTransformer[float, Union[float, str]])
+
+        async_if_graph = If(is_positive).Then(plus1).ElseNone()
+
+        assert_type(async_if_graph, AsyncTransformer[float, Union[float, None]])
+
+        async_else_if_graph = (
+            if_is_even.Then(square).ElseIf(is_positive).Then(to_string).ElseNone()
+        )
+
+        assert_type(
+            async_else_if_graph, AsyncTransformer[float, Union[float, str, None]]
+        )
@@ -1,6 +1,8 @@
 import unittest
+from typing import Callable, cast
 
-from gloe import UnsupportedTransformerArgException
+from gloe import If, UnsupportedTransformerArgException
+from gloe.conditional._conditioner import Conditioner
 from tests.lib.conditioners import if_is_even, if_not_zero
 from tests.lib.transformers import square, square_root, plus1, minus1, to_string
 
@@ -94,3 +96,71 @@ class TestConditionerTransformer(unittest.TestCase):
                 .Then(_plus2)
                 .ElseNone()
             )
+
+    def test_sync_conditioner_with_awaitable_condition(self):
+        """
+        Test a sync conditioner refuses a condition returning an awaitable
+        """
+
+        async def _is_positive(num: float) -> bool:
+            return num > 0
+
+        is_positive = cast(Callable[[float], bool], lambda x: _is_positive(x))
+        graph = If(is_positive).Then(plus1).Else(minus1)
+
+        with self.assertRaises(TypeError):
+            graph(1)
+
+    def test_conditioner_hit_counts(self):
+        """
+        Test the conditioner counts how many times each branch is selected
+        """
+        graph = cast(
+            Conditioner,
+            If[float](lambda x: x < 0)
+            .Then(plus1)
+            .ElseIf(lambda x: x > 10)
+            .Then(minus1)
+            .Else(square),
+        )
+
+        for num in [-1, 11, 12, 5, 13]:
+            graph(num)
+
+        self.assertEqual([1, 3, 1], graph.hit_counts)
+        self.assertEqual([0, 0, 0], graph.copy().hit_counts)
+
+    def test_mutually_exclusive_reordering(self):
+        """
+        Test mutually exclusive conditions are checked in the order of how often
+        they hold, without changing the results
+        """
+        checked = []
+
+        def equals(value: int):
+            def _equals(num: float) -> bool:
+                checked.append(value)
+                return num == value
+
+            return _equals
+
+        graph = (
+            If(equals(0))
+            .Then(plus1)
+            .ElseIf(equals(1))
+            .Then(minus1)
+            .ElseIf(equals(2))
+            .Then(square)
+            .Else(to_string, mutually_exclusive=True)
+        )
+
+        for _ in range(3):
+            self.assertEqual(4, graph(2))
+
+        checked.clear()
+        self.assertEqual(4, graph(2))
+        self.assertEqual([2], checked)
+
+        self.assertEqual(1, graph(0))
+        self.assertEqual(0, graph(1))
+        self.assertEqual("3", graph(3))
@@ -0,0 +1,115 @@
+import unittest
+from typing import cast
+
+from gloe import Switch, UnsupportedTransformerArgException
+from gloe.conditional._conditioner import Conditioner
+from tests.lib.transformers import (
+    square,
+    plus1,
+    minus1,
+    to_string,
+    async_plus1,
+)
+
+
+def _remainder3(num: float) -> float:
+    return num % 3
+
+
+class TestSwitchTransformer(unittest.TestCase):
+    def test_switch_name(self):
+        """
+        Test the name of a switch transformer
+        """
+        graph = Switch(_remainder3).Case(0, plus1).Default(minus1)
+        self.assertEqual("_remainder3", graph.label)
+
+        named = Switch(_remainder3, name="remainder").Case(0, plus1).Default(minus1)
+        self.assertEqual("remainder", named.label)
+        self.assertEqual("_remainder3", graph.label)
+        self.assertIs(type(graph), type(named))
+        self.assertEqual("_SwitchConditioner", type(named).__name__)
+
+    def test_switch_dispatch(self):
+        """
+        Test the switch executes the transformer of the matched case
+        """
+        graph = Switch(_remainder3).Case(0, plus1).Case(1, minus1).Default(to_string)
+
+        self.assertEqual(4, graph(3))
+        self.assertEqual(3, graph(4))
+        self.assertEqual("5", graph(5))
+
+    def test_switch_hit_counts(self):
+        """
+        Test the switch counts how many times each case is selected
+        """
+        graph = Switch(_remainder3).Case(0, plus1).Case(1, minus1).Default(to_string)
+
+        for num in [3, 6, 9, 4, 5, 8]:
+            graph(num)
+
+        self.assertListEqual([3, 1, 2], cast(Conditioner, graph).hit_counts)
+
+    def test_switch_default_none(self):
+        """
+        Test the switch returning None when no case matches
+        """
+        graph = Switch(_remainder3).Case(0, plus1).DefaultNone()
+
+        self.assertEqual(4, graph(3))
+        self.assertIsNone(graph(4))
+
+    def test_switch_first_case_wins(self):
+        """
+        Test the first case is used when many cases have the same value
+        """
+        graph = Switch(_remainder3).Case(0, plus1).Case(0, minus1).DefaultNone()
+
+        self.assertEqual(1, graph(0))
+
+    def test_switch_in_flow(self):
+        """
+        Test the switch composed with other transformers and copied
+        """
+        graph = square >> Switch(_remainder3).Case(1, plus1).Default(minus1)
+
+        self.assertEqual(17, graph(4))
+        self.assertEqual(8, graph(3))
+        self.assertEqual(17, graph.copy()(4))
+        self.assertEqual(3, len(graph))
+
+    def test_switch_unsupported_argument(self):
+        """
+        Test the switch rejects cases which aren't transformers
+        """
+
+        def _plus2(num: float) -> float:
+            return num + 2
+
+        with self.assertRaises(UnsupportedTransformerArgException):
+            Switch(_remainder3).Case(0, _plus2)  # type: ignore
+
+        with self.assertRaises(UnsupportedTransformerArgException):
+            Switch(_remainder3).Case(0, plus1).Default(_plus2)  # type: ignore
+
+
+class TestAsyncSwitchTransformer(unittest.IsolatedAsyncioTestCase):
+    async def test_async_switch_dispatch(self):
+        """
+        Test the switch becomes async when any case is async
+        """
+        graph = Switch(_remainder3).Case(0, plus1).Case(1, async_plus1).Default(minus1)
+
+        self.assertEqual(4, await graph(3))
+        self.assertEqual(5, await graph(4))
+        self.assertEqual(4, await graph(5))
+
+    async def test_async_switch_default_none(self):
+        """
+        Test the async switch returning None when no case matches
+        """
+        graph = square >> Switch(_remainder3).Case(1, async_plus1).DefaultNone()
+
+        self.assertEqual(17, await graph(4))
+        self.assertIsNone(await graph(3))
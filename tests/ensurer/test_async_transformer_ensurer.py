@@ -1,4 +1,5 @@
 import asyncio
+import time
 import unittest
 from typing import TypeVar
 
@@ -8,7 +9,8 @@ from gloe import (
     UnsupportedTransformerArgException,
     AsyncTransformer,
 )
-from gloe.functional import partial_async_transformer
+from gloe.exceptions import UnsupportedEnsurerArgException
+from gloe.functional import partial_async_transformer, transformer
 from gloe.utils import forward
 from tests.lib.ensurers import (
     has_bar_key,
@@ -17,8 +19,15 @@ from tests.lib.ensurers import (
     foo_key_removed,
     is_str,
     is_odd,
+    open_ensured_calls,
+)
+from tests.lib.exceptions import (
+    NumbersEqual,
+    NumberIsEven,
+    HasNotBarKey,
+    HasNotFooKey,
+    IsNotInt,
 )
-from tests.lib.exceptions import NumbersEqual, NumberIsEven, HasNotBarKey, IsNotInt
 from tests.lib.transformers import async_plus1, minus1
 
 _In = TypeVar("_In")
@@ -185,6 +194,202 @@ class TestAsyncTransformerEnsurer(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(NumbersEqual):
             await ensured_pipeline(2)
 
+    async def test_ensure_pipeline_already_executed(self):
+        """
+        Test the ensurers of a pipeline executed before being ensured
+        """
+        pipeline = async_plus1 >> minus1
+        self.assertEqual(1.0, await pipeline(1.0))
+
+        ensured_pipeline = ensure(incoming=[is_odd])(pipeline)
+        with self.assertRaises(NumberIsEven):
+            await ensured_pipeline(2)
+
 
 if __name__ == "__main__":
     unittest.main()
+
+
+async def _slow_has_foo_key(data: dict[str, str]):
+    await asyncio.sleep(0.05)
+    if "foo" not in data:
+        raise HasNotFooKey()
+
+
+async def _slow_is_str(url: str):
+    await asyncio.sleep(0.05)
+    if not isinstance(url, str):
+        raise IsNotInt()
+
+
+class TestAsyncValidators(unittest.IsolatedAsyncioTestCase):
+    async def test_async_validators_run_concurrently(self):
+        """
+        Test async validators are awaited and executed concurrently
+        """
+
+        async def _slow_has_bar_key(data: dict[str, str]):
+            await asyncio.sleep(0.05)
+            if "bar" not in data:
+                raise HasNotBarKey()
+
+        async def _slow_same_data(url: str, data: dict[str, str]):
+            await asyncio.sleep(0.05)
+
+        ensured_request = ensure(
+            outcome=[_slow_has_foo_key], changes=[_slow_same_data]
+        )(request_data)
+
+        start = time.perf_counter()
+        self.assertDictEqual(_DATA, await ensured_request(_URL))
+        self.assertLess(time.perf_counter() - start, 0.09)
+
+        failing_request = ensure(outcome=[_slow_has_foo_key, _slow_has_bar_key])(
+            request_data
+        )
+        with self.assertRaises(HasNotBarKey):
+            await failing_request(_URL)
+
+    async def test_async_validators_on_pipelines(self):
+        """
+        Test async validators on the first and last async nodes of a pipeline
+        """
+
+        @async_transformer
+        async def copy_data(data: dict[str, str]) -> dict[str, str]:
+            return {**data}
+
+        ensured_pipeline = ensure(incoming=[_slow_is_str], outcome=[_slow_has_foo_key])(
+            request_data >> copy_data
+        )
+        self.assertDictEqual(_DATA, await ensured_pipeline(_URL))
+
+        with self.assertRaises(IsNotInt):
+            await ensured_pipeline(1)  # type: ignore
+
+    async def test_concurrent_incoming_validation(self):
+        """
+        Test input validators executed together with the transformer, which is
+        cancelled when the validation fails
+        """
+        cancelled = []
+
+        @async_transformer
+        async def slow_request(url: str) -> dict[str, str]:
+            try:
+                await asyncio.sleep(0.05)
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+            return _DATA
+
+        async def _fast_is_str(url: str):
+            await asyncio.sleep(0.01)
+            if not isinstance(url, str):
+                raise IsNotInt()
+
+        ensured_request = ensure(
+            incoming=[_slow_is_str, _fast_is_str], concurrent_incoming=True
+        )(slow_request)
+
+        start = time.perf_counter()
+        self.assertDictEqual(_DATA, await ensured_request(_URL))
+        self.assertLess(time.perf_counter() - start, 0.09)
+
+        with self.assertRaises(IsNotInt):
+            await ensured_request(1)  # type: ignore
+        await asyncio.sleep(0)
+        self.assertListEqual([1], cancelled)
+
+    async def test_async_validators_on_sync_transformers(self):
+        """
+        Test async validators can't ensure sync pipelines
+        """
+
+        @transformer
+        def to_dict(url: str) -> dict[str, str]:
+            return _DATA
+
+        with self.assertRaises(UnsupportedEnsurerArgException):
+            ensure(outcome=[_slow_has_foo_key])(to_dict)
+
+    async def test_async_validators_on_sync_boundaries(self):
+        """
+        Test async validators of async pipelines starting or ending with a sync
+        transformer
+        """
+
+        @transformer
+        def to_url(url: str) -> str:
+            return url
+
+        @transformer
+        def copy_data(data: dict[str, str]) -> dict[str, str]:
+            return {**data}
+
+        @transformer
+        def drop_foo(data: dict[str, str]) -> dict[str, str]:
+            return {k: v for k, v in data.items() if k != "foo"}
+
+        starting_sync = ensure(incoming=[_slow_is_str])(to_url >> request_data)
+        self.assertDictEqual(_DATA, await starting_sync("http://my-service"))
+        with self.assertRaises(IsNotInt):
+            await starting_sync(1)  # type: ignore[arg-type]
+
+        ending_sync = ensure(incoming=[_slow_is_str], outcome=[_slow_has_foo_key])(
+            request_data >> copy_data
+        )
+        self.assertDictEqual(_DATA, await ending_sync("http://my-service"))
+
+        failing = ensure(outcome=[_slow_has_foo_key])(request_data >> drop_foo)
+        with self.assertRaises(HasNotFooKey):
+            await failing("http://my-service")
+        self.assertEqual(2, len(failing))
+
+    async def test_async_pipeline_ensurer_on_tasks(self):
+        """
+        Test ensured pipelines executed concurrently by many tasks
+        """
+
+        def increased_by_2(data: int, output: int):
+            if output != data + 2:
+                raise NumbersEqual()
+
+        @async_transformer
+        async def slow_plus1(n: int) -> int:
+            await asyncio.sleep(0.001)
+            return n + 1
+
+        ensured_pipeline = ensure(changes=[increased_by_2])(slow_plus1 >> slow_plus1)
+
+        results = await asyncio.gather(*[ensured_pipeline(n) for n in range(200)])
+        self.assertListEqual([n + 2 for n in range(200)], results)
+
+    async def test_async_pipeline_ensurer_releases_calls(self):
+        """
+        Test ensured pipelines release their calls, even when a stage fails
+        """
+
+        def increased_by_2(data: float, output: float):
+            if output != data + 2:
+                raise NumbersEqual()
+
+        @transformer
+        def check_odd(n: float) -> float:
+            if n % 2 == 0:
+                raise NumberIsEven()
+            return n
+
+        only_incoming = ensure(incoming=[is_odd])(async_plus1 >> async_plus1)
+        ensured = ensure(changes=[increased_by_2])(
+            async_plus1 >> check_odd >> async_plus1
+        )
+
+        for n in range(10):
+            await only_incoming(n * 2 + 1)
+            self.assertEqual(n * 2 + 2, await ensured(n * 2))
+            with self.assertRaises(NumberIsEven):
+                await ensured(n * 2 + 1)
+
+        self.assertEqual([], open_ensured_calls())
+        self.assertEqual(6, await ensured(4))
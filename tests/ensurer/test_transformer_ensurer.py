@@ -1,5 +1,9 @@
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
+from gloe.ensurer import configure_ensurers
 from gloe.exceptions import UnsupportedEnsurerArgException
 from gloe.utils import forward
 
@@ -11,6 +15,7 @@ from tests.lib.exceptions import (
     NumbersEqual,
 )
 from tests.lib.ensurers import (
+    open_ensured_calls,
     is_odd,
     same_value,
     is_even,
@@ -329,3 +334,133 @@ class TestTransformerEnsurer(unittest.TestCase):
         ensured_pipeline = not_equal_ensurer(int_identity >> int_identity) >> forward()
 
         self.assertRaises(NumbersEqual, lambda: ensured_pipeline(2))
+
+    def test_disabled_ensurer(self):
+        @transformer
+        def int_identity(n: int) -> int:
+            return n
+
+        disabled = ensure(incoming=[is_odd], enabled=False)
+        self.assertIs(int_identity, disabled(int_identity))
+        self.assertEqual(2, disabled(int_identity)(2))
+
+        @ensure(outcome=[is_odd], enabled=False)
+        @partial_transformer
+        def add(n: int, m: int) -> int:
+            return n + m
+
+        self.assertEqual(4, add(2)(2))
+
+    def test_configure_ensurers(self):
+        @transformer
+        def int_identity(n: int) -> int:
+            return n
+
+        configure_ensurers(enabled=False)
+        try:
+            disabled = ensure(incoming=[is_odd])(int_identity)
+            enabled = ensure(incoming=[is_odd], enabled=True)(int_identity)
+        finally:
+            configure_ensurers()
+
+        self.assertEqual(2, disabled(2))
+        self.assertRaises(NumberIsEven, lambda: enabled(2))
+        self.assertRaises(ValueError, lambda: configure_ensurers(sample_every=0))
+
+    def test_sampled_ensurer(self):
+        calls: list[Any] = []
+
+        def track(n: int):
+            calls.append(n)
+
+        def tracked_changes(data: int, output: int):
+            calls.append((data, output))
+
+        @ensure(incoming=[track], changes=[tracked_changes], sample_every=3)
+        @transformer
+        def int_identity(n: int) -> int:
+            return n
+
+        for n in range(7):
+            int_identity(n)
+
+        self.assertListEqual([0, (0, 0), 3, (3, 3), 6, (6, 6)], calls)
+
+        @transformer
+        def int_plus1(n: int) -> int:
+            return n + 1
+
+        calls.clear()
+        sampled_pipeline = ensure(
+            incoming=[track], changes=[tracked_changes], sample_every=2
+        )(int_plus1 >> int_plus1)
+
+        for n in range(4):
+            sampled_pipeline(n)
+
+        self.assertListEqual([0, (0, 2), 2, (2, 4)], calls)
+        self.assertRaises(ValueError, lambda: ensure(incoming=[track], sample_every=0))
+
+    def test_pipeline_ensurer_on_threads(self):
+        def increased_by_2(data: int, output: int):
+            if output != data + 2:
+                raise NumbersNotEqual()
+
+        @transformer
+        def slow_plus1(n: int) -> int:
+            time.sleep(0.001)
+            return n + 1
+
+        ensured_pipeline = ensure(changes=[increased_by_2])(slow_plus1 >> slow_plus1)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(ensured_pipeline, range(200)))
+
+        self.assertListEqual([n + 2 for n in range(200)], results)
+
+    def test_pipeline_ensurer_inside_itself(self):
+        def increased(data: int, output: int):
+            if output <= data:
+                raise NumbersNotEqual()
+
+        @transformer
+        def int_plus1(n: int) -> int:
+            return n + 1
+
+        inner = ensure(changes=[increased])(int_plus1 >> int_plus1)
+
+        @transformer
+        def run_inner(n: int) -> int:
+            return inner(n * 10)
+
+        outer = ensure(changes=[increased])(int_plus1 >> run_inner)
+        self.assertEqual(22, outer(1))
+
+    def test_pipeline_ensurer_releases_calls(self):
+        def increased_by_2(data: int, output: int):
+            if output != data + 2:
+                raise NumbersNotEqual()
+
+        @transformer
+        def int_plus1(n: int) -> int:
+            return n + 1
+
+        @transformer
+        def check_positive(n: int) -> int:
+            if n <= 0:
+                raise NumberLessThanOrEquals10()
+            return n
+
+        only_incoming = ensure(incoming=[is_odd])(int_plus1 >> int_plus1)
+        ensured = ensure(changes=[increased_by_2])(
+            int_plus1 >> check_positive >> int_plus1
+        )
+
+        for n in range(10):
+            only_incoming(n * 2 + 1)
+            self.assertEqual(n + 2, ensured(n))
+            with self.assertRaises(NumberLessThanOrEquals10):
+                ensured(-n - 1)
+
+        self.assertEqual([], open_ensured_calls())
+        self.assertEqual(7, ensured(5))
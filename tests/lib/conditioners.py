@@ -9,3 +9,8 @@ def if_not_zero(x: float) -> bool:
 @condition
 def if_is_even(x: float) -> bool:
     return x % 2 == 0.0
+
+
+@condition
+async def async_if_not_zero(x: float) -> bool:
+    return x != 0
@@ -1,5 +1,7 @@
+from contextvars import copy_context
 from typing import Any
 
+from gloe._ensured_calls import _NO_CALL, _EnsuredCall
 from tests.lib.exceptions import (
     NumberIsEven,
     NumberIsOdd,
@@ -63,3 +65,12 @@ def foo_key_removed(incoming: dict[str, str], outcome: dict[str, str]):
 
     if "foo" in outcome.keys():
         raise HasFooKey()
+
+
+def open_ensured_calls() -> list[_EnsuredCall]:
+    """Calls of ensured pipelines still in progress in the current context"""
+    return [
+        call
+        for call in copy_context().values()
+        if isinstance(call, _EnsuredCall) and call is not _NO_CALL
+    ]
@@ -0,0 +1,354 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Any, Callable, cast
+
+from gloe import UnsupportedTransformerArgException, async_transformer, ensure
+from gloe import transformer
+from gloe.collection import Partition
+from gloe.executors import offload, with_executor
+from gloe.experimental import bridge
+from gloe.gateways import parallel
+from gloe.gateways._parallel import _BaseParallel
+from gloe.optimization import optimize
+from tests.lib.exceptions import LnOfNegativeNumber, NumbersEqual
+from tests.lib.transformers import async_plus1, minus1, natural_logarithm, plus1
+
+_request_id: ContextVar[str] = ContextVar("request_id", default="")
+
+
+class _ImmediateExecutor(Executor):
+    """Executes each submitted call right away, so the calls follow submission"""
+
+    def __init__(self):
+        self.submissions = 0
+
+    def submit(self, fn: Callable[..., Any], /, *args, **kwargs) -> Future:
+        self.submissions += 1
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def _recording(name: str, calls: list[str]):
+    @transformer
+    def record(num: float) -> str:
+        calls.append(name)
+        return name
+
+    record._label = name
+    return record
+
+
+class TestExecutors(unittest.TestCase):
+    def test_branches_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        @transformer
+        def wait(num: float) -> float:
+            barrier.wait()
+            return num
+
+        graph = with_executor(
+            parallel(wait >> plus1, wait >> minus1, wait), ThreadPoolExecutor(2)
+        )
+
+        self.assertEqual((11.0, 9.0, 10.0), graph(10.0))
+
+    def test_longest_branches_submitted_first(self):
+        calls: list[str] = []
+        gateway = parallel(
+            _recording("a", calls),
+            _recording("b", calls),
+            _recording("c", calls),
+            _recording("d", calls),
+        )
+        cast(_BaseParallel, gateway)._costs.estimates = [0.01, 0.0, 0.05, 0.02]
+        executor = _ImmediateExecutor()
+        graph = with_executor(gateway, executor, inline_below=0.001)
+
+        self.assertEqual(("a", "b", "c", "d"), graph(0.0))
+        self.assertEqual(["c", "d", "a", "b"], calls)
+        self.assertEqual(3, executor.submissions)
+
+    def test_cheap_branches_run_inline(self):
+        executor = _ImmediateExecutor()
+        graph = with_executor(parallel(plus1, minus1), executor, inline_below=1.0)
+
+        self.assertEqual((11.0, 9.0), graph(10.0))
+        self.assertEqual(1, executor.submissions)
+
+        self.assertEqual((11.0, 9.0), graph(10.0))
+        self.assertEqual(1, executor.submissions)
+
+    def test_copy_resets_estimates(self):
+        gateway = parallel(plus1, minus1)
+        with_executor(gateway, _ImmediateExecutor())(10.0)
+        costs = cast(_BaseParallel, gateway)._costs
+        copied_costs = cast(_BaseParallel, gateway.copy())._costs
+
+        self.assertLess(costs.estimates[0], float("inf"))
+        self.assertEqual([float("inf")] * 2, copied_costs.estimates)
+
+    def test_bridge_inside_branches(self):
+        num_bridge = bridge[float]("num")
+        graph = with_executor(
+            plus1
+            >> num_bridge.pick()
+            >> parallel(minus1 >> num_bridge.drop(), plus1 >> num_bridge.drop()),
+            ThreadPoolExecutor(2),
+        )
+
+        self.assertEqual(((10.0, 11.0), (12.0, 11.0)), graph(10.0))
+
+    def test_branch_exception(self):
+        graph = with_executor(parallel(plus1, natural_logarithm), ThreadPoolExecutor(2))
+
+        with self.assertRaises(LnOfNegativeNumber):
+            graph(-1.0)
+
+    def test_optimized_gateway(self):
+        graph = with_executor(
+            optimize(parallel(plus1 >> plus1, plus1 >> minus1, minus1)),
+            ThreadPoolExecutor(2),
+        )
+
+        self.assertEqual((12.0, 10.0, 9.0), graph(10.0))
+
+
+class TestAsyncExecutors(unittest.IsolatedAsyncioTestCase):
+    async def test_sync_branches_in_executor(self):
+        loop_thread = threading.get_ident()
+
+        @transformer
+        def thread_id(num: float) -> int:
+            return threading.get_ident()
+
+        @async_transformer
+        async def async_thread_id(num: float) -> int:
+            return threading.get_ident()
+
+        graph = with_executor(
+            parallel(thread_id, async_thread_id, async_plus1), ThreadPoolExecutor(2)
+        )
+        sync_thread, async_thread, result = await graph(10.0)
+
+        self.assertNotEqual(loop_thread, sync_thread)
+        self.assertEqual(loop_thread, async_thread)
+        self.assertEqual(11.0, result)
+
+    async def test_branch_exception(self):
+        graph = with_executor(
+            parallel(async_plus1, natural_logarithm), ThreadPoolExecutor(2)
+        )
+
+        with self.assertRaises(LnOfNegativeNumber):
+            await graph(-1.0)
+
+    async def test_optimized_gateway(self):
+        graph = with_executor(
+            optimize(parallel(plus1 >> async_plus1, plus1 >> minus1, minus1)),
+            ThreadPoolExecutor(2),
+        )
+
+        self.assertEqual((12.0, 10.0, 9.0), await graph(10.0))
+
+
+class TestEagerStart(unittest.IsolatedAsyncioTestCase):
+    async def test_branches_not_suspending_run_in_caller_task(self):
+        @async_transformer
+        async def current_task(num: float) -> Any:
+            return asyncio.current_task()
+
+        caller = asyncio.current_task()
+        eager = with_executor(
+            parallel(current_task, current_task, plus1),
+            ThreadPoolExecutor(2),
+            eager=True,
+        )
+        lazy = with_executor(
+            parallel(current_task, current_task, plus1), ThreadPoolExecutor(2)
+        )
+
+        first, second, result = await eager(0.0)
+        self.assertIs(caller, first)
+        self.assertIs(caller, second)
+        self.assertEqual(1.0, result)
+
+        first, second, _ = await lazy(0.0)
+        self.assertIsNot(caller, first)
+        self.assertIsNot(caller, second)
+
+    async def test_suspending_branches_run_concurrently(self):
+        first_started = asyncio.Event()
+        second_started = asyncio.Event()
+
+        @async_transformer
+        async def first(num: float) -> float:
+            first_started.set()
+            await second_started.wait()
+            return num + 1
+
+        @async_transformer
+        async def second(num: float) -> float:
+            second_started.set()
+            await first_started.wait()
+            return num - 1
+
+        graph = with_executor(
+            parallel(first, second, async_plus1), ThreadPoolExecutor(2), eager=True
+        )
+
+        self.assertEqual((1.0, -1.0, 1.0), await asyncio.wait_for(graph(0.0), 5))
+
+    async def test_branches_keep_their_own_context(self):
+        @async_transformer
+        async def set_request(num: float) -> str:
+            _request_id.set(f"branch {num}")
+            await asyncio.sleep(0)
+            return _request_id.get()
+
+        graph = with_executor(
+            parallel(set_request, set_request), ThreadPoolExecutor(2), eager=True
+        )
+        token = _request_id.set("caller")
+        try:
+            self.assertEqual(("branch 1.0", "branch 1.0"), await graph(1.0))
+            self.assertEqual("caller", _request_id.get())
+        finally:
+            _request_id.reset(token)
+
+    async def test_suspended_branches_cancelled_on_error(self):
+        cancelled = asyncio.Event()
+
+        @async_transformer
+        async def wait_forever(num: float) -> float:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return num
+
+        @async_transformer
+        async def fail(num: float) -> float:
+            raise LnOfNegativeNumber(num)
+
+        graph = with_executor(
+            parallel(wait_forever, fail), ThreadPoolExecutor(2), eager=True
+        )
+
+        with self.assertRaises(LnOfNegativeNumber):
+            await graph(-1.0)
+        await asyncio.wait_for(cancelled.wait(), 5)
+
+    async def test_eager_partition(self):
+        @async_transformer
+        async def double_all(nums: list[int]) -> list[int]:
+            return [num * 2 for num in nums]
+
+        @async_transformer
+        async def negate_all(nums: list[int]) -> list[int]:
+            await asyncio.sleep(0)
+            return [-num for num in nums]
+
+        graph = with_executor(
+            Partition[int](lambda num: num % 2 == 0).Then(double_all).Else(negate_all),
+            ThreadPoolExecutor(2),
+            eager=True,
+        )
+
+        self.assertEqual([-1, 4, -3, 8], await graph([1, 2, 3, 4]))
+
+
+@transformer
+def thread_id(num: float) -> int:
+    return threading.get_ident()
+
+
+class TestOffload(unittest.IsolatedAsyncioTestCase):
+    async def test_offload_every_sync_stage(self):
+        loop_thread = threading.get_ident()
+
+        @async_transformer
+        async def async_thread_id(ident: int) -> tuple[int, int]:
+            return ident, threading.get_ident()
+
+        graph = with_executor(
+            thread_id >> async_thread_id, ThreadPoolExecutor(2), offload="thread"
+        )
+        stage_thread, async_thread = await graph(0.0)
+
+        self.assertNotEqual(loop_thread, stage_thread)
+        self.assertEqual(loop_thread, async_thread)
+
+    async def test_event_loop_not_blocked(self):
+        signal = threading.Event()
+
+        @transformer
+        def wait_signal(num: float) -> bool:
+            return signal.wait(timeout=5)
+
+        async def send_signal():
+            signal.set()
+
+        graph = with_executor(
+            async_plus1 >> wait_signal, ThreadPoolExecutor(2), offload="thread"
+        )
+        received, _ = await asyncio.gather(graph(0.0), send_signal())
+
+        self.assertTrue(received)
+
+    async def test_automatic_offload(self):
+        loop_thread = threading.get_ident()
+        graph = with_executor(
+            async_plus1 >> thread_id,
+            ThreadPoolExecutor(2),
+            inline_below=1.0,
+            offload="auto",
+        )
+
+        self.assertNotEqual(loop_thread, await graph(0.0))
+        self.assertEqual(loop_thread, await graph(0.0))
+
+    async def test_ensured_pipeline_across_offloads(self):
+        def increased_by_2(data: float, output: float):
+            if output != data + 2:
+                raise NumbersEqual()
+
+        ensured = ensure(changes=[increased_by_2])(plus1 >> plus1)
+        graph = with_executor(
+            async_plus1 >> ensured, ThreadPoolExecutor(2), offload="thread"
+        )
+
+        self.assertEqual(3.0, await graph(0.0))
+
+    async def test_consecutive_sync_stages_offloaded_once(self):
+        executor = _ImmediateExecutor()
+        graph = with_executor(
+            async_plus1 >> plus1 >> minus1 >> plus1 >> async_plus1,
+            executor,
+            offload="thread",
+        )
+
+        self.assertEqual(3.0, await graph(0.0))
+        self.assertEqual(1, executor.submissions)
+
+    async def test_unknown_offload_policy(self):
+        with self.assertRaises(ValueError):
+            with_executor(
+                async_plus1,
+                ThreadPoolExecutor(2),
+                offload="process",  # type: ignore[call-overload]
+            )
+
+    async def test_offload_transformer(self):
+        loop_thread = threading.get_ident()
+        graph = async_plus1 >> offload(thread_id)
+
+        self.assertNotEqual(loop_thread, await graph(0.0))
+
+        with self.assertRaises(UnsupportedTransformerArgException):
+            offload(async_plus1)  # type: ignore[arg-type]
@@ -0,0 +1,154 @@
+import unittest
+from typing import Any
+
+from gloe import BaseTransformer
+from gloe.collection import Map
+from gloe.gateways import parallel
+from gloe.hooks import TransformerHook, register_hook, unregister_hook, with_hooks
+from tests.lib.exceptions import LnOfNegativeNumber
+from tests.lib.transformers import (
+    async_plus1,
+    minus1,
+    natural_logarithm,
+    plus1,
+    repeat_list,
+    sum_tuple2,
+)
+
+
+class RecorderHook(TransformerHook):
+    def __init__(self):
+        self.events: list[tuple[str, str, Any]] = []
+
+    def on_start(self, transformer: BaseTransformer, data: Any):
+        self.events.append(("start", transformer.label, data))
+
+    def on_end(self, transformer: BaseTransformer, data: Any, output: Any):
+        self.events.append(("end", transformer.label, output))
+
+    def on_error(
+        self, transformer: BaseTransformer, data: Any, exception: BaseException
+    ):
+        self.events.append(("error", transformer.label, type(exception)))
+
+
+class TestTransformerHooks(unittest.TestCase):
+    def test_global_hook(self):
+        hook = RecorderHook()
+        pipeline = plus1 >> minus1
+
+        register_hook(hook)
+        try:
+            self.assertEqual(pipeline(1.0), 1.0)
+        finally:
+            unregister_hook(hook)
+
+        self.assertListEqual(
+            hook.events,
+            [
+                ("start", "plus1", 1.0),
+                ("end", "plus1", 2.0),
+                ("start", "minus1", 2.0),
+                ("end", "minus1", 1.0),
+            ],
+        )
+
+        pipeline(1.0)
+        self.assertEqual(len(hook.events), 4)
+
+    def test_pipeline_hook(self):
+        hook = RecorderHook()
+        hooked = with_hooks(plus1 >> minus1, hook)
+
+        self.assertEqual(hooked(1.0), 1.0)
+        self.assertListEqual(
+            [(event, label) for event, label, _ in hook.events],
+            [
+                ("start", "minus1"),
+                ("start", "plus1"),
+                ("end", "plus1"),
+                ("start", "minus1"),
+                ("end", "minus1"),
+                ("end", "minus1"),
+            ],
+        )
+
+        (plus1 >> minus1)(1.0)
+        self.assertEqual(len(hook.events), 6)
+
+        (plus1 >> hooked)(1.0)
+        self.assertEqual(len(hook.events), 12)
+
+    def test_hooks_on_nested_transformers(self):
+        hook = RecorderHook()
+        pipeline = with_hooks(repeat_list(2) >> Map(plus1), hook)
+
+        self.assertEqual(pipeline(1.0), [2.0, 2.0])
+        self.assertListEqual(
+            [(event, label) for event, label, _ in hook.events],
+            [
+                ("start", "Map"),
+                ("start", "repeat_list"),
+                ("end", "repeat_list"),
+                ("start", "Map"),
+                ("start", "plus1"),
+                ("end", "plus1"),
+                ("start", "plus1"),
+                ("end", "plus1"),
+                ("end", "Map"),
+                ("end", "Map"),
+            ],
+        )
+
+    def test_hooks_on_gateways(self):
+        hook = RecorderHook()
+        pipeline = with_hooks(parallel(plus1, minus1) >> sum_tuple2, hook)
+
+        self.assertEqual(pipeline(1.0), 2.0)
+        labels = [label for event, label, _ in hook.events if event == "end"]
+        self.assertListEqual(
+            labels, ["plus1", "minus1", "_Parallel", "sum_tuple2", "sum_tuple2"]
+        )
+
+    def test_hook_on_error(self):
+        hook = RecorderHook()
+        pipeline = with_hooks(minus1 >> natural_logarithm, hook)
+
+        with self.assertRaises(LnOfNegativeNumber):
+            pipeline(0.0)
+
+        self.assertEqual(
+            hook.events[-1], ("error", "natural_logarithm", LnOfNegativeNumber)
+        )
+
+    def test_hooked_pipeline_graph(self):
+        pipeline = plus1 >> minus1
+        hooked = with_hooks(pipeline, RecorderHook())
+
+        self.assertEqual(len(hooked), len(pipeline))
+        self.assertEqual(
+            len(hooked.graph().nodes),
+            len(pipeline.graph().nodes),
+        )
+
+
+class TestAsyncTransformerHooks(unittest.IsolatedAsyncioTestCase):
+    async def test_async_pipeline_hook(self):
+        hook = RecorderHook()
+        pipeline = with_hooks(plus1 >> async_plus1 >> minus1, hook)
+
+        self.assertEqual(await pipeline(1.0), 2.0)
+        labels = [label for event, label, _ in hook.events if event == "end"]
+        self.assertListEqual(labels, ["plus1", "async_plus1", "minus1", "minus1"])
+
+    async def test_async_global_hook(self):
+        hook = RecorderHook()
+        pipeline = async_plus1 >> minus1
+
+        register_hook(hook)
+        try:
+            await pipeline(1.0)
+        finally:
+            unregister_hook(hook)
+
+        self.assertEqual(len(hook.events), 4)
@@ -0,0 +1,228 @@
+import asyncio
+import unittest
+from typing import Any, cast
+
+from gloe import BaseTransformer, async_transformer, ensure, transformer
+from gloe.collection import Filter, FilterAsync, Map, MapAsync
+from gloe.hooks import TransformerHook, with_hooks
+from gloe.gateways import parallel
+from gloe.optimization import (
+    eliminate_identities,
+    fuse_collections,
+    optimize,
+    share_prefixes,
+)
+from gloe.base_transformer import Flow
+from gloe.optimization._fusion import _FusedCollection, _FusedCollectionAsync
+from gloe.optimization._optimize import _BaseOptimized
+from gloe.optimization._parallel import _LoweredParallel
+from gloe.utils import attach, debug, forward
+from tests.lib.transformers import (
+    async_plus1,
+    check_is_even,
+    minus1,
+    plus1,
+    repeat_list,
+    square,
+    sum_tuple2,
+)
+
+
+@transformer
+def is_positive(num: float) -> bool:
+    return num > 0
+
+
+@async_transformer
+async def async_is_even(num: float) -> bool:
+    return num % 2 == 0
+
+
+def _plan(optimized: BaseTransformer) -> Flow:
+    return cast(_BaseOptimized, optimized).plan
+
+
+class LabelsHook(TransformerHook):
+    def __init__(self):
+        self.labels: list[str] = []
+
+    def on_start(self, transformer: BaseTransformer, data: Any):
+        self.labels.append(transformer.label)
+
+
+class TestCollectionFusion(unittest.TestCase):
+    def test_fused_chain(self):
+        pipeline = (
+            repeat_list(3)
+            >> Map(plus1)
+            >> Map(square)
+            >> Filter(check_is_even)
+            >> Map(minus1)
+        )
+        optimized = optimize(pipeline)
+
+        self.assertEqual(pipeline(1.0), optimized(1.0))
+        self.assertEqual([3.0, 3.0, 3.0], optimized(1.0))
+        self.assertEqual([], optimized(2.0))
+
+        self.assertEqual(2, len(_plan(optimized)))
+        self.assertIsInstance(_plan(optimized)[1], _FusedCollection)
+
+    def test_single_collections_are_not_fused(self):
+        flow = (repeat_list(2) >> Map(plus1))._flow
+        self.assertListEqual(flow, fuse_collections(flow))
+
+    def test_items_are_passed_through_all_stages(self):
+        calls = []
+
+        @transformer
+        def record(num: float) -> float:
+            calls.append(num)
+            return num
+
+        pipeline = Map(plus1) >> Map(record) >> Filter(is_positive) >> Map(record)
+        optimized = optimize(pipeline)
+
+        self.assertEqual([1.0, 2.0], optimized([0.0, -2.0, 1.0]))
+        self.assertListEqual([1.0, 1.0, -1.0, 2.0, 2.0], calls)
+
+    def test_fused_async_chain(self):
+        pipeline = (
+            Map(plus1)
+            >> MapAsync(async_plus1)
+            >> FilterAsync(async_is_even)
+            >> Map(square)
+        )
+        optimized = optimize(pipeline)
+
+        self.assertIsInstance(_plan(optimized)[0], _FusedCollectionAsync)
+        self.assertEqual(
+            asyncio.run(pipeline([0.0, 1.0, 2.0])),
+            asyncio.run(optimized([0.0, 1.0, 2.0])),
+        )
+        self.assertEqual([4.0, 16.0], asyncio.run(optimized([0.0, 1.0, 2.0])))
+
+    def test_graph_is_preserved(self):
+        pipeline = Map(plus1) >> Map(square) >> Filter(check_is_even)
+        optimized = optimize(pipeline)
+
+        self.assertEqual(pipeline.graph().to_dict(), optimized.graph().to_dict())
+        self.assertEqual(len(pipeline), len(optimized))
+
+    def test_hooks_observe_the_original_flow(self):
+        hook = LabelsHook()
+        optimized = with_hooks(optimize(Map(plus1) >> Map(square)), hook)
+
+        self.assertEqual([4.0], optimized([1.0]))
+        self.assertIn("Map", hook.labels)
+        self.assertNotIn("Map >> Map", hook.labels)
+
+
+class TestIdentityElimination(unittest.TestCase):
+    def test_forward_is_removed(self):
+        pipeline = forward[float]() >> plus1 >> forward[float]() >> square
+        optimized = optimize(pipeline)
+
+        self.assertEqual(2, len(_plan(optimized)))
+        self.assertEqual(4.0, optimized(1.0))
+
+    def test_attach_is_lowered(self):
+        pipeline = plus1 >> attach(square) >> sum_tuple2
+        optimized = optimize(pipeline)
+
+        plan = _plan(optimized)
+        self.assertEqual(3, len(plan))
+        self.assertIsInstance(plan[1], _LoweredParallel)
+        self.assertEqual(pipeline(2.0), optimized(2.0))
+
+    def test_gateway_branches_are_optimized(self):
+        pipeline = plus1 >> (
+            minus1,
+            forward[float]() >> forward[float](),
+            forward[float]() >> square,
+        )
+        optimized = optimize(pipeline)
+
+        self.assertEqual((1.0, 2.0, 4.0), optimized(1.0))
+        self.assertEqual(pipeline(1.0), optimized(1.0))
+
+    def test_gateway_without_identities_is_kept(self):
+        flow = (plus1 >> parallel(minus1, square))._flow
+        self.assertListEqual(flow, eliminate_identities(flow))
+
+    def test_effectful_invisible_nodes_are_kept(self):
+        flow = (plus1 >> debug())._flow
+        self.assertListEqual(flow, eliminate_identities(flow))
+
+    def test_async_attach_is_lowered(self):
+        pipeline = plus1 >> (async_plus1, forward[float]())
+        optimized = optimize(pipeline)
+
+        self.assertEqual((3.0, 2.0), asyncio.run(optimized(1.0)))
+        self.assertEqual(asyncio.run(pipeline(1.0)), asyncio.run(optimized(1.0)))
+
+    def test_identities_removed_before_fusion(self):
+        pipeline = Map(plus1) >> forward() >> Map(square)
+        optimized = optimize(pipeline)
+
+        self.assertEqual(1, len(_plan(optimized)))
+        self.assertEqual([4.0, 9.0], optimized([1.0, 2.0]))
+
+
+class TestPrefixSharing(unittest.TestCase):
+    def setUp(self):
+        self.calls: list[float] = []
+
+        @transformer
+        def parse(num: float) -> float:
+            self.calls.append(num)
+            return num * 10
+
+        self.parse = parse
+
+    def test_shared_prefix_is_executed_once(self):
+        parse = self.parse
+        pipeline = plus1 >> (parse >> plus1, parse >> minus1, square, parse)
+        optimized = optimize(pipeline)
+
+        self.assertEqual((21.0, 19.0, 4.0, 20.0), pipeline(1.0))
+        self.assertEqual(3, len(self.calls))
+
+        self.calls.clear()
+        self.assertEqual((21.0, 19.0, 4.0, 20.0), optimized(1.0))
+        self.assertListEqual([2.0], self.calls)
+
+        gateway = cast(_LoweredParallel, _plan(optimized)[1])
+        self.assertEqual(2, len(gateway.groups))
+        self.assertEqual([parse], gateway.groups[0].prefix)
+
+    def test_longest_prefix_is_shared(self):
+        parse = self.parse
+        pipeline = plus1 >> (parse >> square >> plus1, parse >> square >> minus1)
+        optimized = optimize(pipeline)
+
+        self.assertEqual(pipeline(1.0), optimized(1.0))
+        gateway = cast(_LoweredParallel, _plan(optimized)[1])
+        self.assertEqual(2, len(gateway.groups[0].prefix))
+
+    def test_different_transformers_are_not_shared(self):
+        flow = (plus1 >> (self.parse >> plus1, square >> plus1))._flow
+        self.assertListEqual(flow, share_prefixes(flow))
+
+    def test_ensured_copies_are_not_shared(self):
+        def is_number(num: float):
+            if not isinstance(num, float):
+                raise TypeError()
+
+        ensured_parse = ensure(incoming=[is_number])(self.parse)
+        flow = (plus1 >> (self.parse >> plus1, ensured_parse >> minus1))._flow
+
+        self.assertListEqual(flow, share_prefixes(flow))
+
+    def test_async_branches_share_prefix(self):
+        parse = self.parse
+        pipeline = plus1 >> (parse >> async_plus1, parse >> minus1)
+        optimized = optimize(pipeline)
+
+        self.assertEqual((21.0, 19.0), asyncio.run(optimized(1.0)))
+        self.assertListEqual([2.0], self.calls)
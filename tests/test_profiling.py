@@ -0,0 +1,186 @@
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+from gloe import transformer
+from gloe.collection import Filter, Map
+from gloe.hooks import with_hooks
+from gloe.profiling import NodeStats, Profiler
+from gloe.profiling._memory import approximate_size
+from tests.lib.exceptions import LnOfNegativeNumber
+from tests.lib.transformers import (
+    check_is_even,
+    minus1,
+    natural_logarithm,
+    plus1,
+    repeat_list,
+)
+
+
+class TestProfiler(unittest.TestCase):
+    def test_node_stats(self):
+        profiler = Profiler()
+        pipeline = repeat_list(3) >> Map(plus1) >> Filter(check_is_even)
+        profiled = with_hooks(pipeline, profiler)
+
+        for _ in range(4):
+            profiled(1.0)
+
+        stats = profiler.stats
+        map_node, filter_node = pipeline._flow[1], pipeline._flow[2]
+        plus1_node = map_node.children[0]
+
+        self.assertEqual(stats[pipeline._flow[0].node_id].calls, 4)
+        self.assertEqual(stats[plus1_node.node_id].calls, 12)
+        self.assertEqual(stats[map_node.node_id].items_in, 12)
+        self.assertEqual(stats[map_node.node_id].items_out, 12)
+        self.assertEqual(stats[filter_node.node_id].items_in, 12)
+        self.assertEqual(stats[filter_node.node_id].items_out, 12)
+
+        map_stats = stats[map_node.node_id]
+        self.assertGreaterEqual(map_stats.total_time, map_stats.max_time)
+        self.assertGreaterEqual(map_stats.max_time, map_stats.p99_time)
+
+    def test_errors(self):
+        profiler = Profiler()
+        pipeline = with_hooks(minus1 >> natural_logarithm, profiler)
+
+        with self.assertRaises(LnOfNegativeNumber):
+            pipeline(0.0)
+
+        errors = {s.label: s.errors for s in profiler.stats.values()}
+        self.assertEqual(errors["natural_logarithm"], 1)
+        self.assertEqual(errors["minus1"], 0)
+
+    def test_percentile(self):
+        stats = NodeStats(node_id="", label="", samples=[float(i) for i in range(100)])
+        self.assertEqual(stats.percentile(99), 98.0)
+        self.assertEqual(stats.percentile(50), 49.0)
+        self.assertEqual(NodeStats(node_id="", label="").p99_time, 0.0)
+
+    def test_max_samples(self):
+        profiler = Profiler(max_samples=10)
+        profiled = with_hooks(plus1, profiler)
+
+        for _ in range(100):
+            profiled(1.0)
+
+        for stats in profiler.stats.values():
+            self.assertEqual(stats.calls, 100)
+            self.assertEqual(len(stats.samples), 10)
+
+    def test_heatmap_overlay(self):
+        profiler = Profiler()
+        pipeline = minus1 >> repeat_list(3) >> Map(plus1)
+        with_hooks(pipeline, profiler)(1.0)
+
+        original = pipeline.graph()
+        heated = profiler.overlay(original)
+
+        minus1_node = pipeline._flow[0].node_id
+        self.assertEqual(heated.nodes[minus1_node]["style"], "filled")
+        self.assertIn("1 calls", heated.nodes[minus1_node]["label"])
+        self.assertNotIn("style", original.nodes[minus1_node])
+
+        map_node = pipeline._flow[2]
+        map_cluster = f"cluster_{map_node.node_id}"
+        edge_labels = [
+            attrs["label"]
+            for (u, v), attrs in heated.edges.items()
+            if v == f"{map_cluster}begin" or u == f"{map_cluster}end"
+        ]
+        self.assertEqual(len(edge_labels), 2)
+        for label in edge_labels:
+            self.assertIn("(3 items)", label)
+
+        map_subgraph = heated.subgraphs[0]
+        self.assertIn("1 calls", map_subgraph.attrs["label"])
+        plus1_node = map_node.children[0].node_id
+        self.assertIn("3 calls", map_subgraph.nodes[plus1_node]["label"])
+
+    def test_save(self):
+        profiler = Profiler()
+        with_hooks(plus1 >> minus1, profiler)(1.0)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "profile.json")
+            profiler.save(path)
+            with open(path) as file:
+                saved = json.load(file)
+
+        self.assertEqual(len(saved), 3)
+        profiler.reset()
+        self.assertEqual(len(profiler.stats), 0)
+
+
+@transformer
+def allocate(size: int) -> list[int]:
+    return list(range(size))
+
+
+@transformer
+def allocate_and_drop(size: int) -> int:
+    return len(list(range(size)))
+
+
+class TestMemoryProfiler(unittest.TestCase):
+    def setUp(self):
+        self._was_tracing = tracemalloc.is_tracing()
+
+    def tearDown(self):
+        if not self._was_tracing:
+            tracemalloc.stop()
+
+    def test_memory_stats(self):
+        profiler = Profiler(memory=True, measure_output=True)
+        pipeline = allocate >> Map(allocate_and_drop)
+        with_hooks(pipeline, profiler)(50)
+
+        stats = profiler.stats
+        allocate_stats = stats[pipeline._flow[0].node_id]
+        map_node = pipeline._flow[1]
+        drop_stats = stats[map_node.children[0].node_id]
+        map_stats = stats[map_node.node_id]
+
+        self.assertGreater(allocate_stats.allocated_bytes, 50 * 8)
+        self.assertGreater(allocate_stats.output_bytes, 50 * 8)
+        self.assertGreater(drop_stats.peak_bytes, 49 * 8)
+        self.assertLess(
+            drop_stats.allocated_bytes / drop_stats.calls, drop_stats.peak_bytes
+        )
+        self.assertGreaterEqual(map_stats.peak_bytes, drop_stats.peak_bytes)
+
+        heated = profiler.overlay(pipeline.graph())
+        self.assertIn("peak", heated.nodes[pipeline._flow[0].node_id]["label"])
+
+    def test_stop_tracing(self):
+        if self._was_tracing:
+            self.skipTest("the memory was already being traced")
+
+        with Profiler(memory=True) as profiler:
+            with_hooks(allocate, profiler)(50)
+            self.assertTrue(tracemalloc.is_tracing())
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertNotEqual({}, profiler.stats)
+
+        tracemalloc.start()
+        profiler = Profiler(memory=True)
+        with_hooks(allocate, profiler)(50)
+        profiler.stop()
+        self.assertTrue(tracemalloc.is_tracing())
+
+    def test_memory_disabled(self):
+        profiler = Profiler()
+        with_hooks(allocate, profiler)(50)
+
+        for stats in profiler.stats.values():
+            self.assertEqual(stats.peak_bytes, 0)
+            self.assertEqual(stats.output_bytes, 0)
+
+    def test_approximate_size(self):
+        self.assertGreater(approximate_size([[1, 2], {"a": "b"}]), 0)
+        self.assertGreater(
+            approximate_size(list(range(100))), approximate_size(list(range(10)))
+        )
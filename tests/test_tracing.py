@@ -0,0 +1,324 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from typing import Any, Optional, cast
+from unittest.mock import MagicMock, patch
+
+from gloe import async_transformer
+from gloe.collection import Map
+from gloe.hooks import with_hooks, register_hook, unregister_hook
+from gloe.tracing import (
+    ChromeTraceExporter,
+    InMemoryExporter,
+    JSONLExporter,
+    OpenTelemetryExporter,
+    Span,
+    Tracer,
+)
+from tests.lib.exceptions import LnOfNegativeNumber
+from tests.lib.transformers import (
+    async_plus1,
+    minus1,
+    natural_logarithm,
+    plus1,
+    repeat_list,
+)
+
+try:
+    from opentelemetry.sdk.trace import (  # type: ignore[attr-defined]
+        TracerProvider,
+    )
+    from opentelemetry.sdk.trace.export import (  # type: ignore[attr-defined]
+        SimpleSpanProcessor,
+    )
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    _HAS_OPENTELEMETRY = True
+except ImportError:  # pragma: no cover
+    _HAS_OPENTELEMETRY = False
+
+
+def _children(spans: list[Span], parent: Span) -> list[Span]:
+    return [span for span in spans if span.parent_id == parent.span_id]
+
+
+class TestTracing(unittest.TestCase):
+    def test_span_hierarchy(self):
+        exporter = InMemoryExporter()
+        pipeline = with_hooks(repeat_list(2) >> Map(plus1), Tracer(exporter))
+
+        pipeline(1.0)
+
+        spans = exporter.spans
+        self.assertEqual(len(spans), 5)
+        self.assertEqual(len({span.trace_id for span in spans}), 1)
+
+        root = spans[-1]
+        self.assertIsNone(root.parent_id)
+        self.assertListEqual(
+            [span.name for span in _children(spans, root)], ["repeat_list", "Map"]
+        )
+
+        map_span = _children(spans, root)[1]
+        self.assertListEqual(
+            [span.name for span in _children(spans, map_span)], ["plus1", "plus1"]
+        )
+        for span in spans:
+            self.assertEqual(span.status, "ok")
+            self.assertGreaterEqual(cast(int, span.duration), 0)
+
+    def test_error_span(self):
+        exporter = InMemoryExporter()
+        pipeline = with_hooks(minus1 >> natural_logarithm, Tracer(exporter))
+
+        with self.assertRaises(LnOfNegativeNumber):
+            pipeline(0.0)
+
+        statuses = [(span.name, span.status) for span in exporter.spans]
+        self.assertListEqual(
+            statuses,
+            [
+                ("minus1", "ok"),
+                ("natural_logarithm", "error"),
+                ("natural_logarithm", "error"),
+            ],
+        )
+        self.assertIn("LnOfNegativeNumber", str(exporter.spans[-1].error))
+
+    def test_sampling(self):
+        exporter = InMemoryExporter()
+        pipeline = with_hooks(plus1 >> minus1, Tracer(exporter, sample_every=3))
+
+        for _ in range(6):
+            pipeline(1.0)
+
+        self.assertEqual(len({span.trace_id for span in exporter.spans}), 2)
+        self.assertEqual(len(exporter.spans), 6)
+
+    def test_invalid_sampling(self):
+        with self.assertRaises(ValueError):
+            Tracer(InMemoryExporter(), sample_every=0)
+
+    def test_global_tracer(self):
+        exporter = InMemoryExporter()
+        tracer = Tracer(exporter)
+        pipeline = plus1 >> minus1
+        register_hook(tracer)
+        try:
+            pipeline(1.0)
+            pipeline(2.0)
+        finally:
+            unregister_hook(tracer)
+
+        spans = exporter.spans
+        self.assertListEqual(
+            [span.name for span in spans], ["plus1", "minus1", "plus1", "minus1"]
+        )
+        self.assertEqual(spans[0].trace_id, spans[1].trace_id)
+        self.assertEqual(spans[2].trace_id, spans[3].trace_id)
+        self.assertNotEqual(spans[0].trace_id, spans[2].trace_id)
+        self.assertTrue(all(span.parent_id is None for span in spans))
+
+    def test_global_tracer_sampling(self):
+        exporter = InMemoryExporter()
+        tracer = Tracer(exporter, sample_every=3)
+        pipeline = plus1 >> minus1 >> plus1
+        register_hook(tracer)
+        try:
+            for _ in range(6):
+                pipeline(1.0)
+        finally:
+            unregister_hook(tracer)
+
+        spans = exporter.spans
+        self.assertListEqual(
+            [span.name for span in spans],
+            ["plus1", "minus1", "plus1", "plus1", "minus1", "plus1"],
+        )
+        self.assertEqual(1, len({span.trace_id for span in spans[:3]}))
+        self.assertEqual(1, len({span.trace_id for span in spans[3:]}))
+        self.assertNotEqual(spans[0].trace_id, spans[3].trace_id)
+
+    def test_jsonl_exporter(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "traces.jsonl")
+            exporter = JSONLExporter(path)
+            pipeline = with_hooks(plus1 >> minus1, Tracer(exporter))
+
+            pipeline(1.0)
+            exporter.shutdown()
+
+            with open(path) as file:
+                spans = [Span.from_dict(json.loads(line)) for line in file]
+
+        self.assertListEqual(
+            [span.name for span in spans], ["plus1", "minus1", "minus1"]
+        )
+
+    @patch("builtins.__import__", side_effect=ImportError)
+    def test_no_opentelemetry_installed(self, mock_import: MagicMock):
+        with self.assertRaises(ImportError):
+            OpenTelemetryExporter()
+
+    @unittest.skipUnless(_HAS_OPENTELEMETRY, "opentelemetry-sdk is not installed")
+    def test_opentelemetry_exporter(self):
+        otel_exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(otel_exporter))
+        tracer = Tracer(OpenTelemetryExporter(provider))
+        pipeline = plus1 >> repeat_list(2) >> Map(minus1)
+
+        register_hook(tracer)
+        try:
+            with provider.get_tracer("test").start_as_current_span("outer") as outer:
+                pipeline(1.0)
+                self.assertEqual(5, len(otel_exporter.get_finished_spans()))
+                pipeline(2.0)
+        finally:
+            unregister_hook(tracer)
+
+        *otel_spans, outer_span = otel_exporter.get_finished_spans()
+        self.assertEqual("outer", outer_span.name)
+        traces: dict[int, dict[str, Any]] = {}
+        for otel_span in otel_spans:
+            trace = traces.setdefault(otel_span.context.trace_id, {})
+            trace[otel_span.name] = otel_span
+        self.assertEqual(2, len(traces))
+        self.assertNotIn(outer.context.trace_id, traces)
+
+        for trace in traces.values():
+            self.assertSetEqual({"plus1", "repeat_list", "Map", "minus1"}, set(trace))
+            roots = [trace["plus1"], trace["repeat_list"], trace["Map"]]
+            self.assertEqual(1, len({root.parent.span_id for root in roots}))
+            self.assertTrue(all(root.parent.is_remote for root in roots))
+            self.assertEqual(
+                trace["Map"].context.span_id, trace["minus1"].parent.span_id
+            )
+
+
+class TestAsyncTracing(unittest.IsolatedAsyncioTestCase):
+    async def test_async_span_hierarchy(self):
+        exporter = InMemoryExporter()
+        pipeline = with_hooks(
+            async_plus1 >> repeat_list(2) >> Map(plus1 >> minus1),
+            Tracer(exporter),
+        )
+
+        await pipeline(1.0)
+
+        spans = exporter.spans
+        root = spans[-1]
+        self.assertListEqual(
+            [span.name for span in _children(spans, root)],
+            ["async_plus1", "repeat_list", "Map"],
+        )
+        self.assertTrue(_children(spans, root)[0].attributes["is_async"])
+
+        map_span = _children(spans, root)[-1]
+        self.assertListEqual(
+            [span.name for span in _children(spans, map_span)],
+            ["plus1", "minus1", "plus1", "minus1"],
+        )
+
+    async def test_cancelled_run(self):
+        exporter = InMemoryExporter()
+        tracer = Tracer(exporter)
+        started = asyncio.Event()
+
+        @async_transformer
+        async def wait_forever(num: float) -> float:
+            started.set()
+            await asyncio.Event().wait()
+            return num
+
+        pipeline = with_hooks(plus1 >> wait_forever, tracer)
+
+        async def run() -> Optional[Span]:
+            try:
+                await pipeline(1.0)
+            except asyncio.CancelledError:
+                pass
+            return tracer.current_span
+
+        task = asyncio.ensure_future(run())
+        await started.wait()
+        task.cancel()
+
+        self.assertIsNone(await task)
+        spans = exporter.spans
+        self.assertListEqual(
+            [(span.name, span.status) for span in spans],
+            [("plus1", "ok"), ("wait_forever", "error"), (pipeline.label, "error")],
+        )
+
+
+class TestChromeTrace(unittest.IsolatedAsyncioTestCase):
+    def test_sync_trace_events(self):
+        exporter = ChromeTraceExporter()
+        pipeline = with_hooks(repeat_list(2) >> Map(plus1), Tracer(exporter))
+
+        pipeline(1.0)
+
+        events = exporter.to_dict()["traceEvents"]
+        metadata = [event for event in events if event["ph"] == "M"]
+        slices = [event for event in events if event["ph"] == "X"]
+
+        self.assertEqual(len(metadata), 1)
+        self.assertTrue(metadata[0]["args"]["name"].startswith("thread "))
+        self.assertListEqual(
+            sorted(event["name"] for event in slices),
+            ["Map", "Map", "plus1", "plus1", "repeat_list"],
+        )
+        map_slice = next(
+            e for e in slices if e["name"] == "Map" and e["args"]["parent_id"]
+        )
+        map_items = [e for e in slices if e["name"] == "plus1"]
+        for item in map_items:
+            self.assertGreaterEqual(item["ts"], map_slice["ts"])
+            self.assertLessEqual(
+                item["ts"] + item["dur"], map_slice["ts"] + map_slice["dur"]
+            )
+            self.assertEqual(item["args"]["parent_id"], map_slice["args"]["span_id"])
+
+    async def test_task_tracks(self):
+        exporter = ChromeTraceExporter()
+        pipeline = with_hooks(async_plus1 >> minus1, Tracer(exporter))
+
+        await asyncio.gather(
+            asyncio.create_task(pipeline(1.0), name="first"),
+            asyncio.create_task(pipeline(2.0), name="second"),
+        )
+
+        events = exporter.to_dict()["traceEvents"]
+        track_names = {
+            event["tid"]: event["args"]["name"]
+            for event in events
+            if event["ph"] == "M"
+        }
+        self.assertSetEqual(set(track_names.values()), {"first", "second"})
+
+        slices_per_track = {
+            name: [e["name"] for e in events if e["ph"] == "X" and e["tid"] == tid]
+            for tid, name in track_names.items()
+        }
+        self.assertListEqual(
+            sorted(slices_per_track["first"]), ["async_plus1", "minus1", "minus1"]
+        )
+
+    def test_save(self):
+        exporter = ChromeTraceExporter()
+        with_hooks(plus1, Tracer(exporter))(1.0)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "trace.json")
+            exporter.save(path)
+            with open(path) as file:
+                saved = json.load(file)
+
+        self.assertEqual(len(saved["traceEvents"]), 3)
+        exporter.clear()
+        self.assertEqual(len(exporter.to_dict()["traceEvents"]), 0)
@@ -1,7 +1,11 @@
+import asyncio
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
+from gloe import async_transformer, transformer
 from gloe.experimental import EmptyBridgeOnDrop, bridge
-from tests.lib.transformers import plus1, minus1
+from tests.lib.transformers import async_plus1, plus1, minus1
 
 
 class TestTransformerBridges(unittest.TestCase):
@@ -18,3 +22,79 @@ class TestTransformerBridges(unittest.TestCase):
         graph = plus1 >> minus1 >> num_bridge.drop()
 
         self.assertRaises(EmptyBridgeOnDrop, lambda: graph(0))
+
+    def test_value_released_after_invocation(self):
+        num_bridge = bridge[float]("num")
+
+        pick_graph = plus1 >> num_bridge.pick()
+        drop_graph = minus1 >> num_bridge.drop()
+
+        self.assertEqual(11.0, pick_graph(10.0))
+        self.assertRaises(EmptyBridgeOnDrop, lambda: drop_graph(0))
+
+    def test_bridge_across_nested_pipelines(self):
+        num_bridge = bridge[float]("num")
+        inner = minus1 >> num_bridge.drop()
+
+        @transformer
+        def run_inner(num: float) -> tuple[float, float]:
+            return inner(num)
+
+        graph = plus1 >> num_bridge.pick() >> run_inner
+
+        self.assertEqual((10.0, 11.0), graph(10.0))
+
+    def test_bridge_inside_gateway_branches(self):
+        num_bridge = bridge[float]("num")
+
+        graph = num_bridge.pick() >> (
+            plus1 >> num_bridge.drop(),
+            minus1 >> num_bridge.drop(),
+        )
+
+        self.assertEqual(((11.0, 10.0), (9.0, 10.0)), graph(10.0))
+
+    def test_bridge_on_threads(self):
+        num_bridge = bridge[int]("num")
+
+        @transformer
+        def slow_plus1(num: int) -> int:
+            time.sleep(0.001)
+            return num + 1
+
+        graph = num_bridge.pick() >> slow_plus1 >> num_bridge.drop()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(graph, range(100)))
+
+        self.assertListEqual([(n + 1, n) for n in range(100)], results)
+
+    def test_async_bridge_isolated_between_tasks(self):
+        num_bridge = bridge[float]("num")
+
+        @async_transformer
+        async def async_sleep(num: float) -> float:
+            await asyncio.sleep(0.001)
+            return num
+
+        async_pick = num_bridge.pick() >> async_sleep
+        graph = async_pick >> (async_plus1 >> num_bridge.drop(), num_bridge.drop())
+
+        async def run_all():
+            return await asyncio.gather(*[graph(num) for num in range(20)])
+
+        results = asyncio.run(run_all())
+
+        self.assertListEqual([((n + 1, n), (n, n)) for n in range(20)], list(results))
+
+    def test_async_bridge_on_offloaded_stage(self):
+        num_bridge = bridge[float]("num")
+        drop_graph = minus1 >> num_bridge.drop()
+
+        @async_transformer
+        async def offload_drop(num: float) -> tuple[float, float]:
+            return await asyncio.to_thread(drop_graph, num)
+
+        graph = num_bridge.pick() >> async_plus1 >> offload_drop
+
+        self.assertEqual((10.0, 10.0), asyncio.run(graph(10.0)))
@@ -1,10 +1,14 @@
+import io
+import sys
 import unittest
 import tempfile
 
 from unittest.mock import MagicMock, patch
 
-from gloe.collection import Map
-from tests.lib.transformers import plus1, repeat_list
+from gloe._gloe_graph import GloeGraph
+from gloe.collection import Map, MapAsync
+from tests.lib.conditioners import if_not_zero
+from tests.lib.transformers import async_plus1, minus1, plus1, repeat_list
 
 
 class TestTransformerExport(unittest.TestCase):
@@ -14,8 +18,76 @@ class TestTransformerExport(unittest.TestCase):
     @patch("builtins.__import__", side_effect=ImportError)
     def test_no_graphviz_installed(self, mock_import: MagicMock):
         with self.assertRaises(ImportError):
-            with tempfile.NamedTemporaryFile(suffix=".dot", delete=False) as temp:
-                self.foo.to_dot(temp.name)
+            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as temp:
+                self.foo.to_image(temp.name)
+
+    @patch.dict(sys.modules, {"pygraphviz": None})
+    def test_to_dot_without_graphviz(self):
+        with tempfile.NamedTemporaryFile(suffix=".dot", delete=False) as temp:
+            self.foo.to_dot(temp.name)
+
+        with open(temp.name) as file:
+            content = file.read()
+
+        self.assertTrue(content.startswith('strict digraph "" {'))
+        self.assertEqual(2, content.count("subgraph "))
+        self.assertEqual(2, content.count('label="Map"'))
+        self.assertIn('label="list[float]"', content)
+
+    def test_write_dot_nested_clusters(self):
+        graph = self.foo.graph()
+        inner_cluster = graph.subgraphs[0].subgraphs[0]
+
+        stream = io.StringIO()
+        graph.write_dot(stream, with_edge_labels=False)
+        lines = stream.getvalue().splitlines()
+
+        self.assertEqual("}", lines[-1])
+        self.assertIn(f'\t\tsubgraph "{inner_cluster.name}" {{', lines)
+        self.assertEqual(lines.count("\t}"), 1)
+        self.assertEqual(lines.count("\t\t}"), 1)
+        self.assertFalse(any('label="list[float]"' in line for line in lines))
+
+    def test_json_topology(self):
+        pipeline = repeat_list(10) >> (
+            MapAsync(async_plus1),
+            Map(if_not_zero.Then(plus1).Else(minus1)),
+        )
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as temp:
+            pipeline.to_json(temp.name)
+
+        with open(temp.name) as file:
+            loaded = GloeGraph.read_json(file)
+
+        topology = loaded.to_dict()
+        self.assertEqual(1, topology["version"])
+        self.assertEqual(pipeline.graph().to_dict(), topology)
+
+        node_types = [node["type"] for node in topology["nodes"]]
+        self.assertIn("ParallelGatewayBegin", node_types)
+        self.assertIn("ParallelGatewayEnd", node_types)
+
+        async_map, condition_map = loaded.subgraphs
+        async_node = async_map.to_dict()["nodes"][1]
+        self.assertEqual(
+            ("async_plus1", True), (async_node["label"], async_node["async"])
+        )
+        self.assertEqual(
+            ("float", "float"), (async_node["input"], async_node["output"])
+        )
+
+        condition_node = condition_map.to_dict()["nodes"][1]
+        self.assertEqual("ConditionBegin", condition_node["type"])
+        self.assertEqual("if_not_zero", condition_node["label"])
+
+        written, rewritten = io.StringIO(), io.StringIO()
+        pipeline.graph().write_dot(written)
+        loaded.write_dot(rewritten)
+        self.assertEqual(written.getvalue(), rewritten.getvalue())
+
+    def test_json_topology_unsupported_version(self):
+        with self.assertRaises(ValueError):
+            GloeGraph.from_dict({**self.foo.graph().to_dict(), "version": 99})
 
     def test_export_no_errors(self):
         with tempfile.NamedTemporaryFile(suffix=".dot", delete=False) as temp:
@@ -5,8 +5,9 @@ from gloe._gloe_graph import GloeGraph
 from gloe.collection import Map
 from gloe.utils import forward
 
-from tests.lib.conditioners import if_is_even
+from tests.lib.conditioners import async_if_not_zero, if_is_even
 from tests.lib.transformers import (
+    async_plus1,
     identity,
     square,
     square_root,
@@ -168,7 +169,7 @@ class TestTransformerGraph(unittest.TestCase):
     def test_nested_divergent_case(self):
         @transformer
         def aux_last(data: tuple[tuple[float, float], float]) -> float:
-            ((n1, n2), n3) = data
+            (n1, n2), n3 = data
             return n1 + n2 + n3
 
         divergent = (
@@ -323,6 +324,16 @@ class TestTransformerGraph(unittest.TestCase):
 
         self._assert_nodes_properties(nodes_properties, graph)
 
+    def test_else_none_label_case(self):
+        conditionals: list[tuple[BaseTransformer, str]] = [
+            (if_is_even.Then(plus1).ElseNone(), "if_is_even"),
+            (async_if_not_zero.Then(async_plus1).ElseNone(), "async_if_not_zero"),
+        ]
+        for conditional, name in conditionals:
+            graph = conditional.graph()
+            labels = [attrs["label"] for attrs in graph.nodes.values()]
+            self.assertIn(name, labels)
+
     def test_edge_labels_case(self):
         single_edge = plus1 >> square
         graph = single_edge.graph()